@@ -3,8 +3,10 @@ Configuration module for environment variables and application settings.
 Validates all required environment variables on startup.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -13,12 +15,53 @@ class Settings(BaseSettings):
     Uses .env file for local development.
     """
     
-    # Robinhood credentials
-    ROBIN_USER: str
-    ROBIN_PASS: str
+    # Robinhood credentials (optional so offline tools can load settings; startup warns if unset)
+    ROBIN_USER: Optional[str] = None
+    ROBIN_PASS: Optional[str] = None
+    
+    # Persistent instrument URL -> symbol store (None keeps it in memory only)
+    ROBINHOOD_INSTRUMENT_DB_PATH: Optional[str] = ".cache/robinhood_instruments.sqlite3"
+    
+    # Thread pool for blocking robin_stocks calls
+    ROBINHOOD_EXECUTOR_WORKERS: int = 4
+    ROBINHOOD_EXECUTOR_MAX_QUEUE: int = 32
+    ROBINHOOD_CALL_TIMEOUT_SECONDS: float = 30.0
+    
+    # Portfolio snapshot cache (positions/balances and quotes refresh separately)
+    PORTFOLIO_POSITIONS_TTL_SECONDS: float = 30.0
+    PORTFOLIO_QUOTES_TTL_SECONDS: float = 10.0
     
     # Finnhub API
-    FINNHUB_API_KEY: str
+    FINNHUB_API_KEY: Optional[str] = None
+    NEWS_FETCH_CONCURRENCY: int = 8
+    
+    # Finnhub quota (free tier: 60 calls/minute)
+    FINNHUB_CALLS_PER_MINUTE: int = Field(60, gt=0)
+    FINNHUB_BURST: int = Field(10, ge=1)
+    FINNHUB_MAX_RETRIES: int = 3
+    
+    # Server-side news cache (entries are served stale for up to NEWS_CACHE_STALE_SECONDS while refreshing)
+    NEWS_COMPANY_CACHE_TTL_SECONDS: float = 300.0
+    NEWS_GENERAL_CACHE_TTL_SECONDS: float = 120.0
+    NEWS_CACHE_STALE_SECONDS: float = 600.0
+    NEWS_CACHE_MAX_ENTRIES: int = 1000
+    
+    # Local company news store (only articles newer than each symbol's high-water mark are fetched)
+    NEWS_STORE_DB_PATH: str = ".cache/news_articles.sqlite3"
+    NEWS_STORE_RETENTION_DAYS: int = 365
+    
+    # Score near-duplicate (syndicated) stories once: minimum MinHash Jaccard similarity
+    NEWS_DEDUP_ENABLED: bool = True
+    NEWS_DEDUP_THRESHOLD: float = 0.8
+    
+    # Shared Finnhub HTTP client (connection pool, keep-alive, timeouts)
+    NEWS_HTTP_MAX_CONNECTIONS: int = 20
+    NEWS_HTTP_MAX_KEEPALIVE: int = 10
+    NEWS_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    NEWS_HTTP2: bool = False
+    NEWS_HTTP_CONNECT_TIMEOUT: float = 5.0
+    NEWS_HTTP_READ_TIMEOUT: float = 10.0
+    NEWS_HTTP_POOL_TIMEOUT: float = 5.0
     
     # Application settings
     APP_NAME: str = "Finance Insight Dashboard"
@@ -28,6 +71,52 @@ class Settings(BaseSettings):
     # API settings
     API_V1_PREFIX: str = "/api"
     
+    # Latency budget for /api/summary; work still pending after this is skipped (partial response)
+    SUMMARY_DEADLINE_SECONDS: float = 8.0
+    
+    # Background summary precomputation (requests read the latest snapshot).
+    # Opt-in like SENTIMENT_PRELOAD: it logs into Robinhood, calls Finnhub and loads the model at startup
+    SUMMARY_PRECOMPUTE_ENABLED: bool = False
+    SUMMARY_REFRESH_INTERVAL_SECONDS: float = 60.0
+    SUMMARY_REFRESH_JITTER_SECONDS: float = 10.0
+    SUMMARY_REFRESH_MAX_BACKOFF_SECONDS: float = 900.0
+    SUMMARY_SNAPSHOT_MAX_AGE_SECONDS: float = 300.0
+    
+    # Sentiment model settings
+    SENTIMENT_MODEL_NAME: str = "ProsusAI/finbert"
+    SENTIMENT_MODEL_REVISION: str = "main"
+    SENTIMENT_BATCH_SIZE: int = 16
+    # Intra-op threads for inference (default: the library default, usually all cores)
+    SENTIMENT_NUM_THREADS: Optional[int] = None
+    
+    # Load and warm up the model in the background at startup (gates /ready)
+    SENTIMENT_PRELOAD: bool = False
+    SENTIMENT_WARMUP_ITERATIONS: int = 3
+    # A failed warm-up is retried with exponential backoff up to this delay
+    SENTIMENT_WARMUP_RETRY_SECONDS: float = 5.0
+    SENTIMENT_WARMUP_RETRY_MAX_SECONDS: float = 300.0
+    
+    # Inference backend: "pytorch" (eager fp32), "quantized" (dynamic int8) or "onnx"
+    SENTIMENT_BACKEND: Literal["pytorch", "quantized", "onnx"] = "pytorch"
+    SENTIMENT_ONNX_PATH: Optional[str] = None
+    
+    # Sentiment result cache (SENTIMENT_CACHE_DB_PATH enables the on-disk tier)
+    SENTIMENT_CACHE_MAX_ENTRIES: int = 10000
+    SENTIMENT_CACHE_TTL_SECONDS: Optional[float] = 7 * 24 * 3600
+    SENTIMENT_CACHE_DB_PATH: Optional[str] = None
+    
+    # Sentiment micro-batching (POST /api/sentiment/analyze)
+    SENTIMENT_BATCH_MAX_WAIT_MS: float = 5.0
+    SENTIMENT_BATCH_MAX_SIZE: int = 32
+    SENTIMENT_QUEUE_MAX_DEPTH: int = 1000
+    SENTIMENT_BULK_MAX_ITEMS: int = 1000
+    # Streaming bulk bodies are spooled to a temp file past SENTIMENT_BULK_SPOOL_MEMORY_BYTES
+    SENTIMENT_BULK_STREAM_MAX_BYTES: int = 256 * 1024 * 1024
+    SENTIMENT_BULK_SPOOL_MEMORY_BYTES: int = 1024 * 1024
+    
+    # Per-symbol sentiment aggregates: half-life of an article's weight in the decayed score
+    SENTIMENT_DECAY_HALF_LIFE_HOURS: float = 24.0
+    
     # CORS settings
     ALLOWED_ORIGINS: list[str] = [
         "http://localhost:3000",
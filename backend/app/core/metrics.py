@@ -0,0 +1,176 @@
+"""
+Lightweight in-process metrics registry.
+Collects counters, gauges and timings that services report and exposes them via /metrics.
+"""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Metrics:
+    """Thread-safe registry of counters, gauges and timing summaries"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add (default: 1)
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a duration sample.
+
+        Args:
+            name: Timing name
+            seconds: Observed duration in seconds
+        """
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+            timing["last"] = seconds
+
+    def register_collector(self, name: str, collector: Callable[[], dict[str, Any]]) -> None:
+        """
+        Register a callable whose output is included in every snapshot.
+        Used for stats that are cheaper to read on demand than to push.
+
+        Args:
+            name: Key under "collected" in the snapshot
+            collector: Function returning a dict of values
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get a copy of all recorded metrics.
+
+        Returns:
+            dict: Counters, gauges, timings (with averages) and collected stats
+        """
+        with self._lock:
+            collectors = dict(self._collectors)
+
+        collected = {}
+        for name, collector in collectors.items():
+            try:
+                collected[name] = collector()
+            except Exception as e:
+                collected[name] = {"error": str(e)}
+
+        with self._lock:
+            timings = {}
+            for name, timing in self._timings.items():
+                timings[name] = {
+                    **timing,
+                    "avg": timing["total"] / timing["count"] if timing["count"] else 0.0
+                }
+
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": timings,
+                "collected": collected
+            }
+
+
+class StageTimer:
+    """
+    Wall-clock timings for the stages of one request.
+    Stages may overlap; each is also reported to the metrics registry.
+    """
+
+    def __init__(self, prefix: str, registry: Optional[Metrics] = None):
+        """
+        Args:
+            prefix: Metrics name prefix (stages are recorded as "<prefix>.<stage>")
+            registry: Metrics registry to report to (default: global registry)
+        """
+        self.prefix = prefix
+        self.registry = registry or metrics
+        self.created = time.perf_counter()
+        self._started: dict[str, float] = {}
+        self.durations: dict[str, float] = {}
+
+    def start(self, stage: str) -> None:
+        """Mark the start of a stage (ignored if it already started)"""
+        self._started.setdefault(stage, time.perf_counter())
+
+    def stop(self, stage: str) -> None:
+        """Mark the end of a started stage and record its duration"""
+        started = self._started.get(stage)
+        if started is None or stage in self.durations:
+            return
+
+        elapsed = time.perf_counter() - started
+        self.durations[stage] = elapsed
+        self.registry.observe(f"{self.prefix}.{stage}", elapsed)
+
+    async def measure(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """
+        Await something and record it as a stage.
+
+        Args:
+            stage: Stage name
+            awaitable: Work to time
+
+        Returns:
+            Result of the awaitable
+        """
+        self.start(stage)
+        try:
+            return await awaitable
+        finally:
+            self.stop(stage)
+
+    def finish(self) -> None:
+        """Record the "total" stage measured from creation"""
+        self._started.setdefault("total", self.created)
+        self.stop("total")
+
+    def server_timing(self) -> str:
+        """
+        Format recorded stages as a Server-Timing header value.
+
+        Returns:
+            str: e.g. "positions;dur=120.5, news;dur=310.2"
+        """
+        return ", ".join(
+            f"{stage};dur={elapsed * 1000:.1f}"
+            for stage, elapsed in self.durations.items()
+        )
+
+
+# Global metrics registry
+metrics = Metrics()
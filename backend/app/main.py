@@ -3,14 +3,39 @@ FastAPI application main entry point.
 Configures the application, routers, middleware, and startup/shutdown events.
 """
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import get_settings
 from app.core.logger import logger
+from app.core.metrics import metrics
 from app.routers import portfolio, news, sentiment, summary
 
 
+async def _warm_up_sentiment_model(iterations: int) -> None:
+    """
+    Warm up the sentiment model, retrying failures with exponential backoff
+    until it succeeds or a request has lazily loaded the model.
+    
+    Args:
+        iterations: Number of warm-up forward passes
+    """
+    from app.services.sentiment_batcher import sentiment_batcher
+    from app.services.sentiment_service import sentiment_service
+    settings = get_settings()
+    delay = settings.SENTIMENT_WARMUP_RETRY_SECONDS
+    
+    while not sentiment_service.ready:
+        try:
+            await sentiment_batcher.warm_up(iterations)
+        except Exception as e:
+            logger.error(f"FinBERT warm-up failed, retrying in {delay:.1f}s: {str(e)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.SENTIMENT_WARMUP_RETRY_MAX_SECONDS)
+
+
 # Lifespan context manager for startup/shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,10 +61,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Environment validation failed: {str(e)}")
     
-    # Pre-load sentiment model (optional - can be lazy loaded)
-    # from app.services.sentiment_service import sentiment_service
-    # logger.info("Pre-loading FinBERT model...")
-    # sentiment_service.load_model()
+    # Open shared Finnhub HTTP client
+    from app.services.news_service import news_service
+    await news_service.start()
+    
+    # Pre-load and warm up sentiment model in the background (optional - can be lazy loaded)
+    app.state.warmup_task = None
+    if settings.SENTIMENT_PRELOAD:
+        logger.info("Pre-loading FinBERT model in the background...")
+        app.state.warmup_task = asyncio.create_task(
+            _warm_up_sentiment_model(settings.SENTIMENT_WARMUP_ITERATIONS)
+        )
+    
+    # Precompute summary snapshots in the background
+    if settings.SUMMARY_PRECOMPUTE_ENABLED:
+        from app.services.summary_scheduler import summary_scheduler
+        summary_scheduler.start()
     
     logger.info("Application startup complete")
     
@@ -48,9 +85,35 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     
-    # Cleanup Robinhood session
+    # Stop summary precomputation before the services it uses
+    try:
+        from app.services.summary_scheduler import summary_scheduler
+        await summary_scheduler.stop()
+    except Exception as e:
+        logger.error(f"Error stopping summary scheduler: {str(e)}")
+    
+    # Stop retrying a failed model warm-up
+    if app.state.warmup_task and not app.state.warmup_task.done():
+        app.state.warmup_task.cancel()
+    
+    # Stop sentiment batching worker
+    try:
+        from app.services.sentiment_batcher import sentiment_batcher
+        await sentiment_batcher.stop()
+    except Exception as e:
+        logger.error(f"Error stopping sentiment batcher: {str(e)}")
+    
+    # Close shared Finnhub HTTP client
+    try:
+        await news_service.close()
+    except Exception as e:
+        logger.error(f"Error closing Finnhub HTTP client: {str(e)}")
+    
+    # Cleanup Robinhood session and executor
     try:
         from app.services.robinhood_service import robinhood_service
+        from app.services.async_robinhood_service import async_robinhood_service
+        async_robinhood_service.shutdown()
         robinhood_service.logout()
     except Exception as e:
         logger.error(f"Error during Robinhood logout: {str(e)}")
@@ -126,6 +189,42 @@ async def health_check():
     }
 
 
+# Readiness probe endpoint
+@app.get("/ready", tags=["health"])
+async def readiness_check():
+    """
+    Readiness probe endpoint.
+    Reports not-ready (503) until the background model warm-up (or the first
+    request's lazy load) has finished when SENTIMENT_PRELOAD is enabled, with
+    the last warm-up error while retries are pending.
+    
+    Returns:
+        dict: Application readiness status
+    """
+    if settings.SENTIMENT_PRELOAD:
+        from app.services.sentiment_service import sentiment_service
+        if not sentiment_service.ready:
+            content = {"status": "not ready", "reason": "sentiment model warming up"}
+            if sentiment_service.warmup_error:
+                content["reason"] = "sentiment model warm-up failed, retrying"
+                content["error"] = sentiment_service.warmup_error
+            return JSONResponse(status_code=503, content=content)
+    
+    return {"status": "ready"}
+
+
+# Metrics endpoint
+@app.get("/metrics", tags=["health"])
+async def get_metrics():
+    """
+    In-process metrics endpoint.
+    
+    Returns:
+        dict: Counters, gauges and timings reported by services
+    """
+    return metrics.snapshot()
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -0,0 +1,162 @@
+"""
+Pydantic models for API requests and responses.
+Defines the data structures shared by routers and services.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Literal
+from datetime import datetime
+from app.core.config import get_settings
+
+
+class Holding(BaseModel):
+    """Individual stock holding in the portfolio"""
+    symbol: str = Field(..., description="Stock ticker symbol")
+    quantity: float = Field(..., description="Number of shares owned")
+    average_price: float = Field(..., description="Average cost per share")
+    current_price: float = Field(..., description="Current market price per share")
+    equity: float = Field(..., description="Total value of this holding")
+    percent_change: float = Field(..., description="Percentage change from purchase price")
+
+
+class PortfolioResponse(BaseModel):
+    """Complete portfolio response"""
+    total_equity: float = Field(..., description="Total portfolio value")
+    cash_balance: float = Field(..., description="Available cash balance")
+    holdings: list[Holding] = Field(default_factory=list, description="Stock holdings")
+
+
+class NewsArticle(BaseModel):
+    """Individual news article"""
+    symbol: Optional[str] = Field(None, description="Related stock symbol")
+    title: str = Field(..., description="Article headline")
+    summary: str = Field(..., description="Article summary")
+    source: str = Field(..., description="News source")
+    url: str = Field(..., description="Full article URL")
+    published_at: datetime = Field(..., description="Publication timestamp")
+
+
+class NewsResponse(BaseModel):
+    """Collection of news articles"""
+    articles: list[NewsArticle] = Field(default_factory=list, description="News articles")
+    count: int = Field(..., description="Total number of articles returned")
+
+
+class SentimentRequest(BaseModel):
+    """Request body for sentiment analysis"""
+    text: str = Field(..., min_length=1, description="Text to analyze")
+
+
+class SentimentResult(BaseModel):
+    """Sentiment analysis result"""
+    sentiment: Literal["positive", "neutral", "negative"] = Field(..., description="Sentiment category")
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0-1)")
+    fallback: bool = Field(False, exclude=True, description="Placeholder returned because inference failed (never persisted)")
+
+
+class SentimentResponse(BaseModel):
+    """Response from sentiment analysis endpoint"""
+    text: str = Field(..., description="Original text that was analyzed")
+    result: SentimentResult = Field(..., description="Sentiment analysis result")
+
+
+class BulkSentimentItem(BaseModel):
+    """One text in a bulk sentiment request"""
+    id: Optional[str] = Field(None, description="Client identifier echoed back in the result")
+    text: str = Field(..., min_length=1, description="Text to analyze")
+
+
+class BulkSentimentRequest(BaseModel):
+    """Request body for bulk sentiment analysis"""
+    items: list[BulkSentimentItem] = Field(
+        ...,
+        min_length=1,
+        max_length=get_settings().SENTIMENT_BULK_MAX_ITEMS,
+        description="Texts to analyze (at most SENTIMENT_BULK_MAX_ITEMS; use /analyze/bulk/stream for more)"
+    )
+    @field_validator("items", mode="before")
+    @classmethod
+    def check_item_count(cls, items):
+        """Reject oversized requests before validating every item"""
+        max_items = get_settings().SENTIMENT_BULK_MAX_ITEMS
+        if isinstance(items, list) and len(items) > max_items:
+            raise ValueError(f"Too many items ({len(items)}); maximum is {max_items}, use /analyze/bulk/stream")
+        return items
+
+
+class BulkSentimentResult(BaseModel):
+    """Sentiment result for one bulk item"""
+    index: int = Field(..., description="Position of the item in the request")
+    id: Optional[str] = Field(None, description="Client identifier from the request")
+    sentiment: Literal["positive", "neutral", "negative"] = Field(..., description="Sentiment category")
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0-1)")
+
+
+class BulkSentimentResponse(BaseModel):
+    """Response from bulk sentiment analysis endpoint"""
+    results: list[BulkSentimentResult] = Field(default_factory=list, description="Results in request order")
+    count: int = Field(..., description="Number of results")
+
+
+class NewsWithSentiment(NewsArticle):
+    """News article with sentiment analysis"""
+    sentiment: Literal["positive", "neutral", "negative"] = Field(..., description="Sentiment category")
+    confidence: float = Field(..., ge=0.0, le=1.0, description="Sentiment confidence score")
+
+
+class StoredArticle(NewsArticle):
+    """News article from the local article store, with sentiment once scored"""
+    # Allow the model_version field name (pydantic reserves the model_ prefix)
+    model_config = ConfigDict(protected_namespaces=())
+    sentiment: Optional[Literal["positive", "neutral", "negative"]] = Field(None, description="Sentiment category")
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="Sentiment confidence score")
+    model_version: Optional[str] = Field(None, description="Sentiment model that scored the article")
+
+
+class ArticlePage(BaseModel):
+    """One page of stored articles"""
+    articles: list[StoredArticle] = Field(default_factory=list, description="Articles, newest first")
+    count: int = Field(..., description="Number of articles in this page")
+    total: int = Field(..., description="Total number of matching articles")
+    limit: int = Field(..., description="Page size")
+    offset: int = Field(..., description="Number of articles skipped")
+
+
+class SentimentWindow(BaseModel):
+    """Sentiment totals for one symbol over one rolling window"""
+    count: int = Field(0, description="Scored articles in the window")
+    positive: int = Field(0, description="Positive articles")
+    negative: int = Field(0, description="Negative articles")
+    neutral: int = Field(0, description="Neutral articles")
+    score: Optional[float] = Field(None, ge=-1.0, le=1.0, description="Confidence-weighted score (-1 to 1)")
+
+
+class SymbolSentiment(BaseModel):
+    """Aggregated news sentiment for one symbol"""
+    symbol: str = Field(..., description="Stock ticker symbol")
+    windows: dict[str, SentimentWindow] = Field(..., description="Totals per rolling window (1d, 7d, 30d)")
+    decayed_score: Optional[float] = Field(None, ge=-1.0, le=1.0, description="Exponentially time-decayed score (-1 to 1)")
+    last_published_at: Optional[datetime] = Field(None, description="Newest scored article")
+
+
+class SymbolSentimentResponse(BaseModel):
+    """Aggregated sentiment for several symbols"""
+    symbols: list[SymbolSentiment] = Field(default_factory=list, description="Per-symbol aggregates")
+    count: int = Field(..., description="Number of symbols returned")
+
+
+class SummaryResponse(BaseModel):
+    """Combined portfolio and news with sentiment"""
+    portfolio: PortfolioResponse = Field(..., description="Portfolio information")
+    news: list[NewsWithSentiment] = Field(default_factory=list, description="News with sentiment")
+    partial: bool = Field(False, description="True if the latency budget ran out or some symbols' news could not be fetched or scored")
+    skipped_symbols: list[str] = Field(default_factory=list, description="Symbols whose news was left out of a partial response")
+    snapshot_version: Optional[int] = Field(None, description="Precomputed snapshot version (None if built for this request)")
+    generated_at: Optional[datetime] = Field(None, description="When the precomputed snapshot was built")
+    age_seconds: Optional[float] = Field(None, description="Age of the precomputed snapshot in seconds")
+
+
+class ErrorResponse(BaseModel):
+    """API error response"""
+    error: str = Field(..., description="Error message")
+    detail: Optional[str] = Field(None, description="Detailed error information")
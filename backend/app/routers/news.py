@@ -3,9 +3,10 @@ News router - Finnhub news endpoints.
 Provides access to company-specific and general market news.
 """
 
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
-from app.models.schemas import NewsResponse
+from typing import Literal, Optional
+from app.models.schemas import ArticlePage, NewsResponse
 from app.services.news_service import NewsService, get_news_service
 from app.core.logger import logger
 
@@ -98,6 +99,115 @@ async def get_news(
         )
 
 
+@router.get(
+    "/history",
+    response_model=ArticlePage,
+    summary="Get stored news history",
+    description="Pages through company news already stored locally, with sentiment where scored. Never calls Finnhub.",
+    responses={
+        200: {
+            "description": "Stored articles retrieved successfully",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "articles": [
+                            {
+                                "symbol": "AAPL",
+                                "title": "Apple Announces New Product Line",
+                                "summary": "Apple Inc. revealed its latest innovations in a special event...",
+                                "source": "Bloomberg",
+                                "url": "https://example.com/article",
+                                "published_at": "2025-10-15T10:30:00Z",
+                                "sentiment": "positive",
+                                "confidence": 0.92,
+                                "model_version": "ProsusAI/finbert@main/pytorch"
+                            }
+                        ],
+                        "count": 1,
+                        "total": 120,
+                        "limit": 50,
+                        "offset": 0
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_news_history(
+    symbols: str = Query(
+        ...,
+        description="Comma-separated list of stock symbols (e.g., AAPL,TSLA,MSFT)",
+        example="AAPL,TSLA"
+    ),
+    from_date: Optional[str] = Query(
+        None,
+        description="Start date in YYYY-MM-DD format",
+        example="2025-09-15"
+    ),
+    to_date: Optional[str] = Query(
+        None,
+        description="End date in YYYY-MM-DD format",
+        example="2025-10-15"
+    ),
+    sentiment: Optional[Literal["positive", "neutral", "negative"]] = Query(
+        None,
+        description="Only articles with this sentiment"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of articles to skip"),
+    service: NewsService = Depends(get_news_service)
+) -> ArticlePage:
+    """
+    Get stored news articles for specified stock symbols, newest first.
+    
+    Args:
+        symbols: Comma-separated stock ticker symbols
+        from_date: Optional start date (YYYY-MM-DD)
+        to_date: Optional end date (YYYY-MM-DD)
+        sentiment: Optional sentiment filter
+        limit: Page size
+        offset: Number of articles to skip
+        
+    Returns:
+        ArticlePage: Page of stored articles
+    """
+    try:
+        logger.info(f"News history endpoint called with symbols: {symbols}")
+        
+        symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+        
+        if not symbol_list:
+            raise HTTPException(status_code=400, detail="No symbols provided")
+        
+        for value in (from_date, to_date):
+            if value:
+                try:
+                    datetime.strptime(value, "%Y-%m-%d")
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid date '{value}'; expected YYYY-MM-DD"
+                    )
+        
+        return await service.get_stored_news(
+            symbols=symbol_list,
+            from_date=from_date,
+            to_date=to_date,
+            sentiment=sentiment,
+            limit=limit,
+            offset=offset
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in news history endpoint: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve news history: {str(e)}"
+        )
+
+
 @router.get(
     "/general",
     response_model=NewsResponse,
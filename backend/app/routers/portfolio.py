@@ -3,9 +3,15 @@ Portfolio router - Robinhood portfolio endpoints.
 Provides access to user's holdings, cash balance, and portfolio value.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.models.schemas import PortfolioResponse, ErrorResponse
-from app.services.robinhood_service import RobinhoodService, get_robinhood_service
+from app.services.async_robinhood_service import (
+    AsyncRobinhoodService,
+    RobinhoodBusyError,
+    get_async_robinhood_service
+)
+from app.services.summary_scheduler import SummaryScheduler, get_summary_scheduler
 from app.core.logger import logger
 
 
@@ -48,11 +54,13 @@ router = APIRouter(prefix="/portfolio", tags=["portfolio"])
             }
         },
         401: {"description": "Authentication failed"},
-        500: {"description": "Internal server error"}
+        500: {"description": "Internal server error"},
+        503: {"description": "Too many Robinhood requests queued"},
+        504: {"description": "Robinhood request timed out"}
     }
 )
 async def get_portfolio(
-    service: RobinhoodService = Depends(get_robinhood_service)
+    service: AsyncRobinhoodService = Depends(get_async_robinhood_service)
 ) -> PortfolioResponse:
     """
     Get complete portfolio information from Robinhood.
@@ -62,9 +70,13 @@ async def get_portfolio(
     """
     try:
         logger.info("Portfolio endpoint called")
-        portfolio = service.get_portfolio()
+        portfolio = await service.get_portfolio()
         return portfolio
         
+    except RobinhoodBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Robinhood request timed out")
     except Exception as e:
         logger.error(f"Error in portfolio endpoint: {str(e)}")
         raise HTTPException(
@@ -90,7 +102,7 @@ async def get_portfolio(
     }
 )
 async def get_portfolio_symbols(
-    service: RobinhoodService = Depends(get_robinhood_service)
+    service: AsyncRobinhoodService = Depends(get_async_robinhood_service)
 ) -> list[str]:
     """
     Get list of stock symbols in the portfolio.
@@ -100,12 +112,57 @@ async def get_portfolio_symbols(
     """
     try:
         logger.info("Portfolio symbols endpoint called")
-        symbols = service.get_portfolio_symbols()
+        symbols = await service.get_portfolio_symbols()
         return symbols
         
+    except RobinhoodBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Robinhood request timed out")
     except Exception as e:
         logger.error(f"Error in portfolio symbols endpoint: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve portfolio symbols: {str(e)}"
         )
+
+
+@router.post(
+    "/cache/invalidate",
+    summary="Invalidate portfolio cache",
+    description="Drops the cached portfolio snapshot and the precomputed summary so the next request refetches from Robinhood.",
+    responses={
+        200: {
+            "description": "Cache invalidated",
+            "content": {
+                "application/json": {
+                    "example": {"invalidated": "all"}
+                }
+            }
+        }
+    }
+)
+async def invalidate_portfolio_cache(
+    quotes_only: bool = Query(
+        False,
+        description="Only drop cached quotes, keep positions and balances"
+    ),
+    service: AsyncRobinhoodService = Depends(get_async_robinhood_service),
+    summary_scheduler: SummaryScheduler = Depends(get_summary_scheduler)
+) -> dict:
+    """
+    Invalidate the cached portfolio snapshot.
+    
+    The precomputed summary snapshot is dropped as well (its holdings and
+    prices came from the invalidated data) and rebuilt in the background.
+    
+    Args:
+        quotes_only: Only drop cached quotes
+        
+    Returns:
+        dict: What was invalidated
+    """
+    logger.info("Portfolio cache invalidation endpoint called")
+    service.invalidate(quotes_only=quotes_only)
+    summary_scheduler.invalidate()
+    return {"invalidated": "quotes" if quotes_only else "all"}
@@ -3,13 +3,36 @@ Sentiment router - FinBERT sentiment analysis endpoints.
 Provides sentiment analysis for financial text using the FinBERT model.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from app.models.schemas import SentimentRequest, SentimentResponse
-from app.services.sentiment_service import SentimentService, get_sentiment_service
+import asyncio
+import json
+import tempfile
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import IO, AsyncIterator, Optional
+from app.core.config import get_settings
+from app.models.schemas import (
+    BulkSentimentItem,
+    BulkSentimentRequest,
+    BulkSentimentResponse,
+    BulkSentimentResult,
+    SentimentRequest,
+    SentimentResponse,
+    SymbolSentimentResponse
+)
+from app.services.sentiment_aggregates import SentimentAggregator, get_sentiment_aggregates
+from app.services.sentiment_batcher import (
+    SentimentBatcher,
+    QueueFullError,
+    get_sentiment_batcher
+)
 from app.core.logger import logger
 
 
 router = APIRouter(prefix="/sentiment", tags=["sentiment"])
+settings = get_settings()
+
+# Bytes of spooled NDJSON read per worker-thread hop in the bulk stream
+_STREAM_READ_BYTES = 64 * 1024
 
 
 @router.post(
@@ -31,12 +54,13 @@ router = APIRouter(prefix="/sentiment", tags=["sentiment"])
                     }
                 }
             }
-        }
+        },
+        503: {"description": "Sentiment queue is full"}
     }
 )
 async def analyze_sentiment(
     request: SentimentRequest,
-    service: SentimentService = Depends(get_sentiment_service)
+    batcher: SentimentBatcher = Depends(get_sentiment_batcher)
 ) -> SentimentResponse:
     """
     Analyze sentiment of provided text.
@@ -64,17 +88,278 @@ async def analyze_sentiment(
     try:
         logger.info("Sentiment analysis endpoint called")
         
-        # Analyze sentiment
-        result = service.analyze_sentiment(request.text)
+        # Analyze sentiment (batched with concurrent requests)
+        result = await batcher.analyze(request.text)
         
         return SentimentResponse(
             text=request.text,
             result=result
         )
         
+    except QueueFullError as e:
+        logger.warning(f"Sentiment analysis rejected: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"Error in sentiment analysis endpoint: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to analyze sentiment: {str(e)}"
         )
+
+
+@router.post(
+    "/analyze/bulk",
+    response_model=BulkSentimentResponse,
+    summary="Analyze sentiment of many texts",
+    description="Analyzes up to SENTIMENT_BULK_MAX_ITEMS texts in one request using batched FinBERT inference. Results are returned in input order.",
+    responses={
+        200: {
+            "description": "Bulk sentiment analysis completed successfully",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "results": [
+                            {"index": 0, "id": "a1", "sentiment": "positive", "confidence": 0.92},
+                            {"index": 1, "id": "a2", "sentiment": "negative", "confidence": 0.81}
+                        ],
+                        "count": 2
+                    }
+                }
+            }
+        },
+        422: {"description": "Empty request or more than SENTIMENT_BULK_MAX_ITEMS items"}
+    }
+)
+async def analyze_sentiment_bulk(
+    request: BulkSentimentRequest,
+    batcher: SentimentBatcher = Depends(get_sentiment_batcher)
+) -> BulkSentimentResponse:
+    """
+    Analyze sentiment of many texts in one request.
+    
+    Args:
+        request: BulkSentimentRequest with items (optional client id and text)
+        
+    Returns:
+        BulkSentimentResponse: One result per item, in input order
+        
+    Example request body:
+        {
+            "items": [
+                {"id": "a1", "text": "Apple beats earnings expectations."},
+                {"id": "a2", "text": "Tesla recalls vehicles over steering issue."}
+            ]
+        }
+    """
+    try:
+        logger.info(f"Bulk sentiment endpoint called with {len(request.items)} items")
+        
+        results = await batcher.analyze_many([item.text for item in request.items])
+        
+        return BulkSentimentResponse(
+            results=[
+                BulkSentimentResult(
+                    index=index,
+                    id=item.id,
+                    sentiment=result.sentiment,
+                    confidence=result.confidence
+                )
+                for index, (item, result) in enumerate(zip(request.items, results))
+            ],
+            count=len(results)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error in bulk sentiment endpoint: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to analyze sentiment: {str(e)}"
+        )
+
+
+async def _bulk_stream_results(
+    body: IO[bytes],
+    batcher: SentimentBatcher
+) -> AsyncIterator[str]:
+    """
+    Parse NDJSON items lazily from the spooled request body and emit NDJSON
+    results one model batch at a time, so results start flowing before the
+    whole input has been scored. The spool may have rolled over to disk, so
+    lines are read in blocks on a worker thread. Closes the spool when done.
+    """
+    chunk: list[tuple[int, Optional[str], str]] = []
+    
+    async def score(items: list[tuple[int, Optional[str], str]]) -> str:
+        results = await batcher.analyze_many([text for _, _, text in items])
+        return "".join(
+            json.dumps({
+                "index": index,
+                "id": item_id,
+                "sentiment": result.sentiment,
+                "confidence": result.confidence
+            }) + "\n"
+            for (index, item_id, _), result in zip(items, results)
+        )
+    
+    try:
+        index = 0
+        while True:
+            lines = await asyncio.to_thread(body.readlines, _STREAM_READ_BYTES)
+            if not lines:
+                break
+            
+            for line in lines:
+                if not line.strip():
+                    continue
+                
+                try:
+                    item = BulkSentimentItem.model_validate_json(line)
+                    chunk.append((index, item.id, item.text))
+                except Exception as e:
+                    # Flush earlier items first so records stay in input order
+                    if chunk:
+                        yield await score(chunk)
+                        chunk = []
+                    yield json.dumps({"index": index, "error": f"Invalid item: {str(e)}"}) + "\n"
+                index += 1
+                
+                if len(chunk) >= batcher.max_batch:
+                    yield await score(chunk)
+                    chunk = []
+        
+        if chunk:
+            yield await score(chunk)
+        
+    except Exception as e:
+        logger.error(f"Error in bulk sentiment stream: {str(e)}")
+        yield json.dumps({"error": f"Failed to analyze sentiment: {str(e)}"}) + "\n"
+    finally:
+        body.close()
+
+
+@router.post(
+    "/analyze/bulk/stream",
+    summary="Stream sentiment analysis of a large NDJSON input",
+    description="Accepts an NDJSON body (one {\"id\": ..., \"text\": ...} object per line) with no item limit (up to SENTIMENT_BULK_STREAM_MAX_BYTES) and streams NDJSON results back as each batch is scored.",
+    responses={
+        200: {
+            "description": "NDJSON results, one per input line, in input order",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"index": 0, "id": "a1", "sentiment": "positive", "confidence": 0.92}\n'
+                }
+            }
+        },
+        413: {"description": "Request body larger than SENTIMENT_BULK_STREAM_MAX_BYTES"}
+    }
+)
+async def analyze_sentiment_bulk_stream(
+    request: Request,
+    batcher: SentimentBatcher = Depends(get_sentiment_batcher)
+) -> StreamingResponse:
+    """
+    Stream sentiment analysis for a large NDJSON input.
+    
+    Input lines are scored in batches of SENTIMENT_BATCH_MAX_SIZE and results
+    are written as soon as each batch is done. Invalid lines produce an
+    {"index": ..., "error": ...} record instead of failing the stream.
+    
+    Returns:
+        StreamingResponse: NDJSON results
+        
+    Raises:
+        HTTPException: 413 if the body exceeds SENTIMENT_BULK_STREAM_MAX_BYTES
+    """
+    logger.info("Bulk sentiment stream endpoint called")
+    
+    max_bytes = settings.SENTIMENT_BULK_STREAM_MAX_BYTES
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Request body too large; maximum is {max_bytes} bytes"
+    )
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+    
+    # The body is read up front: StreamingResponse also listens on the ASGI
+    # receive channel for disconnects once it starts sending. It is spooled
+    # to a temp file so large inputs don't stay in memory.
+    body = tempfile.SpooledTemporaryFile(max_size=settings.SENTIMENT_BULK_SPOOL_MEMORY_BYTES)
+    size = 0
+    async for data in request.stream():
+        size += len(data)
+        if size > max_bytes:
+            body.close()
+            raise too_large
+        await asyncio.to_thread(body.write, data)
+    body.seek(0)
+    
+    return StreamingResponse(
+        _bulk_stream_results(body, batcher),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get(
+    "/symbols",
+    response_model=SymbolSentimentResponse,
+    summary="Get aggregated sentiment per symbol",
+    description="Returns rolling 1d/7d/30d label counts, confidence-weighted scores and a time-decayed score per symbol, maintained incrementally as news is scored.",
+    responses={
+        200: {
+            "description": "Aggregates retrieved successfully",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "symbols": [
+                            {
+                                "symbol": "AAPL",
+                                "windows": {
+                                    "1d": {"count": 3, "positive": 2, "negative": 0, "neutral": 1, "score": 0.61},
+                                    "7d": {"count": 12, "positive": 6, "negative": 3, "neutral": 3, "score": 0.24},
+                                    "30d": {"count": 40, "positive": 18, "negative": 12, "neutral": 10, "score": 0.13}
+                                },
+                                "decayed_score": 0.42,
+                                "last_published_at": "2025-10-15T10:30:00Z"
+                            }
+                        ],
+                        "count": 1
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_symbol_sentiment(
+    symbols: Optional[str] = Query(
+        None,
+        description="Comma-separated list of stock symbols (default: all tracked symbols)",
+        example="AAPL,TSLA"
+    ),
+    aggregates: SentimentAggregator = Depends(get_sentiment_aggregates)
+) -> SymbolSentimentResponse:
+    """
+    Get aggregated news sentiment per symbol.
+    
+    Args:
+        symbols: Optional comma-separated stock ticker symbols
+        
+    Returns:
+        SymbolSentimentResponse: Per-symbol aggregates
+    """
+    try:
+        logger.info(f"Symbol sentiment endpoint called with symbols: {symbols}")
+        
+        symbol_list = None
+        if symbols:
+            symbol_list = [s.strip().upper() for s in symbols.split(",") if s.strip()]
+        
+        results = aggregates.snapshot(symbol_list)
+        return SymbolSentimentResponse(symbols=results, count=len(results))
+        
+    except Exception as e:
+        logger.error(f"Error in symbol sentiment endpoint: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve symbol sentiment: {str(e)}"
+        )
@@ -3,15 +3,28 @@ Summary router - Combined portfolio and news with sentiment.
 Provides a unified endpoint that combines portfolio data with sentiment-analyzed news.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from app.models.schemas import SummaryResponse, NewsWithSentiment
-from app.services.robinhood_service import RobinhoodService, get_robinhood_service
+import asyncio
+import json
+from typing import Any, AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from app.models.schemas import ArticlePage, SummaryResponse, NewsWithSentiment
+from app.services.async_robinhood_service import AsyncRobinhoodService, get_async_robinhood_service
 from app.services.news_service import NewsService, get_news_service
-from app.services.sentiment_service import SentimentService, get_sentiment_service
+from app.services.summary_scheduler import SummaryScheduler, get_summary_scheduler
+from app.services.summary_service import (
+    SummaryService,
+    EVENT_PORTFOLIO,
+    EVENT_PARTIAL,
+    get_summary_service
+)
+from app.core.config import get_settings
 from app.core.logger import logger
+from app.core.metrics import StageTimer
 
 
 router = APIRouter(prefix="/summary", tags=["summary"])
+settings = get_settings()
 
 
 @router.get(
@@ -50,7 +63,9 @@ router = APIRouter(prefix="/summary", tags=["summary"])
                                 "sentiment": "positive",
                                 "confidence": 0.92
                             }
-                        ]
+                        ],
+                        "partial": False,
+                        "skipped_symbols": []
                     }
                 }
             }
@@ -58,75 +73,250 @@ router = APIRouter(prefix="/summary", tags=["summary"])
     }
 )
 async def get_summary(
-    robinhood_service: RobinhoodService = Depends(get_robinhood_service),
-    news_service: NewsService = Depends(get_news_service),
-    sentiment_service: SentimentService = Depends(get_sentiment_service)
+    response: Response,
+    deadline: Optional[float] = Query(
+        None,
+        gt=0,
+        description="Latency budget in seconds (default: SUMMARY_DEADLINE_SECONDS)"
+    ),
+    fresh: bool = Query(False, description="Skip the precomputed snapshot and build the summary now"),
+    summary_service: SummaryService = Depends(get_summary_service),
+    summary_scheduler: SummaryScheduler = Depends(get_summary_scheduler)
 ) -> SummaryResponse:
     """
     Get unified summary of portfolio with sentiment-analyzed news.
     
-    This endpoint:
-    1. Fetches your Robinhood portfolio
-    2. Retrieves news for your holdings
-    3. Analyzes sentiment for each news article
+    Serves the latest background snapshot when one is recent enough
+    (see snapshot_version / age_seconds). Otherwise the summary is built
+    now as a pipeline:
+    1. Fetches your Robinhood positions
+    2. Fetches quotes and per-symbol news concurrently
+    3. Scores each symbol's articles as soon as its news arrives
     4. Returns combined data
     
+    Stage timings are reported in the Server-Timing response header.
+    If the latency budget runs out, whatever is ready is returned with
+    partial=true and the symbols whose news was left out.
+    
+    Args:
+        deadline: Latency budget in seconds
+        fresh: Ignore the snapshot and build the summary now
+        
     Returns:
         SummaryResponse: Combined portfolio and news with sentiment
     """
     try:
         logger.info("Summary endpoint called")
         
-        # Step 1: Get portfolio data
-        logger.info("Fetching portfolio data...")
-        portfolio = robinhood_service.get_portfolio()
-        
-        # Step 2: Get symbols from portfolio
-        symbols = [holding.symbol for holding in portfolio.holdings]
+        if not fresh:
+            snapshot = summary_scheduler.latest()
+            if snapshot is not None:
+                return snapshot
         
-        if not symbols:
-            logger.warning("No holdings found in portfolio")
-            return SummaryResponse(portfolio=portfolio, news=[])
-        
-        logger.info(f"Found {len(symbols)} symbols in portfolio: {symbols}")
+        timer = StageTimer("summary")
+        summary = await summary_service.build_summary(
+            timer,
+            deadline or settings.SUMMARY_DEADLINE_SECONDS
+        )
         
-        # Step 3: Fetch news for portfolio symbols
-        logger.info("Fetching news for portfolio symbols...")
-        news_response = await news_service.get_company_news(symbols=symbols)
+        response.headers["Server-Timing"] = timer.server_timing()
+        return summary
         
-        # Step 4: Analyze sentiment for each article
-        logger.info(f"Analyzing sentiment for {len(news_response.articles)} articles...")
-        news_with_sentiment = []
+    except asyncio.TimeoutError:
+        logger.error("Summary deadline reached before the portfolio was loaded")
+        raise HTTPException(
+            status_code=504,
+            detail="Portfolio could not be loaded within the latency budget"
+        )
+    except Exception as e:
+        logger.error(f"Error in summary endpoint: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate summary: {str(e)}"
+        )
+
+
+@router.get(
+    "/news",
+    response_model=ArticlePage,
+    summary="Page through scored news for portfolio holdings",
+    description="Pages through stored, sentiment-scored articles for the symbols currently held. Reads only the local article store.",
+)
+async def get_summary_news(
+    sentiment: Optional[Literal["positive", "neutral", "negative"]] = Query(
+        None,
+        description="Only articles with this sentiment"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of articles to skip"),
+    robinhood_service: AsyncRobinhoodService = Depends(get_async_robinhood_service),
+    news_service: NewsService = Depends(get_news_service)
+) -> ArticlePage:
+    """
+    Get a page of scored news history for the portfolio, newest first.
+    
+    Args:
+        sentiment: Optional sentiment filter
+        limit: Page size
+        offset: Number of articles to skip
         
-        for article in news_response.articles:
-            # Analyze sentiment on title + summary
-            text_to_analyze = f"{article.title}. {article.summary}"
-            sentiment_result = sentiment_service.analyze_sentiment(text_to_analyze)
-            
-            # Create NewsWithSentiment object
-            news_item = NewsWithSentiment(
-                symbol=article.symbol,
-                title=article.title,
-                summary=article.summary,
-                source=article.source,
-                url=article.url,
-                published_at=article.published_at,
-                sentiment=sentiment_result.sentiment,
-                confidence=sentiment_result.confidence
-            )
-            news_with_sentiment.append(news_item)
+    Returns:
+        ArticlePage: Page of stored articles with sentiment
+    """
+    try:
+        logger.info(f"Summary news endpoint called (limit={limit}, offset={offset})")
         
-        logger.info(f"Successfully processed {len(news_with_sentiment)} articles with sentiment")
+        symbols = await robinhood_service.get_portfolio_symbols()
         
-        # Step 5: Return combined response
-        return SummaryResponse(
-            portfolio=portfolio,
-            news=news_with_sentiment
+        return await news_service.get_stored_news(
+            symbols=symbols,
+            sentiment=sentiment,
+            scored_only=True,
+            limit=limit,
+            offset=offset
         )
         
     except Exception as e:
-        logger.error(f"Error in summary endpoint: {str(e)}")
+        logger.error(f"Error in summary news endpoint: {str(e)}")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate summary: {str(e)}"
+            detail=f"Failed to retrieve summary news: {str(e)}"
+        )
+
+
+def _format_record(record_type: str, data: Any, stream_format: str) -> str:
+    """Encode one stream record as an NDJSON line or an SSE event"""
+    if stream_format == "sse":
+        return f"event: {record_type}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"type": record_type, "data": data}) + "\n"
+
+
+async def _summary_records(
+    summary_service: SummaryService,
+    stream_format: str,
+    deadline: float
+) -> AsyncIterator[str]:
+    """
+    Stream the summary pipeline: portfolio first, then articles as they are scored,
+    then a completion record. Failures are sent as an error record since the
+    response status has already been sent.
+    """
+    timer = StageTimer("summary_stream")
+    timer.start("first_byte")
+    pending_news: list[NewsWithSentiment] = []
+    portfolio_sent = False
+    skipped: Optional[list[str]] = None
+    count = 0
+    
+    try:
+        async for kind, payload in summary_service.stream(timer, deadline):
+            if kind == EVENT_PORTFOLIO:
+                yield _format_record("portfolio", payload.model_dump(mode="json"), stream_format)
+                portfolio_sent = True
+                timer.stop("first_byte")
+                
+                # Flush articles that finished before the quotes did
+                for item in pending_news:
+                    yield _format_record("news", item.model_dump(mode="json"), stream_format)
+                count += len(pending_news)
+                pending_news = []
+                continue
+            
+            if kind == EVENT_PARTIAL:
+                skipped = payload
+                continue
+            
+            _, items = payload
+            if not portfolio_sent:
+                pending_news.extend(items)
+                continue
+            
+            for item in items:
+                yield _format_record("news", item.model_dump(mode="json"), stream_format)
+            count += len(items)
+        
+        timer.finish()
+        yield _format_record(
+            "complete",
+            {
+                "count": count,
+                "partial": skipped is not None,
+                "skipped_symbols": skipped or [],
+                "timings_ms": {
+                    stage: round(elapsed * 1000, 1)
+                    for stage, elapsed in timer.durations.items()
+                }
+            },
+            stream_format
+        )
+        
+    except asyncio.TimeoutError:
+        logger.error("Summary stream deadline reached before the portfolio was loaded")
+        yield _format_record(
+            "error",
+            {"detail": "Portfolio could not be loaded within the latency budget"},
+            stream_format
+        )
+    except Exception as e:
+        logger.error(f"Error in summary stream: {str(e)}")
+        yield _format_record(
+            "error",
+            {"detail": f"Failed to generate summary: {str(e)}"},
+            stream_format
         )
+
+
+@router.get(
+    "/stream",
+    summary="Stream portfolio summary with sentiment-analyzed news",
+    description="Streams the portfolio first, then each news article with sentiment as soon as it is scored, then a completion record. Use format=ndjson (default) or format=sse.",
+    responses={
+        200: {
+            "description": "Summary stream",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"type": "portfolio", "data": {...}}\n'
+                               '{"type": "news", "data": {...}}\n'
+                               '{"type": "complete", "data": {"count": 1, "timings_ms": {...}}}\n'
+                },
+                "text/event-stream": {
+                    "example": "event: portfolio\ndata: {...}\n\n"
+                }
+            }
+        }
+    }
+)
+async def stream_summary(
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="Stream encoding"),
+    deadline: Optional[float] = Query(
+        None,
+        gt=0,
+        description="Latency budget in seconds (default: SUMMARY_DEADLINE_SECONDS)"
+    ),
+    summary_service: SummaryService = Depends(get_summary_service)
+) -> StreamingResponse:
+    """
+    Stream unified summary of portfolio with sentiment-analyzed news.
+    
+    Records are sent in this order:
+    1. portfolio - once positions and quotes are loaded
+    2. news - one record per NewsWithSentiment as its symbol is scored
+    3. complete - article count, partial flag, skipped symbols and stage timings
+       (or error on failure)
+    
+    Args:
+        format: "ndjson" (one JSON object per line) or "sse" (Server-Sent Events)
+        deadline: Latency budget in seconds
+        
+    Returns:
+        StreamingResponse: NDJSON or SSE stream
+    """
+    logger.info(f"Summary stream endpoint called (format={format})")
+    
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        _summary_records(summary_service, format, deadline or settings.SUMMARY_DEADLINE_SECONDS),
+        media_type=media_type,
+        # Stop proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
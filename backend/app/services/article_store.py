@@ -0,0 +1,439 @@
+"""
+Persistent store of company news articles and their sentiment.
+Articles live in SQLite (WAL mode) keyed by URL hash, linked to every symbol
+they were fetched for, with sentiment label, confidence and model version.
+Tracks the newest article timestamp seen per symbol (high-water mark) so
+Finnhub only has to be asked for what was published since, and serves
+paginated history without going upstream.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.models.schemas import NewsArticle, SentimentResult, StoredArticle
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    sentiment TEXT,
+    confidence REAL,
+    model_version TEXT
+);
+CREATE TABLE IF NOT EXISTS article_symbols (
+    symbol TEXT NOT NULL,
+    key TEXT NOT NULL,
+    published_at REAL NOT NULL,
+    PRIMARY KEY (symbol, key)
+);
+CREATE TABLE IF NOT EXISTS symbol_state (
+    symbol TEXT PRIMARY KEY,
+    high_water REAL,
+    covered_from TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_article_symbols_published
+    ON article_symbols (symbol, published_at DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles (sentiment);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at);
+"""
+
+
+def article_key(article: NewsArticle) -> str:
+    """
+    Stable identity for an article: hash of its URL (or symbol and title if it has none).
+
+    Args:
+        article: News article
+
+    Returns:
+        str: Hex digest used as the article key
+    """
+    identity = article.url or f"{article.symbol}:{article.title}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def _day_start(date: str) -> float:
+    """Unix timestamp of local midnight for a YYYY-MM-DD date"""
+    return datetime.strptime(date, "%Y-%m-%d").timestamp()
+
+
+class ArticleStore:
+    """SQLite-backed article store with per-symbol high-water marks"""
+
+    def __init__(self, db_path: str = ":memory:", retention_days: int = 365):
+        """
+        Args:
+            db_path: SQLite database file (":memory:" for a process-local store)
+            retention_days: Articles older than this are dropped on merge
+        """
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._high_water: dict[str, float] = {}
+        self._covered_from: dict[str, str] = {}
+
+        try:
+            if db_path != ":memory:":
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            self._db = self._connect(db_path)
+        except Exception as e:
+            logger.error(f"Could not open article store at {db_path}, using memory: {str(e)}")
+            self._db = self._connect(":memory:")
+
+        # Per-symbol fetch state is tiny; keep it in memory and write through
+        for symbol, high_water, covered_from in self._db.execute(
+            "SELECT symbol, high_water, covered_from FROM symbol_state"
+        ):
+            if high_water is not None:
+                self._high_water[symbol] = high_water
+            self._covered_from[symbol] = covered_from
+        logger.info(f"Article store opened at {db_path} ({len(self._covered_from)} symbols)")
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        """Open the database in WAL mode and create the schema"""
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets readers run while a writer appends; NORMAL sync is safe with WAL
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SCHEMA)
+        db.commit()
+        return db
+
+    def high_water_mark(self, symbol: str) -> Optional[float]:
+        """
+        Newest publication time stored for a symbol.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            float: Unix timestamp, or None if nothing is stored
+        """
+        return self._high_water.get(symbol)
+
+    def fetch_window(self, symbol: str, from_date: str, to_date: str) -> Optional[str]:
+        """
+        Work out where an upstream fetch for this range needs to start.
+
+        Args:
+            symbol: Stock ticker symbol
+            from_date: Requested start date (YYYY-MM-DD)
+            to_date: Requested end date (YYYY-MM-DD)
+
+        Returns:
+            str: Start date to fetch from, or None if the store already covers the range
+        """
+        covered_from = self._covered_from.get(symbol)
+        high_water = self._high_water.get(symbol)
+
+        # Never fetched this far back: need the full range
+        if covered_from is None or from_date < covered_from or high_water is None:
+            return from_date
+
+        # Finnhub filters by day, so re-ask for the high-water day and drop what we have
+        delta_from = datetime.fromtimestamp(high_water).strftime("%Y-%m-%d")
+        if delta_from > to_date:
+            return None
+        return max(from_date, delta_from)
+
+    def merge(self, symbol: str, from_date: str, articles: list[NewsArticle]) -> list[NewsArticle]:
+        """
+        Bulk-insert fetched articles, advancing the symbol's high-water mark.
+
+        Args:
+            symbol: Stock ticker symbol
+            from_date: Start date the fetch covered (YYYY-MM-DD)
+            articles: Articles returned upstream
+
+        Returns:
+            list[NewsArticle]: Articles that were not stored for this symbol before
+        """
+        by_key = {article_key(article): article for article in articles}
+        cutoff = time.time() - self.retention_days * 86400
+
+        with self._lock:
+            existing = self._existing_keys(symbol, list(by_key))
+            added = [article for key, article in by_key.items() if key not in existing]
+
+            high_water = self._high_water.get(symbol)
+            for article in added:
+                published = article.published_at.timestamp()
+                if high_water is None or published > high_water:
+                    high_water = published
+
+            covered_from = self._covered_from.get(symbol)
+            if covered_from is None or from_date < covered_from:
+                covered_from = from_date
+
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO articles "
+                        "(key, title, summary, source, url, published_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                article_key(a), a.title, a.summary, a.source, a.url,
+                                a.published_at.timestamp()
+                            )
+                            for a in added
+                        ]
+                    )
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO article_symbols VALUES (?, ?, ?)",
+                        [(symbol, article_key(a), a.published_at.timestamp()) for a in added]
+                    )
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO symbol_state VALUES (?, ?, ?)",
+                        (symbol, high_water, covered_from)
+                    )
+
+                    # Drop this symbol's links past retention, then articles nothing links to
+                    self._db.execute(
+                        "DELETE FROM article_symbols WHERE symbol = ? AND published_at < ?",
+                        (symbol, cutoff)
+                    )
+                    self._db.execute(
+                        "DELETE FROM articles WHERE published_at < ? AND key NOT IN "
+                        "(SELECT key FROM article_symbols)",
+                        (cutoff,)
+                    )
+            except Exception as e:
+                logger.error(f"Error writing article store: {str(e)}")
+                return []
+
+            if high_water is not None:
+                self._high_water[symbol] = high_water
+            self._covered_from[symbol] = covered_from
+
+        metrics.increment("news.store.new_articles", len(added))
+        return added
+
+    def _existing_keys(self, symbol: str, keys: list[str]) -> set[str]:
+        """Keys already linked to a symbol"""
+        if not keys:
+            return set()
+
+        placeholders = ",".join("?" * len(keys))
+        rows = self._db.execute(
+            f"SELECT key FROM article_symbols WHERE symbol = ? AND key IN ({placeholders})",
+            [symbol, *keys]
+        ).fetchall()
+        return {key for key, in rows}
+
+    def get_articles(
+        self,
+        symbol: str,
+        from_date: str,
+        to_date: str,
+        limit: Optional[int] = None
+    ) -> list[NewsArticle]:
+        """
+        Stored articles for a symbol within a date range, newest first.
+
+        Args:
+            symbol: Stock ticker symbol
+            from_date: Start date (YYYY-MM-DD, inclusive)
+            to_date: End date (YYYY-MM-DD, inclusive)
+            limit: Maximum number of articles
+
+        Returns:
+            list[NewsArticle]: Matching articles
+        """
+        articles, _ = self.query(
+            [symbol],
+            from_ts=_day_start(from_date),
+            to_ts=_day_start(to_date) + 86400,
+            limit=limit or -1,
+            with_total=False
+        )
+        return articles
+
+    def query(
+        self,
+        symbols: list[str],
+        sentiment: Optional[str] = None,
+        from_ts: Optional[float] = None,
+        to_ts: Optional[float] = None,
+        scored_only: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+        with_total: bool = True
+    ) -> tuple[list[StoredArticle], int]:
+        """
+        Page through stored articles for some symbols, newest first.
+
+        Args:
+            symbols: Stock ticker symbols
+            sentiment: Only articles with this sentiment label
+            from_ts: Published at or after this Unix timestamp
+            to_ts: Published before this Unix timestamp
+            scored_only: Only articles that have a sentiment
+            limit: Page size (-1 for no limit)
+            offset: Rows to skip
+            with_total: Also count all matching rows
+
+        Returns:
+            tuple: (page of StoredArticle, total matching rows or -1)
+        """
+        if not symbols:
+            return [], 0
+
+        where = [f"s.symbol IN ({','.join('?' * len(symbols))})"]
+        params: list[Any] = list(symbols)
+        if from_ts is not None:
+            where.append("s.published_at >= ?")
+            params.append(from_ts)
+        if to_ts is not None:
+            where.append("s.published_at < ?")
+            params.append(to_ts)
+        if sentiment:
+            where.append("a.sentiment = ?")
+            params.append(sentiment)
+        elif scored_only:
+            where.append("a.sentiment IS NOT NULL")
+
+        clause = " AND ".join(where)
+        joined = "FROM article_symbols s JOIN articles a ON a.key = s.key"
+
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT s.symbol, a.title, a.summary, a.source, a.url, a.published_at, "
+                f"a.sentiment, a.confidence, a.model_version {joined} WHERE {clause} "
+                f"ORDER BY s.published_at DESC, a.key LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            ).fetchall()
+            total = -1
+            if with_total:
+                total = self._db.execute(
+                    f"SELECT COUNT(*) {joined} WHERE {clause}", params
+                ).fetchone()[0]
+
+        articles = [
+            StoredArticle(
+                symbol=symbol,
+                title=title,
+                summary=summary,
+                source=source,
+                url=url,
+                published_at=datetime.fromtimestamp(published_at),
+                sentiment=label,
+                confidence=confidence,
+                model_version=model_version
+            )
+            for symbol, title, summary, source, url, published_at, label, confidence, model_version in rows
+        ]
+        return articles, total
+
+    def scored_since(self, since: float) -> list[tuple[str, str, float, str, float]]:
+        """
+        All scored article links published since a time.
+
+        Args:
+            since: Unix timestamp
+
+        Returns:
+            list: (symbol, key, published_at, sentiment, confidence) rows
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT s.symbol, s.key, s.published_at, a.sentiment, a.confidence "
+                "FROM article_symbols s JOIN articles a ON a.key = s.key "
+                "WHERE s.published_at >= ? AND a.sentiment IS NOT NULL",
+                (since,)
+            ).fetchall()
+
+    def get_sentiments(
+        self,
+        articles: list[NewsArticle],
+        model_version: str
+    ) -> list[Optional[SentimentResult]]:
+        """
+        Stored sentiment for articles, if scored by this model version.
+
+        Args:
+            articles: News articles
+            model_version: Current sentiment model version
+
+        Returns:
+            list: SentimentResult (or None if not scored yet) per article, in order
+        """
+        keys = [article_key(article) for article in articles]
+        if not keys:
+            return []
+
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT key, sentiment, confidence FROM articles "
+                f"WHERE key IN ({','.join('?' * len(keys))}) "
+                f"AND sentiment IS NOT NULL AND model_version = ?",
+                [*keys, model_version]
+            ).fetchall()
+
+        found = {
+            key: SentimentResult(sentiment=label, confidence=confidence)
+            for key, label, confidence in rows
+        }
+        return [found.get(key) for key in keys]
+
+    def set_sentiments(
+        self,
+        articles: list[NewsArticle],
+        results: list[SentimentResult],
+        model_version: str
+    ) -> None:
+        """
+        Bulk-store sentiment for articles. Fallback placeholders from failed
+        inference are skipped so those articles are rescored next time.
+
+        Args:
+            articles: News articles (already merged into the store)
+            results: Sentiment result per article
+            model_version: Sentiment model version that produced the results
+        """
+        rows = [
+            (result.sentiment, result.confidence, model_version, article_key(article))
+            for article, result in zip(articles, results)
+            if not result.fallback
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            try:
+                with self._db:
+                    self._db.executemany(
+                        "UPDATE articles SET sentiment = ?, confidence = ?, model_version = ? "
+                        "WHERE key = ?",
+                        rows
+                    )
+            except Exception as e:
+                logger.error(f"Error writing article sentiment: {str(e)}")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            dict: Symbols, stored articles and scored articles
+        """
+        with self._lock:
+            articles, scored = self._db.execute(
+                "SELECT COUNT(*), COUNT(sentiment) FROM articles"
+            ).fetchone()
+
+        return {
+            "symbols": len(self._covered_from),
+            "articles": articles,
+            "scored": scored
+        }
@@ -0,0 +1,243 @@
+"""
+Async facade over RobinhoodService.
+Runs the blocking robin_stocks calls in a dedicated, size-limited thread pool
+so they never stall the event loop, with per-call timeouts and executor metrics.
+Positions/balances and quotes are cached as short-lived single-flight snapshots
+so concurrent dashboard calls share one Robinhood fetch.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.models.schemas import PortfolioResponse
+from app.services.robinhood_service import (
+    RobinhoodService,
+    PortfolioPositions,
+    robinhood_service
+)
+from app.utils.cache import CoalescingCache
+
+
+POSITIONS_KEY = "positions"
+
+
+class RobinhoodBusyError(Exception):
+    """Raised when too many Robinhood calls are already queued"""
+
+
+class AsyncRobinhoodService:
+    """Awaitable wrapper that executes RobinhoodService calls off the event loop"""
+
+    def __init__(self, service: RobinhoodService):
+        self.settings = get_settings()
+        self.service = service
+        self.timeout = self.settings.ROBINHOOD_CALL_TIMEOUT_SECONDS
+        self.max_queue = self.settings.ROBINHOOD_EXECUTOR_MAX_QUEUE
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.settings.ROBINHOOD_EXECUTOR_WORKERS,
+            thread_name_prefix="robinhood"
+        )
+        # Own counters: ThreadPoolExecutor doesn't expose its queue publicly
+        self._queued = 0
+        self._running = 0
+        self._counts_lock = threading.Lock()
+        metrics.register_collector("robinhood.executor", self.executor_stats)
+        
+        # Short-TTL snapshots; quotes refresh independently of positions and balances
+        self.positions_cache = CoalescingCache(
+            max_entries=1,
+            ttl_seconds=self.settings.PORTFOLIO_POSITIONS_TTL_SECONDS,
+            name="robinhood.positions_cache"
+        )
+        self.quotes_cache = CoalescingCache(
+            max_entries=16,
+            ttl_seconds=self.settings.PORTFOLIO_QUOTES_TTL_SECONDS,
+            name="robinhood.quotes_cache"
+        )
+        # Last price seen per symbol, used when a request can't wait for fresh quotes
+        self.last_prices: dict[str, float] = {}
+
+    async def _run(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Run a blocking call in the Robinhood executor.
+
+        Args:
+            name: Call name used for metrics
+            func: Blocking function to run
+            *args: Positional arguments for func
+            timeout: Seconds to wait (default: ROBINHOOD_CALL_TIMEOUT_SECONDS)
+
+        Returns:
+            Result of func
+
+        Raises:
+            RobinhoodBusyError: If the executor queue is full
+            asyncio.TimeoutError: If the call doesn't finish in time
+        """
+        if self.queue_depth >= self.max_queue:
+            metrics.increment("robinhood.executor.rejected")
+            raise RobinhoodBusyError("Too many Robinhood requests queued")
+
+        submitted = time.perf_counter()
+
+        def call() -> Any:
+            with self._counts_lock:
+                self._queued -= 1
+                self._running += 1
+            started = time.perf_counter()
+            metrics.observe("robinhood.executor.queue_wait", started - submitted)
+            try:
+                return func(*args)
+            finally:
+                with self._counts_lock:
+                    self._running -= 1
+                metrics.observe(f"robinhood.{name}", time.perf_counter() - started)
+
+        def dropped(submission: Future) -> None:
+            # Cancelled while still queued, so call() never ran
+            if submission.cancelled():
+                with self._counts_lock:
+                    self._queued -= 1
+
+        timeout = timeout or self.timeout
+        with self._counts_lock:
+            self._queued += 1
+        submission = self._executor.submit(call)
+        submission.add_done_callback(dropped)
+        future = asyncio.wrap_future(submission)
+        metrics.set_gauge("robinhood.executor.queue_depth", self.queue_depth)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # Calls that already started keep running in their thread; queued ones are dropped
+            metrics.increment("robinhood.executor.timeouts")
+            logger.error(f"Robinhood {name} timed out after {timeout:.1f}s")
+            raise
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls submitted to the executor that haven't started yet"""
+        return self._queued
+
+    async def get_positions(self, timeout: Optional[float] = None) -> PortfolioPositions:
+        """
+        Get balances and positions from the snapshot cache.
+        Concurrent callers share one in-flight fetch.
+
+        Args:
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            PortfolioPositions: Equity, cash and positions
+        """
+        return await self.positions_cache.get_or_fetch(
+            POSITIONS_KEY,
+            lambda: self._run("load_positions", self.service.load_positions, timeout=timeout)
+        )
+
+    async def get_latest_prices(
+        self,
+        symbols: list[str],
+        timeout: Optional[float] = None
+    ) -> dict[str, float]:
+        """
+        Get latest prices from the quote cache (keyed by the symbol set).
+
+        Args:
+            symbols: Ticker symbols
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            dict[str, float]: Price per symbol
+        """
+        async def fetch() -> dict[str, float]:
+            prices = await self._run(
+                "get_latest_prices", self.service.get_latest_prices, symbols, timeout=timeout
+            )
+            self.last_prices.update(prices)
+            return prices
+        
+        return await self.quotes_cache.get_or_fetch(tuple(sorted(symbols)), fetch)
+
+    async def get_portfolio(self, timeout: Optional[float] = None) -> PortfolioResponse:
+        """
+        Fetch complete portfolio information without blocking the event loop.
+
+        Args:
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            PortfolioResponse: Portfolio data with holdings
+        """
+        positions = await self.get_positions(timeout=timeout)
+        prices = await self.get_latest_prices(positions.symbols, timeout=timeout)
+        return self.service.build_portfolio(positions, prices)
+
+    async def get_portfolio_symbols(self, timeout: Optional[float] = None) -> list[str]:
+        """
+        Get list of stock symbols in the portfolio without blocking the event loop.
+
+        Args:
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            list[str]: List of ticker symbols
+        """
+        positions = await self.get_positions(timeout=timeout)
+        return positions.symbols
+
+    def invalidate(self, quotes_only: bool = False) -> None:
+        """
+        Drop cached snapshots so the next call refetches from Robinhood.
+
+        Args:
+            quotes_only: Keep positions and balances, drop only quotes
+        """
+        self.quotes_cache.invalidate()
+        if not quotes_only:
+            self.positions_cache.invalidate()
+        logger.info(f"Portfolio cache invalidated ({'quotes' if quotes_only else 'all'})")
+
+    def executor_stats(self) -> dict[str, int]:
+        """
+        Get executor statistics.
+
+        Returns:
+            dict: Queued and running calls and pool size
+        """
+        return {
+            "queued": self.queue_depth,
+            "running": self._running,
+            "workers": self.settings.ROBINHOOD_EXECUTOR_WORKERS,
+            "max_queue": self.max_queue
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release the executor threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global async facade instance
+async_robinhood_service = AsyncRobinhoodService(robinhood_service)
+
+
+def get_async_robinhood_service() -> AsyncRobinhoodService:
+    """
+    Dependency injection function for FastAPI.
+
+    Returns:
+        AsyncRobinhoodService: Async Robinhood service facade
+    """
+    return async_robinhood_service
@@ -0,0 +1,193 @@
+"""
+Pluggable inference backends for the FinBERT sentiment model.
+Supports eager PyTorch, dynamic int8 quantization and an exported ONNX Runtime session.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+import torch
+from transformers import AutoModelForSequenceClassification
+from app.core.logger import logger
+
+
+class InferenceBackend(ABC):
+    """Base class: turns tokenized inputs into classification logits"""
+
+    name = "base"
+
+    def __init__(self, device: str = "cpu"):
+        self.device = device
+
+    @abstractmethod
+    def load(self, model_name: str, revision: str) -> None:
+        """
+        Load model weights for this backend.
+
+        Args:
+            model_name: Hugging Face model id or local path
+            revision: Model revision (branch, tag or commit)
+        """
+
+    @abstractmethod
+    def logits(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        """
+        Run a forward pass over a tokenized batch.
+
+        Args:
+            inputs: Tokenizer output (input_ids, attention_mask, ...)
+
+        Returns:
+            torch.Tensor: Logits of shape (batch, num_labels)
+        """
+
+
+class PyTorchBackend(InferenceBackend):
+    """Eager fp32 PyTorch inference"""
+
+    name = "pytorch"
+
+    def __init__(self, device: str = "cpu"):
+        super().__init__(device)
+        self.model: Optional[AutoModelForSequenceClassification] = None
+
+    def load(self, model_name: str, revision: str) -> None:
+        self.model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, revision=revision
+        )
+        self.model.to(self.device)
+        self.model.eval()  # Set to evaluation mode
+
+    def logits(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        # Move inputs to device
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            return self.model(**inputs).logits
+
+
+class QuantizedBackend(PyTorchBackend):
+    """PyTorch inference with dynamic int8 quantization of Linear layers (CPU only)"""
+
+    name = "quantized"
+
+    def __init__(self, device: str = "cpu"):
+        if device != "cpu":
+            logger.warning("Dynamic quantization runs on CPU only, ignoring device")
+        super().__init__("cpu")
+
+    def load(self, model_name: str, revision: str) -> None:
+        super().load(model_name, revision)
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class OnnxBackend(InferenceBackend):
+    """ONNX Runtime session over a model exported from PyTorch"""
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        device: str = "cpu",
+        onnx_path: Optional[str] = None,
+        num_threads: Optional[int] = None
+    ):
+        super().__init__("cpu")
+        self.onnx_path = onnx_path
+        self.num_threads = num_threads
+        self.session = None
+        self._input_names: list[str] = []
+
+    def load(self, model_name: str, revision: str) -> None:
+        # Optional dependency, only needed for this backend
+        import onnxruntime as ort
+
+        path = self.onnx_path or os.path.join(
+            ".cache", "onnx", f"{model_name.replace('/', '--')}-{revision}.onnx"
+        )
+        if not os.path.exists(path):
+            self._export(model_name, revision, path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.num_threads:
+            options.intra_op_num_threads = self.num_threads
+        self.session = ort.InferenceSession(
+            path, options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [i.name for i in self.session.get_inputs()]
+        logger.info(f"ONNX Runtime session ready: {path}")
+
+    def _export(self, model_name: str, revision: str, path: str) -> None:
+        """Export the PyTorch model to ONNX with dynamic batch and sequence axes"""
+        logger.info(f"Exporting {model_name} to ONNX: {path}")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, revision=revision
+        )
+        model.eval()
+
+        input_names = ["input_ids", "attention_mask", "token_type_ids"]
+        dummy = tuple(torch.ones(1, 8, dtype=torch.long) for _ in input_names)
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["logits"] = {0: "batch"}
+
+        torch.onnx.export(
+            model,
+            dummy,
+            path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+
+    def logits(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        feed = {
+            name: inputs[name].cpu().numpy()
+            for name in self._input_names
+            if name in inputs
+        }
+        outputs = self.session.run(["logits"], feed)
+        return torch.from_numpy(outputs[0])
+
+
+BACKENDS = {
+    PyTorchBackend.name: PyTorchBackend,
+    QuantizedBackend.name: QuantizedBackend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def create_backend(
+    name: str,
+    device: str = "cpu",
+    onnx_path: Optional[str] = None,
+    num_threads: Optional[int] = None
+) -> InferenceBackend:
+    """
+    Build an inference backend by name.
+
+    Args:
+        name: One of "pytorch", "quantized" or "onnx"
+        device: Torch device for the PyTorch backend
+        onnx_path: Where to find or export the ONNX model
+        num_threads: Intra-op threads for the ONNX Runtime session
+
+    Returns:
+        InferenceBackend: Unloaded backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown sentiment backend '{name}', expected one of {sorted(BACKENDS)}"
+        )
+
+    if name == OnnxBackend.name:
+        return OnnxBackend(device, onnx_path=onnx_path, num_threads=num_threads)
+    return BACKENDS[name](device)
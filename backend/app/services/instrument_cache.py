@@ -0,0 +1,88 @@
+"""
+Persistent instrument URL -> ticker symbol map for Robinhood positions.
+Instrument URLs never change symbol, so lookups are kept in memory and
+in SQLite and only unknown instruments ever reach the network.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Optional
+from app.core.logger import logger
+from app.core.metrics import metrics
+
+
+class InstrumentSymbolCache:
+    """In-memory map backed by an optional SQLite table"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._symbols: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS instrument_symbols ("
+                    "instrument_url TEXT PRIMARY KEY, symbol TEXT NOT NULL)"
+                )
+                self._db.commit()
+
+                # Load everything up front; the table holds one row per instrument ever held
+                rows = self._db.execute(
+                    "SELECT instrument_url, symbol FROM instrument_symbols"
+                ).fetchall()
+                self._symbols.update(rows)
+                logger.info(f"Loaded {len(rows)} instrument symbols from {db_path}")
+            except Exception as e:
+                logger.error(f"Could not open instrument symbol store: {str(e)}")
+                self._db = None
+
+    def get_many(self, instrument_urls: list[str]) -> dict[str, str]:
+        """
+        Look up known symbols.
+
+        Args:
+            instrument_urls: Instrument URLs to resolve
+
+        Returns:
+            dict[str, str]: Symbols for the URLs that are already known
+        """
+        with self._lock:
+            found = {
+                url: self._symbols[url]
+                for url in instrument_urls
+                if url in self._symbols
+            }
+
+        metrics.increment("robinhood.instrument_cache.hits", len(found))
+        metrics.increment("robinhood.instrument_cache.misses", len(instrument_urls) - len(found))
+        return found
+
+    def set_many(self, symbols: dict[str, str]) -> None:
+        """
+        Store newly resolved symbols in memory and on disk.
+
+        Args:
+            symbols: Mapping of instrument URL to ticker symbol
+        """
+        if not symbols:
+            return
+
+        with self._lock:
+            self._symbols.update(symbols)
+
+            if self._db is not None:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO instrument_symbols VALUES (?, ?)",
+                        symbols.items()
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    logger.error(f"Error writing instrument symbol store: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._symbols)
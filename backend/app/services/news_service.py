@@ -3,12 +3,25 @@ News service for fetching stock-related news from Finnhub API.
 Supports both general market news and company-specific news.
 """
 
+import asyncio
 import httpx
-from typing import Optional
-from datetime import datetime
+from typing import AsyncIterator, Optional
+from datetime import datetime, timedelta
 from app.core.logger import logger
 from app.core.config import get_settings
-from app.models.schemas import NewsArticle, NewsResponse
+from app.core.metrics import metrics
+from app.models.schemas import ArticlePage, NewsArticle, NewsResponse
+from app.services.article_store import ArticleStore
+from app.utils.cache import CoalescingCache
+from app.utils.rate_limiter import AsyncTokenBucket, PRIORITY_INTERACTIVE
+
+
+# Process-wide Finnhub quota shared by every NewsService call
+finnhub_limiter = AsyncTokenBucket(
+    rate_per_minute=get_settings().FINNHUB_CALLS_PER_MINUTE,
+    capacity=get_settings().FINNHUB_BURST
+)
+metrics.register_collector("finnhub.rate_limit", finnhub_limiter.stats)
 
 
 class NewsService:
@@ -18,12 +31,154 @@ class NewsService:
         self.settings = get_settings()
         self.base_url = "https://finnhub.io/api/v1"
         self.api_key = self.settings.FINNHUB_API_KEY
+        self._client: Optional[httpx.AsyncClient] = None
+        self.limiter = finnhub_limiter
+        # Pool usage counted by this service (httpx has no public pool stats)
+        self._active_requests = 0
+        self._connections_opened = 0
+        
+        # Persistent company news store with per-symbol high-water marks and sentiment
+        self.store = ArticleStore(
+            db_path=self.settings.NEWS_STORE_DB_PATH,
+            retention_days=self.settings.NEWS_STORE_RETENTION_DAYS
+        )
+        
+        # Server-side news caches (stale-while-revalidate, coalesced misses)
+        self.company_cache = CoalescingCache(
+            max_entries=self.settings.NEWS_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.settings.NEWS_COMPANY_CACHE_TTL_SECONDS,
+            stale_seconds=self.settings.NEWS_CACHE_STALE_SECONDS,
+            name="news.company_cache"
+        )
+        self.general_cache = CoalescingCache(
+            max_entries=self.settings.NEWS_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.settings.NEWS_GENERAL_CACHE_TTL_SECONDS,
+            stale_seconds=self.settings.NEWS_CACHE_STALE_SECONDS,
+            name="news.general_cache"
+        )
+        metrics.register_collector("news.company_cache", self.company_cache.stats)
+        metrics.register_collector("news.general_cache", self.general_cache.stats)
+        metrics.register_collector("news.http_pool", self.pool_stats)
+        metrics.register_collector("news.store", self.store.stats)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Shared, long-lived HTTP client with connection pooling and keep-alive.
+        Created on first use if the app lifespan hasn't started it.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """Build the pooled client from NEWS_HTTP_* settings"""
+        limits = httpx.Limits(
+            max_connections=self.settings.NEWS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=self.settings.NEWS_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=self.settings.NEWS_HTTP_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            self.settings.NEWS_HTTP_READ_TIMEOUT,
+            connect=self.settings.NEWS_HTTP_CONNECT_TIMEOUT,
+            pool=self.settings.NEWS_HTTP_POOL_TIMEOUT
+        )
+        logger.info(
+            f"Creating Finnhub HTTP client (max_connections={limits.max_connections}, "
+            f"http2={self.settings.NEWS_HTTP2})"
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=limits,
+            timeout=timeout,
+            http2=self.settings.NEWS_HTTP2
+        )
+    
+    async def start(self) -> None:
+        """Open the shared HTTP client (called from the app lifespan)"""
+        _ = self.client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("Finnhub HTTP client closed")
+        self._client = None
+    
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Get connection usage statistics for the shared client.
+        Requests far outnumbering opened connections means keep-alive works.
+        
+        Returns:
+            dict: In-flight requests and connections opened so far
+        """
+        return {
+            "active": self._active_requests,
+            "connections_opened": self._connections_opened
+        }
+    
+    async def _trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace hook: count new connections, whatever the pool version"""
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+    
+    async def _get(
+        self,
+        path: str,
+        params: dict,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> httpx.Response:
+        """
+        Rate-limited GET against the Finnhub API.
+        On 429 the shared limiter is paused for Retry-After (or an
+        exponential backoff) and the call is retried.
+        
+        Args:
+            path: API path (e.g. "/company-news")
+            params: Query parameters
+            priority: Limiter queue priority
+            
+        Returns:
+            httpx.Response: Successful response
+            
+        Raises:
+            httpx.HTTPError: On non-429 errors or when retries are exhausted
+        """
+        max_retries = self.settings.FINNHUB_MAX_RETRIES
+        
+        for attempt in range(max_retries + 1):
+            await self.limiter.acquire(priority)
+            metrics.increment("finnhub.requests")
+            
+            self._active_requests += 1
+            try:
+                response = await self.client.get(
+                    path, params=params, extensions={"trace": self._trace}
+                )
+            finally:
+                self._active_requests -= 1
+            if response.status_code != 429 or attempt == max_retries:
+                response.raise_for_status()
+                return response
+            
+            metrics.increment("finnhub.rate_limited")
+            try:
+                delay = float(response.headers.get("Retry-After", ""))
+            except ValueError:
+                delay = 2.0 ** attempt
+            
+            logger.warning(f"Finnhub rate limit hit on {path}, retrying in {delay:.1f}s")
+            self.limiter.pause(delay)
+        
+        raise httpx.HTTPError(f"Finnhub request to {path} failed")
     
     async def get_company_news(
         self, 
         symbols: list[str], 
         from_date: Optional[str] = None,
-        to_date: Optional[str] = None
+        to_date: Optional[str] = None,
+        priority: int = PRIORITY_INTERACTIVE
     ) -> NewsResponse:
         """
         Fetch company-specific news for given stock symbols.
@@ -32,96 +187,155 @@ class NewsService:
             symbols: List of stock ticker symbols
             from_date: Start date in YYYY-MM-DD format (default: 30 days ago)
             to_date: End date in YYYY-MM-DD format (default: today)
+            priority: Rate limiter priority (background refreshes yield to users)
             
         Returns:
             NewsResponse: Collection of news articles
         """
-        # Set default date range if not provided
+        from_date, to_date = self._date_range(from_date, to_date)
+        
+        # Fetch symbols concurrently, bounded by NEWS_FETCH_CONCURRENCY
+        semaphore = asyncio.Semaphore(self.settings.NEWS_FETCH_CONCURRENCY)
+        
+        results = await asyncio.gather(*[
+            self._fetch_symbol_news(semaphore, symbol, from_date, to_date, priority)
+            for symbol in symbols
+        ])
+        
+        # Flatten in input symbol order
+        all_articles = [article for articles in results for article in articles]
+        
+        return NewsResponse(articles=all_articles, count=len(all_articles))
+    
+    async def iter_company_news(
+        self,
+        symbols: list[str],
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[tuple[str, list[NewsArticle]]]:
+        """
+        Fetch company news concurrently and yield each symbol as soon as it arrives.
+        
+        Args:
+            symbols: List of stock ticker symbols
+            from_date: Start date in YYYY-MM-DD format (default: 30 days ago)
+            to_date: End date in YYYY-MM-DD format (default: today)
+            priority: Rate limiter priority
+            
+        Yields:
+            tuple[str, list[NewsArticle]]: Symbol and its articles, in completion order
+        """
+        from_date, to_date = self._date_range(from_date, to_date)
+        semaphore = asyncio.Semaphore(self.settings.NEWS_FETCH_CONCURRENCY)
+        
+        async def fetch(symbol: str) -> tuple[str, list[NewsArticle]]:
+            articles = await self._fetch_symbol_news(semaphore, symbol, from_date, to_date, priority)
+            return symbol, articles
+        
+        tasks = [asyncio.create_task(fetch(symbol)) for symbol in symbols]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or was cancelled); don't leave fetches running
+            for task in tasks:
+                task.cancel()
+    
+    def _date_range(
+        self,
+        from_date: Optional[str],
+        to_date: Optional[str]
+    ) -> tuple[str, str]:
+        """Fill in the default date range (last 30 days) for company news"""
         if not to_date:
             to_date = datetime.now().strftime("%Y-%m-%d")
         if not from_date:
             # Default to 30 days ago
-            from datetime import timedelta
             from_dt = datetime.now() - timedelta(days=30)
             from_date = from_dt.strftime("%Y-%m-%d")
         
-        all_articles = []
-        
-        async with httpx.AsyncClient() as client:
-            for symbol in symbols:
-                try:
-                    logger.info(f"Fetching news for {symbol}...")
-                    
-                    url = f"{self.base_url}/company-news"
-                    params = {
-                        "symbol": symbol,
-                        "from": from_date,
-                        "to": to_date,
-                        "token": self.api_key
-                    }
-                    
-                    response = await client.get(url, params=params, timeout=10.0)
-                    response.raise_for_status()
-                    
-                    news_data = response.json()
-                    
-                    # Parse and transform news articles
-                    for item in news_data[:5]:  # Limit to 5 articles per symbol
-                        try:
-                            article = NewsArticle(
-                                symbol=symbol,
-                                title=item.get("headline", "No title"),
-                                summary=item.get("summary", "No summary available"),
-                                source=item.get("source", "Unknown"),
-                                url=item.get("url", ""),
-                                published_at=datetime.fromtimestamp(item.get("datetime", 0))
-                            )
-                            all_articles.append(article)
-                        except Exception as e:
-                            logger.error(f"Error parsing article: {str(e)}")
-                            continue
-                    
-                    logger.info(f"Fetched {len(news_data)} articles for {symbol}")
-                    
-                except httpx.HTTPError as e:
-                    logger.error(f"HTTP error fetching news for {symbol}: {str(e)}")
-                except Exception as e:
-                    logger.error(f"Error fetching news for {symbol}: {str(e)}")
-                    continue
-        
-        return NewsResponse(articles=all_articles, count=len(all_articles))
+        return from_date, to_date
     
-    async def get_general_news(self, category: str = "general") -> NewsResponse:
+    async def _fetch_symbol_news(
+        self,
+        semaphore: asyncio.Semaphore,
+        symbol: str,
+        from_date: str,
+        to_date: str,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> list[NewsArticle]:
         """
-        Fetch general market news.
+        Get news for a single symbol from cache or Finnhub.
+        Failures are logged and isolated.
         
         Args:
-            category: News category (general, forex, crypto, merger)
+            semaphore: Concurrency limiter
+            symbol: Stock ticker symbol
+            from_date: Start date in YYYY-MM-DD format
+            to_date: End date in YYYY-MM-DD format
+            priority: Rate limiter priority
             
         Returns:
-            NewsResponse: Collection of news articles
+            list[NewsArticle]: Parsed articles (empty on failure)
         """
         try:
-            logger.info(f"Fetching general news for category: {category}")
-            
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/news"
+            return await self.company_cache.get_or_fetch(
+                (symbol, from_date, to_date),
+                lambda: self._load_symbol_news(semaphore, symbol, from_date, to_date, priority)
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error fetching news for {symbol}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error fetching news for {symbol}: {str(e)}")
+        
+        return []
+    
+    async def _load_symbol_news(
+        self,
+        semaphore: asyncio.Semaphore,
+        symbol: str,
+        from_date: str,
+        to_date: str,
+        priority: int
+    ) -> list[NewsArticle]:
+        """
+        Fetch one symbol's new articles from Finnhub into the article store
+        and return the latest ones in range (raises on HTTP errors).
+        Only the delta since the symbol's high-water mark is requested and parsed.
+        Store calls (blocking SQLite) run in worker threads, off the event loop.
+        """
+        fetch_from = await asyncio.to_thread(self.store.fetch_window, symbol, from_date, to_date)
+        
+        if fetch_from is not None:
+            async with semaphore:
+                delta = fetch_from != from_date
+                high_water = 0.0
+                if delta:
+                    high_water = await asyncio.to_thread(self.store.high_water_mark, symbol) or 0.0
+                logger.info(f"Fetching news for {symbol} from {fetch_from}{' (delta)' if delta else ''}...")
+                metrics.increment("news.store.delta_fetches" if delta else "news.store.full_fetches")
+                
                 params = {
-                    "category": category,
+                    "symbol": symbol,
+                    "from": fetch_from,
+                    "to": to_date,
                     "token": self.api_key
                 }
                 
-                response = await client.get(url, params=params, timeout=10.0)
-                response.raise_for_status()
+                response = await self._get("/company-news", params, priority)
                 
                 news_data = response.json()
-                articles = []
                 
-                # Parse articles
-                for item in news_data[:20]:  # Limit to 20 articles
+                # Parse only articles at or past the high-water mark
+                articles = []
+                for item in news_data:
                     try:
+                        if item.get("datetime", 0) < high_water:
+                            continue
+                        
                         article = NewsArticle(
-                            symbol=None,
+                            symbol=symbol,
                             title=item.get("headline", "No title"),
                             summary=item.get("summary", "No summary available"),
                             source=item.get("source", "Unknown"),
@@ -133,15 +347,116 @@ class NewsService:
                         logger.error(f"Error parsing article: {str(e)}")
                         continue
                 
-                logger.info(f"Fetched {len(articles)} general news articles")
-                return NewsResponse(articles=articles, count=len(articles))
-                
+                added = await asyncio.to_thread(self.store.merge, symbol, fetch_from, articles)
+                logger.info(f"Fetched {len(news_data)} articles for {symbol} ({len(added)} new)")
+        
+        # Limit to 5 latest articles per symbol
+        return await asyncio.to_thread(self.store.get_articles, symbol, from_date, to_date, 5)
+    
+    async def get_stored_news(
+        self,
+        symbols: list[str],
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        sentiment: Optional[str] = None,
+        scored_only: bool = False,
+        limit: int = 50,
+        offset: int = 0
+    ) -> ArticlePage:
+        """
+        Page through articles already in the local store (no upstream calls).
+        
+        Args:
+            symbols: List of stock ticker symbols
+            from_date: Start date in YYYY-MM-DD format (default: all stored)
+            to_date: End date in YYYY-MM-DD format (default: all stored)
+            sentiment: Only articles with this sentiment label
+            scored_only: Only articles that have been scored
+            limit: Page size
+            offset: Number of articles to skip
+            
+        Returns:
+            ArticlePage: Page of stored articles, newest first
+        """
+        articles, total = await asyncio.to_thread(
+            self.store.query,
+            symbols,
+            sentiment=sentiment,
+            from_ts=datetime.strptime(from_date, "%Y-%m-%d").timestamp() if from_date else None,
+            to_ts=(datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1)).timestamp() if to_date else None,
+            scored_only=scored_only,
+            limit=limit,
+            offset=offset
+        )
+        
+        return ArticlePage(
+            articles=articles,
+            count=len(articles),
+            total=total,
+            limit=limit,
+            offset=offset
+        )
+    
+    async def get_general_news(
+        self,
+        category: str = "general",
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> NewsResponse:
+        """
+        Fetch general market news.
+        
+        Args:
+            category: News category (general, forex, crypto, merger)
+            priority: Rate limiter priority
+            
+        Returns:
+            NewsResponse: Collection of news articles
+        """
+        try:
+            return await self.general_cache.get_or_fetch(
+                category,
+                lambda: self._load_general_news(category, priority)
+            )
+            
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching general news: {str(e)}")
             raise Exception(f"Failed to fetch news: {str(e)}")
         except Exception as e:
             logger.error(f"Error fetching general news: {str(e)}")
             raise Exception(f"Failed to fetch news: {str(e)}")
+    
+    async def _load_general_news(self, category: str, priority: int) -> NewsResponse:
+        """Fetch and parse general news from Finnhub (raises on HTTP errors)"""
+        logger.info(f"Fetching general news for category: {category}")
+        
+        params = {
+            "category": category,
+            "token": self.api_key
+        }
+        
+        response = await self._get("/news", params, priority)
+        
+        news_data = response.json()
+        articles = []
+        
+        # Parse articles
+        for item in news_data[:20]:  # Limit to 20 articles
+            try:
+                article = NewsArticle(
+                    symbol=None,
+                    title=item.get("headline", "No title"),
+                    summary=item.get("summary", "No summary available"),
+                    source=item.get("source", "Unknown"),
+                    url=item.get("url", ""),
+                    published_at=datetime.fromtimestamp(item.get("datetime", 0))
+                )
+                articles.append(article)
+            except Exception as e:
+                logger.error(f"Error parsing article: {str(e)}")
+                continue
+        
+        logger.info(f"Fetched {len(articles)} general news articles")
+        return NewsResponse(articles=articles, count=len(articles))
 
 
 # Global service instance
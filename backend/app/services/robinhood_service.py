@@ -3,11 +3,41 @@ Robinhood service for portfolio data retrieval.
 Handles authentication and fetching portfolio information using robin_stocks.
 """
 
+import time
 import robin_stocks.robinhood as rh
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 from app.core.logger import logger
 from app.core.config import get_settings
+from app.core.metrics import metrics
 from app.models.schemas import PortfolioResponse, Holding
+from app.services.instrument_cache import InstrumentSymbolCache
+
+
+# Instruments and quotes endpoints accept comma-separated lists; keep query strings short
+INSTRUMENT_BATCH_SIZE = 50
+QUOTE_BATCH_SIZE = 50
+
+
+@dataclass
+class Position:
+    """Open stock position without live pricing"""
+    symbol: str
+    quantity: float
+    average_price: float
+
+
+@dataclass
+class PortfolioPositions:
+    """Balances and positions; combined with quotes to build a PortfolioResponse"""
+    total_equity: float = 0.0
+    cash_balance: float = 0.0
+    positions: list[Position] = field(default_factory=list)
+    
+    @property
+    def symbols(self) -> list[str]:
+        return [position.symbol for position in self.positions]
 
 
 class RobinhoodService:
@@ -16,6 +46,13 @@ class RobinhoodService:
     def __init__(self):
         self.settings = get_settings()
         self._logged_in = False
+        self.instrument_symbols = InstrumentSymbolCache(
+            self.settings.ROBINHOOD_INSTRUMENT_DB_PATH
+        )
+        # Profile, account and positions are independent and loaded in parallel
+        self._stage_executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="robinhood-stage"
+        )
     
     def login(self) -> bool:
         """
@@ -24,6 +61,10 @@ class RobinhoodService:
         Returns:
             bool: True if login successful, False otherwise
         """
+        if not self.settings.ROBIN_USER or not self.settings.ROBIN_PASS:
+            logger.error("Robinhood login skipped: ROBIN_USER and ROBIN_PASS must be set")
+            return False
+        
         try:
             logger.info("Attempting Robinhood login...")
             login_result = rh.login(
@@ -54,12 +95,177 @@ class RobinhoodService:
         except Exception as e:
             logger.error(f"Error during logout: {str(e)}")
     
-    def get_portfolio(self) -> PortfolioResponse:
+    def _resolve_symbols(self, instrument_urls: list[str]) -> dict[str, str]:
         """
-        Fetch complete portfolio information including holdings and cash balance.
+        Map instrument URLs to ticker symbols.
+        Known instruments come from the local store; unknown ones are fetched
+        in bulk from the instruments endpoint and then stored.
         
+        Args:
+            instrument_urls: Instrument URLs from open positions
+            
         Returns:
-            PortfolioResponse: Portfolio data with holdings
+            dict[str, str]: Symbol per resolved instrument URL
+        """
+        instrument_urls = list(dict.fromkeys(instrument_urls))
+        symbols = self.instrument_symbols.get_many(instrument_urls)
+        missing = [url for url in instrument_urls if url not in symbols]
+        
+        if not missing:
+            return symbols
+        
+        logger.info(f"Resolving {len(missing)} unknown instruments")
+        resolved = {}
+        
+        # Bulk lookup by instrument id
+        ids = {url.rstrip("/").rsplit("/", 1)[-1]: url for url in missing}
+        id_list = list(ids)
+        for start in range(0, len(id_list), INSTRUMENT_BATCH_SIZE):
+            chunk = id_list[start:start + INSTRUMENT_BATCH_SIZE]
+            try:
+                instruments = rh.helper.request_get(
+                    rh.urls.instruments_url(),
+                    "results",
+                    {"ids": ",".join(chunk)}
+                ) or []
+                for instrument in instruments:
+                    if instrument and instrument.get("id") in ids and instrument.get("symbol"):
+                        resolved[ids[instrument["id"]]] = instrument["symbol"]
+            except Exception as e:
+                logger.warning(f"Bulk instrument lookup failed: {str(e)}")
+        
+        # Fall back to one request per instrument for anything still unknown
+        for url in missing:
+            if url in resolved:
+                continue
+            try:
+                symbol = rh.get_symbol_by_url(url)
+                if symbol:
+                    resolved[url] = symbol
+            except Exception as e:
+                logger.warning(f"Could not resolve instrument {url}: {str(e)}")
+        
+        self.instrument_symbols.set_many(resolved)
+        symbols.update(resolved)
+        return symbols
+    
+    def _get_latest_prices(self, symbols: list[str]) -> dict[str, float]:
+        """
+        Fetch latest prices for many symbols with chunked batch quote calls.
+        Uses the extended-hours price when available, like get_latest_price.
+        
+        Args:
+            symbols: Ticker symbols
+            
+        Returns:
+            dict[str, float]: Price per symbol (symbols without a quote are omitted)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        prices = {}
+        
+        for start in range(0, len(symbols), QUOTE_BATCH_SIZE):
+            chunk = symbols[start:start + QUOTE_BATCH_SIZE]
+            try:
+                quotes = rh.get_quotes(chunk) or []
+                for quote in quotes:
+                    if not quote or not isinstance(quote, dict):
+                        continue
+                    price = quote.get('last_extended_hours_trade_price') or quote.get('last_trade_price')
+                    if quote.get('symbol') and price:
+                        prices[quote['symbol']] = float(price)
+            except Exception as e:
+                logger.warning(f"Batch quote request failed, falling back per symbol: {str(e)}")
+            
+            # get_quotes returns [None] instead of raising when the request fails,
+            # so retry every symbol in the chunk that came back without a price
+            for symbol in chunk:
+                if symbol in prices:
+                    continue
+                try:
+                    quote = rh.get_latest_price(symbol)
+                    if quote and len(quote) > 0 and quote[0]:
+                        prices[symbol] = float(quote[0])
+                except Exception as e:
+                    logger.warning(f"Could not get price for {symbol}: {str(e)}")
+        
+        missing = [symbol for symbol in symbols if symbol not in prices]
+        if missing:
+            logger.warning(f"No price available for: {missing}")
+        
+        return prices
+    
+    def _timed_stage(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run one portfolio loading stage and record its duration"""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.observe(f"robinhood.stage.{stage}", elapsed)
+            logger.info(f"Portfolio stage '{stage}' took {elapsed * 1000:.0f}ms")
+    
+    def _load_total_equity(self) -> float:
+        """Load total equity from the portfolio profile (0.0 if unavailable)"""
+        total_equity = 0.0
+        
+        # Try to get portfolio profile
+        try:
+            profile = rh.load_portfolio_profile()
+            if profile and isinstance(profile, dict):
+                total_equity = float(profile.get('equity', 0) or 0)
+                logger.info(f"Portfolio equity from profile: ${total_equity}")
+            else:
+                logger.warning("Portfolio profile returned None or invalid data")
+        except Exception as e:
+            logger.warning(f"Could not load portfolio profile: {str(e)}")
+        
+        return total_equity
+    
+    def _load_cash_balance(self) -> float:
+        """Load cash balance from the account profile (0.0 if unavailable)"""
+        cash_balance = 0.0
+        
+        # Try to get cash balance
+        try:
+            account_info = rh.load_account_profile()
+            if account_info and isinstance(account_info, dict):
+                cash_balance = float(account_info.get('cash', 0) or 0)
+                logger.info(f"Cash balance: ${cash_balance}")
+            else:
+                logger.warning("Account profile returned None or invalid data")
+        except Exception as e:
+            logger.warning(f"Could not load account profile: {str(e)}")
+            # Try alternative method for cash
+            try:
+                cash_data = rh.account.build_user_profile()
+                if cash_data and isinstance(cash_data, dict):
+                    cash_balance = float(cash_data.get('cash', 0) or 0)
+            except:
+                logger.warning("Could not get cash balance from alternative method")
+        
+        return cash_balance
+    
+    def _load_open_positions(self) -> list:
+        """Load raw open stock positions (empty list if unavailable)"""
+        try:
+            positions = rh.get_open_stock_positions()
+        except Exception as e:
+            logger.error(f"Error fetching positions: {str(e)}")
+            return []
+        
+        if not positions:
+            logger.info("No open positions found")
+            return []
+        
+        logger.info(f"Processing {len(positions)} positions")
+        return positions
+    
+    def load_positions(self) -> PortfolioPositions:
+        """
+        Fetch balances and open positions (everything except live quotes).
+        
+        Returns:
+            PortfolioPositions: Equity, cash and positions with resolved symbols
             
         Raises:
             Exception: If not logged in or API call fails
@@ -71,48 +277,30 @@ class RobinhoodService:
         try:
             logger.info("Fetching portfolio data...")
             
-            # Get portfolio value
-            total_equity = 0.0
-            cash_balance = 0.0
+            # Load profile, account and positions concurrently
+            equity_future = self._stage_executor.submit(
+                self._timed_stage, "profile", self._load_total_equity
+            )
+            cash_future = self._stage_executor.submit(
+                self._timed_stage, "account", self._load_cash_balance
+            )
+            positions_future = self._stage_executor.submit(
+                self._timed_stage, "positions", self._load_open_positions
+            )
             
-            # Try to get portfolio profile
-            try:
-                profile = rh.load_portfolio_profile()
-                if profile and isinstance(profile, dict):
-                    total_equity = float(profile.get('equity', 0) or 0)
-                    logger.info(f"Portfolio equity from profile: ${total_equity}")
-                else:
-                    logger.warning("Portfolio profile returned None or invalid data")
-            except Exception as e:
-                logger.warning(f"Could not load portfolio profile: {str(e)}")
+            total_equity = equity_future.result()
+            cash_balance = cash_future.result()
+            positions = positions_future.result()
             
-            # Try to get cash balance
-            try:
-                account_info = rh.load_account_profile()
-                if account_info and isinstance(account_info, dict):
-                    cash_balance = float(account_info.get('cash', 0) or 0)
-                    logger.info(f"Cash balance: ${cash_balance}")
-                else:
-                    logger.warning("Account profile returned None or invalid data")
-            except Exception as e:
-                logger.warning(f"Could not load account profile: {str(e)}")
-                # Try alternative method for cash
-                try:
-                    cash_data = rh.account.build_user_profile()
-                    if cash_data and isinstance(cash_data, dict):
-                        cash_balance = float(cash_data.get('cash', 0) or 0)
-                except:
-                    logger.warning("Could not get cash balance from alternative method")
-            
-            # Get holdings
-            holdings_list = []
+            # Get positions
+            position_list = []
             try:
-                positions = rh.get_open_stock_positions()
-                
-                if not positions:
-                    logger.info("No open positions found")
-                else:
-                    logger.info(f"Processing {len(positions)} positions")
+                # Resolve all instrument symbols up front (local store first)
+                symbols_by_url = self._timed_stage("instruments", self._resolve_symbols, [
+                    position.get('instrument')
+                    for position in positions
+                    if isinstance(position, dict) and position.get('instrument')
+                ])
                 
                 for position in positions:
                     try:
@@ -127,40 +315,16 @@ class RobinhoodService:
                             logger.warning("Position missing instrument URL")
                             continue
                         
-                        symbol = rh.get_symbol_by_url(instrument_url)
+                        symbol = symbols_by_url.get(instrument_url)
                         if not symbol:
                             logger.warning(f"Could not get symbol for instrument: {instrument_url}")
                             continue
                         
-                        quantity = float(position.get('quantity', 0) or 0)
-                        average_price = float(position.get('average_buy_price', 0) or 0)
-                        
-                        # Get current price
-                        current_price = 0.0
-                        try:
-                            quote = rh.get_latest_price(symbol)
-                            if quote and len(quote) > 0 and quote[0]:
-                                current_price = float(quote[0])
-                        except Exception as e:
-                            logger.warning(f"Could not get price for {symbol}: {str(e)}")
-                        
-                        equity = quantity * current_price
-                        
-                        # Calculate percent change
-                        percent_change = 0.0
-                        if average_price > 0:
-                            percent_change = ((current_price - average_price) / average_price) * 100
-                        
-                        holding = Holding(
+                        position_list.append(Position(
                             symbol=symbol,
-                            quantity=quantity,
-                            average_price=average_price,
-                            current_price=current_price,
-                            equity=equity,
-                            percent_change=round(percent_change, 2)
-                        )
-                        holdings_list.append(holding)
-                        logger.info(f"Added holding: {symbol} - {quantity} shares @ ${current_price}")
+                            quantity=float(position.get('quantity', 0) or 0),
+                            average_price=float(position.get('average_buy_price', 0) or 0)
+                        ))
                         
                     except Exception as e:
                         logger.error(f"Error processing position: {str(e)}")
@@ -169,23 +333,106 @@ class RobinhoodService:
             except Exception as e:
                 logger.error(f"Error fetching positions: {str(e)}")
             
-            # Calculate total equity from holdings if not available from profile
-            if total_equity == 0.0 and holdings_list:
-                total_equity = sum(h.equity for h in holdings_list) + cash_balance
-                logger.info(f"Calculated total equity from holdings: ${total_equity}")
-            
-            logger.info(f"Successfully fetched {len(holdings_list)} holdings")
-            
-            return PortfolioResponse(
-                total_equity=round(total_equity, 2),
-                cash_balance=round(cash_balance, 2),
-                holdings=holdings_list
+            return PortfolioPositions(
+                total_equity=total_equity,
+                cash_balance=cash_balance,
+                positions=position_list
             )
             
         except Exception as e:
             logger.error(f"Error fetching portfolio: {str(e)}")
             raise Exception(f"Failed to fetch portfolio data: {str(e)}")
     
+    def get_latest_prices(self, symbols: list[str]) -> dict[str, float]:
+        """
+        Fetch latest prices for the given symbols.
+        
+        Args:
+            symbols: Ticker symbols
+            
+        Returns:
+            dict[str, float]: Price per symbol (symbols without a quote are omitted)
+        """
+        if not self._logged_in:
+            if not self.login():
+                raise Exception("Failed to authenticate with Robinhood")
+        
+        return self._timed_stage("quotes", self._get_latest_prices, symbols)
+    
+    def build_portfolio(
+        self,
+        positions: PortfolioPositions,
+        prices: dict[str, float]
+    ) -> PortfolioResponse:
+        """
+        Combine positions and quotes into a portfolio response.
+        
+        Args:
+            positions: Balances and open positions
+            prices: Latest price per symbol
+            
+        Returns:
+            PortfolioResponse: Portfolio data with holdings
+        """
+        holdings_list = []
+        
+        for position in positions.positions:
+            symbol = position.symbol
+            quantity = position.quantity
+            average_price = position.average_price
+            
+            # Get current price (0.0 if no quote was returned)
+            current_price = prices.get(symbol, 0.0)
+            
+            equity = quantity * current_price
+            
+            # Calculate percent change
+            percent_change = 0.0
+            if average_price > 0:
+                percent_change = ((current_price - average_price) / average_price) * 100
+            
+            holding = Holding(
+                symbol=symbol,
+                quantity=quantity,
+                average_price=average_price,
+                current_price=current_price,
+                equity=equity,
+                percent_change=round(percent_change, 2)
+            )
+            holdings_list.append(holding)
+            logger.info(f"Added holding: {symbol} - {quantity} shares @ ${current_price}")
+        
+        # Calculate total equity from holdings if not available from profile
+        total_equity = positions.total_equity
+        if total_equity == 0.0 and holdings_list:
+            total_equity = sum(h.equity for h in holdings_list) + positions.cash_balance
+            logger.info(f"Calculated total equity from holdings: ${total_equity}")
+        
+        logger.info(f"Successfully fetched {len(holdings_list)} holdings")
+        
+        return PortfolioResponse(
+            total_equity=round(total_equity, 2),
+            cash_balance=round(positions.cash_balance, 2),
+            holdings=holdings_list
+        )
+    
+    def get_portfolio(self) -> PortfolioResponse:
+        """
+        Fetch complete portfolio information including holdings and cash balance.
+        
+        Returns:
+            PortfolioResponse: Portfolio data with holdings
+            
+        Raises:
+            Exception: If not logged in or API call fails
+        """
+        positions = self.load_positions()
+        
+        # Fetch quotes for all holdings in batches
+        prices = self._timed_stage("quotes", self._get_latest_prices, positions.symbols)
+        
+        return self.build_portfolio(positions, prices)
+    
     def get_portfolio_symbols(self) -> list[str]:
         """
         Get list of stock symbols in the portfolio.
@@ -194,8 +441,8 @@ class RobinhoodService:
             list[str]: List of ticker symbols
         """
         try:
-            portfolio = self.get_portfolio()
-            return [holding.symbol for holding in portfolio.holdings]
+            # Symbols only need positions, not quotes
+            return self.load_positions().symbols
         except Exception as e:
             logger.error(f"Error fetching portfolio symbols: {str(e)}")
             return []
@@ -0,0 +1,281 @@
+"""
+Per-symbol rolling sentiment aggregates.
+Keeps label counts, a confidence-weighted score and an exponentially decayed
+score for each symbol over 1d/7d/30d windows. Totals are updated as scored
+articles arrive and as hourly buckets age out, so reads never rescan articles.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.models.schemas import NewsArticle, SentimentResult, SentimentWindow, SymbolSentiment
+from app.services.article_store import ArticleStore, article_key
+from app.services.news_service import news_service
+
+
+# Window name -> length in hours (buckets are one hour wide)
+WINDOWS = {"1d": 24, "7d": 24 * 7, "30d": 24 * 30}
+LONGEST_WINDOW = max(WINDOWS.values())
+LABEL_SIGN = {"positive": 1, "neutral": 0, "negative": -1}
+
+# Totals vector layout: label counts, sum of sign * confidence, sum of confidence
+_POSITIVE, _NEGATIVE, _NEUTRAL, _SIGNED, _CONFIDENCE = range(5)
+
+
+def _contribution(label: str, confidence: float) -> list[float]:
+    """Totals vector for one scored article"""
+    return [
+        float(label == "positive"),
+        float(label == "negative"),
+        float(label == "neutral"),
+        LABEL_SIGN[label] * confidence,
+        confidence
+    ]
+
+
+def _add(totals: list[float], vector: list[float], sign: int = 1) -> None:
+    for i, value in enumerate(vector):
+        totals[i] += sign * value
+
+
+@dataclass
+class _SymbolState:
+    """Running totals for one symbol"""
+    cursors: dict[str, int]
+    windows: dict[str, list[float]] = field(default_factory=lambda: {w: [0.0] * 5 for w in WINDOWS})
+    buckets: dict[int, list[float]] = field(default_factory=dict)
+    bucket_keys: dict[int, set[str]] = field(default_factory=dict)
+    articles: dict[str, tuple[int, float, list[float]]] = field(default_factory=dict)
+    decayed_signed: float = 0.0
+    decayed_confidence: float = 0.0
+    decayed_at: float = 0.0
+    last_published: Optional[float] = None
+
+
+class SentimentAggregator:
+    """Incrementally maintained per-symbol sentiment over rolling windows"""
+
+    def __init__(self, half_life_hours: float = 24.0):
+        """
+        Args:
+            half_life_hours: Half-life of an article's weight in the decayed score
+        """
+        self.half_life = half_life_hours * 3600
+        self._symbols: dict[str, _SymbolState] = {}
+        self._lock = threading.Lock()
+
+    def load(self, store: ArticleStore) -> None:
+        """
+        Seed the aggregates with scored articles already in the store.
+
+        Args:
+            store: Article store to read from
+        """
+        since = time.time() - LONGEST_WINDOW * 3600
+        count = 0
+        for symbol, key, published_at, label, confidence in store.scored_since(since):
+            self._add(symbol, key, published_at, label, confidence, time.time())
+            count += 1
+        logger.info(f"Sentiment aggregates loaded {count} scored articles")
+
+    def add_many(self, articles: list[NewsArticle], results: list[SentimentResult]) -> None:
+        """
+        Fold newly scored articles into their symbols' aggregates.
+        Re-adding an article replaces its earlier contribution; fallback
+        placeholders from failed inference are ignored.
+
+        Args:
+            articles: Scored articles (symbol set)
+            results: Sentiment result per article
+        """
+        now = time.time()
+        for article, result in zip(articles, results):
+            if article.symbol and not result.fallback:
+                self._add(
+                    article.symbol,
+                    article_key(article),
+                    article.published_at.timestamp(),
+                    result.sentiment,
+                    result.confidence,
+                    now
+                )
+        metrics.set_gauge("sentiment.aggregates.symbols", len(self._symbols))
+
+    def _add(
+        self,
+        symbol: str,
+        key: str,
+        published_at: float,
+        label: str,
+        confidence: float,
+        now: float
+    ) -> None:
+        """Add one article's contribution to the bucket, windows and decayed score"""
+        hour = int(published_at // 3600)
+
+        with self._lock:
+            state = self._symbols.get(symbol)
+            if state is None:
+                state = self._symbols[symbol] = _SymbolState(cursors=self._cursors(now))
+            self._advance(state, now)
+
+            if key in state.articles:
+                self._remove(state, key, now)
+            if hour < state.cursors["30d"]:
+                return  # Older than the longest window
+
+            vector = _contribution(label, confidence)
+            _add(state.buckets.setdefault(hour, [0.0] * 5), vector)
+            state.bucket_keys.setdefault(hour, set()).add(key)
+            for window, totals in state.windows.items():
+                if hour >= state.cursors[window]:
+                    _add(totals, vector)
+
+            weight = self._weight(published_at, now)
+            self._decay_to(state, now)
+            state.decayed_signed += weight * vector[_SIGNED]
+            state.decayed_confidence += weight * vector[_CONFIDENCE]
+
+            state.articles[key] = (hour, published_at, vector)
+            if state.last_published is None or published_at > state.last_published:
+                state.last_published = published_at
+
+    def _remove(self, state: _SymbolState, key: str, now: float) -> None:
+        """Take back an article's earlier contribution (e.g. when rescored)"""
+        hour, published_at, vector = state.articles.pop(key)
+
+        _add(state.buckets[hour], vector, -1)
+        state.bucket_keys[hour].discard(key)
+        for window, totals in state.windows.items():
+            if hour >= state.cursors[window]:
+                _add(totals, vector, -1)
+
+        weight = self._weight(published_at, now)
+        self._decay_to(state, now)
+        state.decayed_signed -= weight * vector[_SIGNED]
+        state.decayed_confidence -= weight * vector[_CONFIDENCE]
+
+    def _cursors(self, now: float) -> dict[str, int]:
+        """First hourly bucket inside each window"""
+        current = int(now // 3600)
+        return {window: current - hours + 1 for window, hours in WINDOWS.items()}
+
+    def _advance(self, state: _SymbolState, now: float) -> None:
+        """Subtract buckets that have aged out of each window since the last call"""
+        cursors = self._cursors(now)
+
+        for window, cursor in cursors.items():
+            previous = state.cursors[window]
+            if cursor <= previous:
+                continue
+
+            totals = state.windows[window]
+            # Walk whichever is smaller: the skipped hours or the stored buckets
+            if cursor - previous <= len(state.buckets):
+                expired = [h for h in range(previous, cursor) if h in state.buckets]
+            else:
+                expired = [h for h in state.buckets if previous <= h < cursor]
+            for hour in expired:
+                _add(totals, state.buckets[hour], -1)
+            state.cursors[window] = cursor
+
+        # Buckets past the longest window are no longer needed
+        for hour in [h for h in state.buckets if h < cursors["30d"]]:
+            del state.buckets[hour]
+            for key in state.bucket_keys.pop(hour, ()):
+                state.articles.pop(key, None)
+
+    def _weight(self, published_at: float, now: float) -> float:
+        """Decay weight of an article published at a given time"""
+        age = max(now - published_at, 0.0)
+        return 0.5 ** (age / self.half_life)
+
+    def _decay_to(self, state: _SymbolState, now: float) -> None:
+        """Bring the decayed sums forward to now"""
+        if state.decayed_at:
+            factor = 0.5 ** (max(now - state.decayed_at, 0.0) / self.half_life)
+            state.decayed_signed *= factor
+            state.decayed_confidence *= factor
+        state.decayed_at = now
+
+    def snapshot(self, symbols: Optional[list[str]] = None) -> list[SymbolSentiment]:
+        """
+        Current aggregates, one entry per symbol.
+
+        Args:
+            symbols: Symbols to include (default: all tracked)
+
+        Returns:
+            list[SymbolSentiment]: Aggregates in the requested (or sorted) order
+        """
+        now = time.time()
+        result = []
+
+        with self._lock:
+            for symbol in symbols if symbols is not None else sorted(self._symbols):
+                state = self._symbols.get(symbol)
+                if state is None:
+                    result.append(SymbolSentiment(
+                        symbol=symbol,
+                        windows={window: SentimentWindow() for window in WINDOWS}
+                    ))
+                    continue
+
+                self._advance(state, now)
+                self._decay_to(state, now)
+
+                result.append(SymbolSentiment(
+                    symbol=symbol,
+                    windows={
+                        window: self._window(totals)
+                        for window, totals in state.windows.items()
+                    },
+                    decayed_score=(
+                        round(state.decayed_signed / state.decayed_confidence, 4)
+                        if state.decayed_confidence > 1e-9 else None
+                    ),
+                    last_published_at=(
+                        datetime.fromtimestamp(state.last_published)
+                        if state.last_published else None
+                    )
+                ))
+
+        return result
+
+    def _window(self, totals: list[float]) -> SentimentWindow:
+        """Window summary from its totals vector"""
+        positive = round(totals[_POSITIVE])
+        negative = round(totals[_NEGATIVE])
+        neutral = round(totals[_NEUTRAL])
+        return SentimentWindow(
+            count=positive + negative + neutral,
+            positive=positive,
+            negative=negative,
+            neutral=neutral,
+            score=(
+                round(totals[_SIGNED] / totals[_CONFIDENCE], 4)
+                if totals[_CONFIDENCE] > 1e-9 else None
+            )
+        )
+
+
+# Global aggregator, seeded from the persistent article store
+sentiment_aggregates = SentimentAggregator(
+    half_life_hours=get_settings().SENTIMENT_DECAY_HALF_LIFE_HOURS
+)
+sentiment_aggregates.load(news_service.store)
+
+
+def get_sentiment_aggregates() -> SentimentAggregator:
+    """
+    Dependency injection function for FastAPI.
+
+    Returns:
+        SentimentAggregator: Per-symbol sentiment aggregates
+    """
+    return sentiment_aggregates
@@ -0,0 +1,198 @@
+"""
+Dynamic micro-batching scheduler for sentiment analysis.
+Gathers concurrent requests into one batched FinBERT forward pass run off the event loop.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.models.schemas import SentimentResult
+from app.services.sentiment_service import SentimentService, sentiment_service
+
+
+class QueueFullError(Exception):
+    """Raised when the sentiment request queue is at its maximum depth"""
+
+
+class SentimentBatcher:
+    """Asyncio request queue that feeds SentimentService.analyze_batch"""
+
+    def __init__(self, service: SentimentService):
+        self.settings = get_settings()
+        self.service = service
+        self.max_wait = self.settings.SENTIMENT_BATCH_MAX_WAIT_MS / 1000
+        self.max_batch = self.settings.SENTIMENT_BATCH_MAX_SIZE
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Requests whose batch is currently running in the executor
+        self._in_flight: list[tuple[str, asyncio.Future]] = []
+        # Single thread so forward passes never run concurrently on the model
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment")
+
+    def start(self) -> None:
+        """Start the batching worker on the running event loop"""
+        if self._worker and not self._worker.done():
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.settings.SENTIMENT_QUEUE_MAX_DEPTH)
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"Sentiment batcher started (max_batch={self.max_batch}, "
+            f"max_wait={self.max_wait * 1000:.1f}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the batching worker and fail any requests still queued or in flight"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        # The executor may still finish the running batch, but nobody will
+        # resolve its futures once the worker is gone
+        pending = self._in_flight
+        self._in_flight = []
+        if self._queue:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(Exception("Sentiment batcher stopped"))
+
+        logger.info("Sentiment batcher stopped")
+
+    async def warm_up(self, iterations: int) -> None:
+        """
+        Warm up the model on the batcher's model thread, so warm-up passes
+        never run concurrently with a batch.
+
+        Args:
+            iterations: Number of warm-up forward passes
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.service.warm_up, iterations
+        )
+
+    async def analyze(self, text: str) -> SentimentResult:
+        """
+        Queue text for the next batch and wait for its result.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            SentimentResult: Sentiment classification and confidence score
+
+        Raises:
+            QueueFullError: If the queue is at its maximum depth
+        """
+        self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((text, future))
+        except asyncio.QueueFull:
+            metrics.increment("sentiment.batcher.rejected")
+            raise QueueFullError("Sentiment queue is full")
+
+        metrics.set_gauge("sentiment.batcher.queue_depth", self._queue.qsize())
+        return await future
+
+    async def analyze_many(self, texts: list[str]) -> list[SentimentResult]:
+        """
+        Score a caller-provided list of texts, bypassing the request queue.
+        Runs one max_batch chunk at a time on the model thread so queued
+        interactive batches can interleave with large bulk jobs.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            list[SentimentResult]: Results in input order
+        """
+        loop = asyncio.get_running_loop()
+        results: list[SentimentResult] = []
+
+        for start in range(0, len(texts), self.max_batch):
+            chunk = texts[start:start + self.max_batch]
+            results.extend(await loop.run_in_executor(
+                self._executor, self.service.analyze_batch, chunk, self.max_batch
+            ))
+
+        metrics.increment("sentiment.batcher.bulk_items", len(texts))
+        return results
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future]]:
+        """
+        Wait for one request, then gather more until max_batch or max_wait.
+
+        Returns:
+            list: (text, future) pairs for the next batch
+        """
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: collect a batch, score it in the executor, resolve futures"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._collect()
+            metrics.set_gauge("sentiment.batcher.queue_depth", self._queue.qsize())
+
+            # Skip requests whose callers already went away
+            batch = [(text, future) for text, future in batch if not future.cancelled()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            self._in_flight = batch
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.service.analyze_batch, texts, self.max_batch
+                )
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                logger.error(f"Error in sentiment batch: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            self._in_flight = []
+
+            metrics.increment("sentiment.batcher.batches")
+            metrics.increment("sentiment.batcher.items", len(batch))
+
+
+# Global batcher instance (worker starts on first use)
+sentiment_batcher = SentimentBatcher(sentiment_service)
+
+
+def get_sentiment_batcher() -> SentimentBatcher:
+    """
+    Dependency injection function for FastAPI.
+
+    Returns:
+        SentimentBatcher: Sentiment micro-batching scheduler
+    """
+    return sentiment_batcher
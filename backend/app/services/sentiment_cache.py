@@ -0,0 +1,180 @@
+"""
+Content-addressed cache for sentiment results.
+Keys are a hash of the normalized text plus model name, revision and backend,
+held in a bounded in-memory LRU with an optional SQLite tier on disk.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+from app.core.logger import logger
+from app.core.metrics import metrics
+from app.models.schemas import SentimentResult
+from app.utils.cache import TTLCache
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so trivially different copies share a cache entry.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        str: Text with surrounding and repeated whitespace collapsed
+    """
+    return " ".join(text.split())
+
+
+class SentimentCache:
+    """Two-tier (memory + optional disk) cache of SentimentResult objects"""
+
+    def __init__(
+        self,
+        model_name: str,
+        model_revision: str,
+        backend: str,
+        max_entries: int,
+        ttl_seconds: Optional[float] = None,
+        db_path: Optional[str] = None
+    ):
+        # Backends can differ slightly in output, so each gets its own keys
+        self.model_key = f"{model_name}@{model_revision}/{backend}"
+        self.ttl_seconds = ttl_seconds
+        self._memory = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                    "key TEXT PRIMARY KEY, sentiment TEXT NOT NULL, "
+                    "confidence REAL NOT NULL, created_at REAL NOT NULL)"
+                )
+                self._db.commit()
+                logger.info(f"Sentiment disk cache enabled at {db_path}")
+            except Exception as e:
+                logger.error(f"Could not open sentiment disk cache: {str(e)}")
+                self._db = None
+
+    def make_key(self, text: str) -> str:
+        """
+        Build the content-addressed key for a text.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            str: SHA-256 hex digest of model key and normalized text
+        """
+        payload = f"{self.model_key}\n{normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[SentimentResult]:
+        """
+        Look up a cached result, falling back to the disk tier.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            SentimentResult or None on a miss
+        """
+        key = self.make_key(text)
+        result = self._memory.get(key)
+
+        if result is None and self._db is not None:
+            result = self._get_from_disk(key)
+            if result is not None:
+                self._memory.set(key, result)
+                metrics.increment("sentiment.cache.disk_hits")
+
+        if result is None:
+            metrics.increment("sentiment.cache.misses")
+        else:
+            metrics.increment("sentiment.cache.hits")
+        metrics.set_gauge("sentiment.cache.size", len(self._memory))
+
+        return result
+
+    def set(self, text: str, result: SentimentResult) -> None:
+        """
+        Store a result in memory and, if enabled, on disk.
+
+        Args:
+            text: Analyzed text
+            result: Sentiment result for the text
+        """
+        self.set_many([text], [result])
+
+    def set_many(self, texts: list[str], results: list[SentimentResult]) -> None:
+        """
+        Store a batch of results, writing the disk tier in one transaction.
+
+        Args:
+            texts: Analyzed texts
+            results: Sentiment result per text
+        """
+        now = time.time()
+        rows = []
+        for text, result in zip(texts, results):
+            key = self.make_key(text)
+            self._memory.set(key, result)
+            rows.append((key, result.sentiment, result.confidence, now))
+
+        if self._db is not None and rows:
+            try:
+                with self._db_lock:
+                    with self._db:
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO sentiment_cache VALUES (?, ?, ?, ?)",
+                            rows
+                        )
+            except Exception as e:
+                logger.error(f"Error writing sentiment disk cache: {str(e)}")
+
+    def _get_from_disk(self, key: str) -> Optional[SentimentResult]:
+        """Read a non-expired entry from the SQLite tier"""
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT sentiment, confidence, created_at FROM sentiment_cache WHERE key = ?",
+                    (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading sentiment disk cache: {str(e)}")
+            return None
+
+        if row is None:
+            return None
+
+        sentiment, confidence, created_at = row
+        if self.ttl_seconds and created_at + self.ttl_seconds <= time.time():
+            return None
+
+        return SentimentResult(sentiment=sentiment, confidence=confidence)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers"""
+        self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM sentiment_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Memory tier statistics and whether the disk tier is enabled
+        """
+        return {
+            **self._memory.stats(),
+            "model": self.model_key,
+            "disk_enabled": self._db is not None
+        }
@@ -1,49 +1,145 @@
 """
 Sentiment analysis service using FinBERT (ProsusAI/finbert) model.
 Analyzes financial text to determine sentiment: positive, neutral, or negative.
+
+torch and transformers are imported on first model load rather than at module
+import, so workers that never score sentiment don't pay for them at startup.
 """
 
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from typing import Optional
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
 from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import metrics
 from app.models.schemas import SentimentResult
+from app.services.sentiment_cache import SentimentCache, normalize_text
+
+if TYPE_CHECKING:
+    from transformers import PreTrainedTokenizerBase
+    from app.services.inference_backends import InferenceBackend
+
+
+# FinBERT uses: 0=positive, 1=negative, 2=neutral
+SENTIMENT_LABELS = {0: "positive", 1: "negative", 2: "neutral"}
+
+# Short representative headlines used to warm up a freshly loaded model
+WARMUP_TEXTS = [
+    "Apple's quarterly earnings exceeded expectations with strong iPhone sales.",
+    "Shares fell after the company cut its full-year guidance.",
+    "The company will report results next week.",
+]
+
+
+def fallback_result() -> SentimentResult:
+    """Neutral placeholder returned when inference fails (flagged so it is never stored)"""
+    return SentimentResult(sentiment="neutral", confidence=0.33, fallback=True)
 
 
 class SentimentService:
     """Service for sentiment analysis using FinBERT"""
     
     def __init__(self):
-        self.model_name = "ProsusAI/finbert"
-        self.tokenizer: Optional[AutoTokenizer] = None
-        self.model: Optional[AutoModelForSequenceClassification] = None
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.settings = get_settings()
+        self.model_name = self.settings.SENTIMENT_MODEL_NAME
+        self.model_revision = self.settings.SENTIMENT_MODEL_REVISION
+        self.backend_name = self.settings.SENTIMENT_BACKEND
+        self.cache = SentimentCache(
+            model_name=self.model_name,
+            model_revision=self.model_revision,
+            backend=self.backend_name,
+            max_entries=self.settings.SENTIMENT_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.settings.SENTIMENT_CACHE_TTL_SECONDS,
+            db_path=self.settings.SENTIMENT_CACHE_DB_PATH
+        )
+        # Stored with persisted results so they are ignored once the model changes
+        self.model_version = self.cache.model_key
+        self.tokenizer: Optional["PreTrainedTokenizerBase"] = None
+        self.backend: Optional["InferenceBackend"] = None
+        self.device: Optional[str] = None  # Resolved on model load
         self._model_loaded = False
+        self._load_lock = threading.Lock()
+        self.ready = False
+        self.warmup_error: Optional[str] = None  # Last warm-up failure, if any
     
     def load_model(self) -> None:
         """
         Load FinBERT model and tokenizer.
         Called lazily on first use to avoid startup delay.
         """
-        if self._model_loaded:
-            return
-        
+        # Serialize loads so warm-up and the first request don't both load
+        with self._load_lock:
+            if self._model_loaded:
+                return
+            self._load_model()
+    
+    def _load_model(self) -> None:
+        """Load tokenizer and backend (caller holds the load lock)"""
         try:
-            logger.info(f"Loading FinBERT model: {self.model_name}")
-            logger.info(f"Using device: {self.device}")
+            started = time.perf_counter()
+            
+            # Heavy ML imports deferred until the model is actually needed
+            import torch
+            from transformers import AutoTokenizer
+            from app.services.inference_backends import create_backend
+            metrics.set_gauge("sentiment.ml_import_seconds", time.perf_counter() - started)
             
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            self.model.eval()  # Set to evaluation mode
+            num_threads = self.settings.SENTIMENT_NUM_THREADS
+            if num_threads:
+                torch.set_num_threads(num_threads)
+            
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"Loading FinBERT model: {self.model_name} ({self.model_revision})")
+            logger.info(f"Using device: {self.device}, backend: {self.backend_name}")
+            
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.model_name, revision=self.model_revision
+            )
+            backend = create_backend(
+                self.backend_name,
+                device=self.device,
+                onnx_path=self.settings.SENTIMENT_ONNX_PATH,
+                num_threads=num_threads
+            )
+            backend.load(self.model_name, self.model_revision)
+            self.backend = backend
             
             self._model_loaded = True
-            logger.info("FinBERT model loaded successfully")
+            elapsed = time.perf_counter() - started
+            metrics.set_gauge("sentiment.model_load_seconds", elapsed)
+            logger.info(f"FinBERT model loaded successfully in {elapsed:.2f}s")
             
         except Exception as e:
             logger.error(f"Error loading FinBERT model: {str(e)}")
             raise Exception(f"Failed to load sentiment model: {str(e)}")
     
+    def warm_up(self, iterations: int = 3) -> None:
+        """
+        Load the model and run a few uncached inferences so the first
+        real request doesn't pay one-time initialization costs.
+        
+        Args:
+            iterations: Number of warm-up forward passes
+            
+        Raises:
+            Exception: If loading or inference fails (recorded in warmup_error)
+        """
+        try:
+            self.load_model()
+            
+            started = time.perf_counter()
+            for _ in range(iterations):
+                self._predict(WARMUP_TEXTS)
+            elapsed = time.perf_counter() - started
+        except Exception as e:
+            self.warmup_error = str(e)
+            raise
+        
+        metrics.set_gauge("sentiment.warmup_seconds", elapsed)
+        logger.info(f"FinBERT warm-up finished ({iterations} passes) in {elapsed:.2f}s")
+        self.warmup_error = None
+        self.ready = True
+    
     def analyze_sentiment(self, text: str) -> SentimentResult:
         """
         Analyze sentiment of given text.
@@ -60,69 +156,137 @@ class SentimentService:
             >>> print(result.sentiment)  # "positive"
             >>> print(result.confidence)  # 0.95
         """
+        # Serve repeated texts from cache
+        cached = self.cache.get(text)
+        if cached is not None:
+            return cached
+        
         # Ensure model is loaded
         if not self._model_loaded:
             self.load_model()
         
         try:
-            # Tokenize input text
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True
-            )
-            
-            # Move inputs to device
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            # Get predictions
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            result = self._predict([text])[0]
+            self.cache.set(text, result)
+            # A successful lazy load also makes the service ready
+            self.ready = True
             
-            # Get sentiment label and confidence
-            confidence, predicted_class = torch.max(predictions, dim=1)
+            logger.debug(f"Analyzed text: '{text[:50]}...' -> {result.sentiment} ({result.confidence:.2f})")
             
-            # Map class index to sentiment label
-            # FinBERT uses: 0=positive, 1=negative, 2=neutral
-            sentiment_map = {0: "positive", 1: "negative", 2: "neutral"}
-            sentiment = sentiment_map[predicted_class.item()]
-            confidence_score = confidence.item()
-            
-            logger.debug(f"Analyzed text: '{text[:50]}...' -> {sentiment} ({confidence_score:.2f})")
-            
-            return SentimentResult(
-                sentiment=sentiment,
-                confidence=round(confidence_score, 4)
-            )
+            return result
             
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {str(e)}")
             # Return neutral sentiment as fallback
-            return SentimentResult(
-                sentiment="neutral",
-                confidence=0.33
-            )
+            return fallback_result()
     
-    def analyze_batch(self, texts: list[str]) -> list[SentimentResult]:
+    def analyze_batch(
+        self,
+        texts: list[str],
+        batch_size: Optional[int] = None
+    ) -> list[SentimentResult]:
         """
         Analyze sentiment for multiple texts efficiently.
         
+        Cached texts are served without touching the model. Remaining
+        texts are deduplicated, sorted by length so each chunk pads to a
+        similar size, scored in chunks of `batch_size` with one forward
+        pass per chunk, and returned in the original input order.
+        
         Args:
             texts: List of texts to analyze
+            batch_size: Texts per forward pass (default: SENTIMENT_BATCH_SIZE)
             
         Returns:
-            list[SentimentResult]: List of sentiment results
+            list[SentimentResult]: List of sentiment results (fallback=True
+            for texts whose chunk failed to score)
         """
-        results = []
+        if not texts:
+            return []
+        
+        results: list[Optional[SentimentResult]] = [None] * len(texts)
         
-        for text in texts:
-            result = self.analyze_sentiment(text)
-            results.append(result)
+        # Serve cached texts; group misses by normalized text so duplicates score once
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            cached = self.cache.get(text)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(normalize_text(text), []).append(index)
+        
+        if not pending:
+            return results
+        
+        # Ensure model is loaded
+        if not self._model_loaded:
+            self.load_model()
+        
+        batch_size = batch_size or self.settings.SENTIMENT_BATCH_SIZE
+        unique_texts = sorted(pending, key=len)
+        
+        for start in range(0, len(unique_texts), batch_size):
+            chunk_texts = unique_texts[start:start + batch_size]
+            
+            started = time.perf_counter()
+            try:
+                chunk_results = self._predict(chunk_texts)
+                self.cache.set_many(chunk_texts, chunk_results)
+                # A successful lazy load also makes the service ready
+                self.ready = True
+            except Exception as e:
+                logger.error(f"Error analyzing sentiment batch: {str(e)}")
+                # Return neutral sentiment as fallback
+                chunk_results = [fallback_result() for _ in chunk_texts]
+            elapsed = time.perf_counter() - started
+            
+            metrics.observe("sentiment.batch_latency", elapsed)
+            metrics.increment("sentiment.texts_scored", len(chunk_texts))
+            logger.info(f"Scored batch of {len(chunk_texts)} texts in {elapsed * 1000:.1f}ms")
+            
+            for text, result in zip(chunk_texts, chunk_results):
+                for index in pending[text]:
+                    results[index] = result
         
         return results
+    
+    def _predict(self, texts: list[str]) -> list[SentimentResult]:
+        """
+        Run one padded forward pass over a list of texts.
+        
+        Args:
+            texts: Texts to score together
+            
+        Returns:
+            list[SentimentResult]: Results in the same order as texts
+        """
+        import torch
+        
+        # Tokenize input texts
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=512,
+            padding=True
+        )
+        
+        # Get predictions from the configured backend
+        logits = self.backend.logits(inputs)
+        predictions = torch.nn.functional.softmax(logits, dim=-1)
+        
+        # Get sentiment labels and confidences for the whole batch
+        confidences, predicted_classes = torch.max(predictions, dim=1)
+        
+        return [
+            SentimentResult(
+                sentiment=SENTIMENT_LABELS[predicted_class],
+                confidence=round(confidence, 4)
+            )
+            for confidence, predicted_class in zip(
+                confidences.tolist(), predicted_classes.tolist()
+            )
+        ]
 
 
 # Global service instance (lazy loading)
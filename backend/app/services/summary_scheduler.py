@@ -0,0 +1,194 @@
+"""
+Background precomputation of the portfolio summary.
+Periodically runs the summary pipeline off the request path and keeps the
+latest result as a versioned snapshot that /api/summary can serve directly.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import StageTimer, metrics
+from app.models.schemas import SummaryResponse
+from app.services.summary_service import SummaryService, summary_service
+from app.utils.rate_limiter import PRIORITY_BACKGROUND
+
+
+@dataclass
+class SummarySnapshot:
+    """A precomputed summary and when it was built"""
+    summary: SummaryResponse
+    version: int
+    generated_at: datetime
+    created: float
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was built"""
+        return time.monotonic() - self.created
+
+
+class SummaryScheduler:
+    """Refreshes the summary snapshot on an interval with jitter and failure backoff"""
+
+    def __init__(self, service: SummaryService):
+        self.settings = get_settings()
+        self.service = service
+        self.interval = self.settings.SUMMARY_REFRESH_INTERVAL_SECONDS
+        self.jitter = self.settings.SUMMARY_REFRESH_JITTER_SECONDS
+        self.max_backoff = self.settings.SUMMARY_REFRESH_MAX_BACKOFF_SECONDS
+        self.snapshot: Optional[SummarySnapshot] = None
+        self.failures = 0
+        self._version = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._generation = 0
+        metrics.register_collector("summary.scheduler", self.stats)
+
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop"""
+        if self._task and not self._task.done():
+            return
+
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Summary scheduler started (interval={self.interval:.0f}s, "
+            f"jitter={self.jitter:.0f}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the refresh loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Summary scheduler stopped")
+
+    async def refresh(self) -> SummarySnapshot:
+        """
+        Build a new summary and publish it as the latest snapshot.
+
+        Returns:
+            SummarySnapshot: The new snapshot (not published if invalidate()
+            was called while it was being built)
+
+        Raises:
+            Exception: If the summary pipeline fails
+        """
+        generation = self._generation
+        timer = StageTimer("summary_precompute")
+        summary = await self.service.build_summary(timer, priority=PRIORITY_BACKGROUND)
+
+        self._version += 1
+        snapshot = SummarySnapshot(
+            summary=summary,
+            version=self._version,
+            generated_at=datetime.now(timezone.utc),
+            created=time.monotonic()
+        )
+        if generation != self._generation:
+            logger.info(f"Summary snapshot v{self._version} discarded: invalidated while building")
+            return snapshot
+
+        self.snapshot = snapshot
+        metrics.increment("summary.scheduler.refreshes")
+        logger.info(f"Summary snapshot v{self._version} ready ({timer.server_timing()})")
+        return self.snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop the current snapshot (e.g. after holdings changed) and, when the
+        refresh loop is running, rebuild it now instead of at the next interval.
+        """
+        self.snapshot = None
+        self._generation += 1
+        self._wake.set()
+        logger.info("Summary snapshot invalidated")
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[SummaryResponse]:
+        """
+        Get the latest snapshot with its version and age filled in.
+
+        Args:
+            max_age: Oldest acceptable snapshot in seconds (default: SUMMARY_SNAPSHOT_MAX_AGE_SECONDS)
+
+        Returns:
+            SummaryResponse: Snapshot summary, or None if there is none recent enough
+        """
+        snapshot = self.snapshot
+        max_age = max_age if max_age is not None else self.settings.SUMMARY_SNAPSHOT_MAX_AGE_SECONDS
+
+        if snapshot is None or snapshot.age_seconds > max_age:
+            metrics.increment("summary.scheduler.snapshot_misses")
+            return None
+
+        metrics.increment("summary.scheduler.snapshot_hits")
+        return snapshot.summary.model_copy(update={
+            "snapshot_version": snapshot.version,
+            "generated_at": snapshot.generated_at,
+            "age_seconds": round(snapshot.age_seconds, 3)
+        })
+
+    async def _run(self) -> None:
+        """Refresh loop: build, then sleep for the interval (or backoff) plus jitter"""
+        while True:
+            self._wake.clear()
+            try:
+                await self.refresh()
+                self.failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                metrics.increment("summary.scheduler.failures")
+                logger.error(f"Summary precomputation failed ({self.failures} in a row): {str(e)}")
+
+            # Sleep until the next refresh is due or invalidate() asks for one
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+    def _next_delay(self) -> float:
+        """Interval after a success; exponential backoff after consecutive failures"""
+        delay = self.interval
+        if self.failures:
+            delay = min(self.interval * 2 ** self.failures, self.max_backoff)
+        return delay + random.uniform(0, self.jitter)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            dict: Snapshot version and age, consecutive failures and whether the loop runs
+        """
+        snapshot = self.snapshot
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "version": snapshot.version if snapshot else None,
+            "age_seconds": round(snapshot.age_seconds, 1) if snapshot else None,
+            "partial": snapshot.summary.partial if snapshot else None,
+            "consecutive_failures": self.failures
+        }
+
+
+# Global scheduler instance (started from the app lifespan)
+summary_scheduler = SummaryScheduler(summary_service)
+
+
+def get_summary_scheduler() -> SummaryScheduler:
+    """
+    Dependency injection function for FastAPI.
+
+    Returns:
+        SummaryScheduler: Background summary scheduler
+    """
+    return summary_scheduler
@@ -0,0 +1,437 @@
+"""
+Summary pipeline - portfolio, news and sentiment as overlapping async stages.
+News for each symbol is scored as soon as it arrives, so FinBERT inference
+runs while the remaining Finnhub fetches and the quote lookup are in flight.
+An optional deadline bounds latency by returning whatever is ready in time.
+Duplicate and near-duplicate articles are scored once per run.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.core.metrics import StageTimer, metrics
+from app.models.schemas import (
+    NewsArticle,
+    NewsWithSentiment,
+    PortfolioResponse,
+    SentimentResult,
+    SummaryResponse
+)
+from app.services.article_store import article_key
+from app.services.async_robinhood_service import AsyncRobinhoodService, async_robinhood_service
+from app.services.news_service import NewsService, news_service
+from app.services.robinhood_service import PortfolioPositions
+from app.services.sentiment_aggregates import SentimentAggregator, sentiment_aggregates
+from app.services.sentiment_batcher import SentimentBatcher, sentiment_batcher
+from app.utils.dedup import NearDuplicateIndex, minhash
+from app.utils.rate_limiter import PRIORITY_INTERACTIVE
+
+
+# Pipeline event kinds
+EVENT_PORTFOLIO = "portfolio"
+EVENT_NEWS = "news"
+EVENT_PARTIAL = "partial"
+_EVENT_SKIPPED = "skipped"
+_EVENT_ERROR = "error"
+_EVENT_DONE = "done"
+
+
+class ArticleScorer:
+    """
+    Scores articles for one pipeline run, running each story through the model once.
+    The same URL under several symbols, and near-duplicate copies of a story
+    (by MinHash of title and summary), share the representative's result.
+    """
+
+    def __init__(self, batcher: SentimentBatcher, near_duplicates: bool = True, threshold: float = 0.8):
+        """
+        Args:
+            batcher: Sentiment micro-batcher
+            near_duplicates: Also fold near-duplicate stories, not just identical URLs
+            threshold: Lowest estimated Jaccard similarity treated as the same story
+        """
+        self.batcher = batcher
+        self._scoring: dict[str, asyncio.Task] = {}
+        self._index = NearDuplicateIndex(threshold) if near_duplicates else None
+
+    async def score_many(self, articles: list[NewsArticle]) -> list[Awaitable[SentimentResult]]:
+        """
+        Get (or join) the sentiment scoring for a batch of articles.
+        MinHash signatures are computed on a worker thread so hashing a
+        symbol's articles doesn't stall the event loop.
+
+        Args:
+            articles: News articles
+
+        Returns:
+            One awaitable per article resolving to its SentimentResult
+        """
+        keys = [article_key(article) for article in articles]
+        texts = [f"{article.title}. {article.summary}" for article in articles]
+        signatures: list[Optional[tuple[int, ...]]] = [None] * len(articles)
+        if self._index is not None:
+            pending = [i for i, key in enumerate(keys) if key not in self._scoring]
+            if pending:
+                computed = await asyncio.to_thread(lambda: [minhash(texts[i]) for i in pending])
+                for i, signature in zip(pending, computed):
+                    signatures[i] = signature
+
+        return [
+            self._score(key, text, signature)
+            for key, text, signature in zip(keys, texts, signatures)
+        ]
+
+    def _score(
+        self,
+        key: str,
+        text: str,
+        signature: Optional[tuple[int, ...]]
+    ) -> Awaitable[SentimentResult]:
+        task = self._scoring.get(key)
+        if task is not None:
+            metrics.increment("summary.dedup.url_folded")
+            return asyncio.shield(task)
+
+        if signature is not None:
+            representative = self._index.find(signature)
+            if representative is not None:
+                metrics.increment("summary.dedup.near_folded")
+                task = self._scoring[key] = self._scoring[representative]
+                return asyncio.shield(task)
+
+        task = self._scoring[key] = asyncio.create_task(self.batcher.analyze(text))
+        if signature is not None:
+            self._index.add(signature, key)
+        metrics.increment("summary.dedup.scored")
+        # Shielded so one symbol giving up doesn't cancel a result other symbols share
+        return asyncio.shield(task)
+
+    def cancel(self) -> None:
+        """Cancel scoring that is still pending"""
+        for task in self._scoring.values():
+            task.cancel()
+
+
+class SummaryService:
+    """Builds the portfolio summary from concurrently running stages"""
+
+    def __init__(
+        self,
+        robinhood: AsyncRobinhoodService,
+        news: NewsService,
+        batcher: SentimentBatcher,
+        aggregates: SentimentAggregator
+    ):
+        self.settings = get_settings()
+        self.robinhood = robinhood
+        self.news = news
+        self.batcher = batcher
+        self.aggregates = aggregates
+
+    async def stream(
+        self,
+        timer: StageTimer,
+        deadline: Optional[float] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Run the pipeline and yield results as each stage produces them.
+
+        Args:
+            timer: Stage timer for this request
+            deadline: Latency budget in seconds (None: wait for everything)
+            priority: Finnhub rate limiter priority
+
+        Yields:
+            ("portfolio", PortfolioResponse) once quotes are in,
+            ("news", (symbol, list[NewsWithSentiment])) for each symbol as it is scored, and
+            ("partial", list[str]) with the skipped symbols if the budget ran out
+            or some symbols' news could not be fetched or scored
+
+        Raises:
+            asyncio.TimeoutError: If positions can't be loaded within the budget
+            Exception: If the portfolio can't be loaded
+        """
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline if deadline else None
+
+        # Positions gate everything else: they tell us which symbols to fetch
+        positions = await timer.measure(
+            "positions",
+            asyncio.wait_for(self.robinhood.get_positions(), deadline)
+        )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        scorer = ArticleScorer(
+            self.batcher,
+            near_duplicates=self.settings.NEWS_DEDUP_ENABLED,
+            threshold=self.settings.NEWS_DEDUP_THRESHOLD
+        )
+        producers = [
+            asyncio.create_task(self._produce(
+                queue, self._emit_portfolio(positions, queue, timer)
+            )),
+            asyncio.create_task(self._produce(
+                queue, self._emit_news(positions.symbols, queue, timer, scorer, priority)
+            ))
+        ]
+        portfolio_sent = False
+        completed: set[str] = set()
+        failed: set[str] = set()
+
+        try:
+            remaining = len(producers)
+            timed_out = False
+            while remaining:
+                timeout = expires_at - loop.time() if expires_at else None
+                try:
+                    kind, payload = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    break
+
+                if kind == _EVENT_DONE:
+                    remaining -= 1
+                    continue
+                if kind == _EVENT_ERROR:
+                    raise payload
+                if kind == _EVENT_SKIPPED:
+                    failed.update(payload)
+                    continue
+
+                if kind == EVENT_PORTFOLIO:
+                    portfolio_sent = True
+                else:
+                    completed.add(payload[0])
+                yield kind, payload
+
+            if timed_out:
+                # Out of budget: fall back to last known quotes and drop unfinished symbols
+                if not portfolio_sent:
+                    yield EVENT_PORTFOLIO, self._last_known_portfolio(positions)
+
+                skipped = [symbol for symbol in positions.symbols if symbol not in completed]
+                logger.warning(
+                    f"Summary deadline of {deadline:.1f}s reached "
+                    f"(fresh quotes: {portfolio_sent}, skipped: {skipped})"
+                )
+            else:
+                skipped = [symbol for symbol in positions.symbols if symbol in failed]
+
+            if skipped or timed_out:
+                metrics.increment("summary.partial")
+                yield EVENT_PARTIAL, skipped
+        finally:
+            # Shared fetches keep running in their caches; only this request's work stops
+            for producer in producers:
+                producer.cancel()
+            scorer.cancel()
+
+    async def build_summary(
+        self,
+        timer: StageTimer,
+        deadline: Optional[float] = None,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> SummaryResponse:
+        """
+        Run the pipeline to completion (or the deadline) and assemble the summary.
+
+        Args:
+            timer: Stage timer for this request
+            deadline: Latency budget in seconds (None: wait for everything)
+            priority: Finnhub rate limiter priority
+
+        Returns:
+            SummaryResponse: Combined portfolio and news with sentiment
+        """
+        portfolio = None
+        news_by_symbol: dict[str, list[NewsWithSentiment]] = {}
+        skipped: Optional[list[str]] = None
+
+        async for kind, payload in self.stream(timer, deadline, priority):
+            if kind == EVENT_PORTFOLIO:
+                portfolio = payload
+            elif kind == EVENT_PARTIAL:
+                skipped = payload
+            else:
+                symbol, items = payload
+                news_by_symbol[symbol] = items
+
+        # Keep news in holdings order regardless of completion order
+        news = [
+            item
+            for holding in portfolio.holdings
+            for item in news_by_symbol.get(holding.symbol, [])
+        ]
+        timer.finish()
+
+        logger.info(
+            f"Summary built: {len(portfolio.holdings)} holdings, {len(news)} articles "
+            f"({timer.server_timing()})"
+        )
+        return SummaryResponse(
+            portfolio=portfolio,
+            news=news,
+            partial=skipped is not None,
+            skipped_symbols=skipped or []
+        )
+
+    async def _produce(self, queue: asyncio.Queue, work: Awaitable[None]) -> None:
+        """Run one producer, forwarding its failure and always signalling completion"""
+        try:
+            await work
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put((_EVENT_ERROR, e))
+        finally:
+            queue.put_nowait((_EVENT_DONE, None))
+
+    def _last_known_portfolio(self, positions: PortfolioPositions) -> PortfolioResponse:
+        """Build the portfolio from the last quotes seen instead of fetching new ones"""
+        return self.robinhood.service.build_portfolio(
+            positions,
+            {
+                symbol: self.robinhood.last_prices[symbol]
+                for symbol in positions.symbols
+                if symbol in self.robinhood.last_prices
+            }
+        )
+
+    async def _emit_portfolio(
+        self,
+        positions: PortfolioPositions,
+        queue: asyncio.Queue,
+        timer: StageTimer
+    ) -> None:
+        """Fetch quotes and emit the finished portfolio (last known quotes if the fetch fails)"""
+        try:
+            prices = await timer.measure("quotes", self.robinhood.get_latest_prices(positions.symbols))
+            portfolio: PortfolioResponse = self.robinhood.service.build_portfolio(positions, prices)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            metrics.increment("summary.quote_fallbacks")
+            logger.error(f"Error fetching quotes, using last known prices: {str(e)}")
+            portfolio = self._last_known_portfolio(positions)
+        await queue.put((EVENT_PORTFOLIO, portfolio))
+
+    async def _emit_news(
+        self,
+        symbols: list[str],
+        queue: asyncio.Queue,
+        timer: StageTimer,
+        scorer: ArticleScorer,
+        priority: int = PRIORITY_INTERACTIVE
+    ) -> None:
+        """
+        Fetch news per symbol and hand each symbol to sentiment scoring as it arrives.
+        If the fetch fails, symbols whose news never arrived are reported as skipped.
+        """
+        scoring = []
+        arrived: set[str] = set()
+
+        try:
+            timer.start("news")
+            try:
+                async for symbol, articles in self.news.iter_company_news(symbols, priority=priority):
+                    arrived.add(symbol)
+                    if not articles:
+                        await queue.put((EVENT_NEWS, (symbol, [])))
+                        continue
+
+                    timer.start("sentiment")
+                    scoring.append(asyncio.create_task(
+                        self._score_symbol(symbol, articles, queue, scorer)
+                    ))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error fetching news for summary: {str(e)}")
+                await queue.put((_EVENT_SKIPPED, [s for s in symbols if s not in arrived]))
+            timer.stop("news")
+
+            await asyncio.gather(*scoring)
+            timer.stop("sentiment")
+        finally:
+            for task in scoring:
+                task.cancel()
+
+    async def _score_symbol(
+        self,
+        symbol: str,
+        articles: list[NewsArticle],
+        queue: asyncio.Queue,
+        scorer: ArticleScorer
+    ) -> None:
+        """Score one symbol's articles (duplicates folded) and emit them, or report it skipped"""
+        try:
+            items = await self._scored_items(articles, scorer)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            metrics.increment("summary.symbol_failures")
+            logger.error(f"Error scoring news for {symbol}: {str(e)}")
+            await queue.put((_EVENT_SKIPPED, [symbol]))
+            return
+
+        await queue.put((EVENT_NEWS, (symbol, items)))
+
+    async def _scored_items(
+        self,
+        articles: list[NewsArticle],
+        scorer: ArticleScorer
+    ) -> list[NewsWithSentiment]:
+        """Attach sentiment to articles, reusing stored results for this model"""
+        store = self.news.store
+        model_version = self.batcher.service.model_version
+        # Store reads and writes are blocking SQLite calls; keep them off the loop
+        results = await asyncio.to_thread(store.get_sentiments, articles, model_version)
+        unscored = [i for i, result in enumerate(results) if result is None]
+        metrics.increment("summary.sentiment_reused", len(articles) - len(unscored))
+
+        # Only articles that were never scored (by this model) go to the model
+        scored = await asyncio.gather(*await scorer.score_many([articles[i] for i in unscored]))
+        await asyncio.to_thread(
+            store.set_sentiments, [articles[i] for i in unscored], scored, model_version
+        )
+        for i, result in zip(unscored, scored):
+            results[i] = result
+
+        # Stored results may come from another symbol's fetch of the same story,
+        # so every article counts toward this symbol (re-adding replaces it)
+        self.aggregates.add_many(articles, results)
+
+        return [
+            NewsWithSentiment(
+                symbol=article.symbol,
+                title=article.title,
+                summary=article.summary,
+                source=article.source,
+                url=article.url,
+                published_at=article.published_at,
+                sentiment=result.sentiment,
+                confidence=result.confidence
+            )
+            for article, result in zip(articles, results)
+        ]
+
+
+# Global summary service instance
+summary_service = SummaryService(
+    async_robinhood_service,
+    news_service,
+    sentiment_batcher,
+    sentiment_aggregates
+)
+
+
+def get_summary_service() -> SummaryService:
+    """
+    Dependency injection function for FastAPI.
+
+    Returns:
+        SummaryService: Summary pipeline service
+    """
+    return summary_service
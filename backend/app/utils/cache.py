@@ -0,0 +1,221 @@
+"""
+In-memory cache utilities.
+Provides a bounded, thread-safe LRU cache with optional per-entry time-to-live,
+and an async stale-while-revalidate cache that coalesces concurrent misses.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from app.core.metrics import metrics
+
+
+class TTLCache:
+    """Thread-safe LRU cache with a maximum size and optional TTL"""
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+            ttl_seconds: Default entry lifetime in seconds (None: never expires)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Entry lifetime override (default: cache TTL)
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Size, hits, misses and evictions
+        """
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class CoalescingCache:
+    """
+    Async cache with stale-while-revalidate and request coalescing.
+    Concurrent misses for the same key share a single upstream fetch.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        name: str = "cache"
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+            ttl_seconds: Default time an entry is served as fresh
+            stale_seconds: Extra time an expired entry may be served while it refreshes
+            name: Metrics prefix for hit/miss/stale counters
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.name = name
+        # Entries live for ttl + stale window; freshness is tracked per entry
+        self._entries = TTLCache(max_entries=max_entries)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        Return a cached value, refreshing or fetching it as needed.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine factory that loads the value from upstream
+            ttl_seconds: Freshness override for this entry
+
+        Returns:
+            Cached or freshly fetched value
+
+        Raises:
+            Exception: Whatever fetch raises when there is no usable cached value
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None:
+            value, fresh_until = entry
+            if now < fresh_until:
+                metrics.increment(f"{self.name}.hits")
+                return value
+
+            # Serve stale value and revalidate in the background
+            metrics.increment(f"{self.name}.stale_hits")
+            self._start_fetch(key, fetch, ttl)
+            return value
+
+        metrics.increment(f"{self.name}.misses")
+        return await asyncio.shield(self._start_fetch(key, fetch, ttl))
+
+    def _start_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float
+    ) -> asyncio.Task:
+        """Start (or join) the single in-flight fetch for a key"""
+        task = self._inflight.get(key)
+        if task is not None:
+            metrics.increment(f"{self.name}.coalesced")
+            return task
+
+        async def run() -> Any:
+            try:
+                value = await fetch()
+                self._entries.set(
+                    key,
+                    (value, time.monotonic() + ttl),
+                    ttl_seconds=ttl + self.stale_seconds
+                )
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        # Background revalidations may have no awaiter; don't log their errors as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return task
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one entry, or everything when no key is given.
+
+        Args:
+            key: Cache key to drop (default: all)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.delete(key)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Size, LRU statistics and number of in-flight fetches
+        """
+        return {**self._entries.stats(), "inflight": len(self._inflight)}
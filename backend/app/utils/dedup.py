@@ -0,0 +1,110 @@
+"""
+Near-duplicate text detection with MinHash signatures and LSH banding.
+Syndicated stories re-published by several sources share almost all of
+their words, so their estimated Jaccard similarity stays close to 1.
+"""
+
+import hashlib
+import random
+import re
+from typing import Hashable, Optional
+
+
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+_ROWS_PER_BAND = NUM_PERMUTATIONS // LSH_BANDS
+_WORD_RE = re.compile(r"\w+")
+
+# Each shingle is hashed once; permutation i is hash XOR mask i, which is
+# far cheaper in Python than 64 modular multiplications per shingle.
+# Fixed seed: signatures must be comparable across runs and processes
+_rng = random.Random(1234)
+_MASKS = [_rng.getrandbits(64) for _ in range(NUM_PERMUTATIONS)]
+
+
+def shingles(text: str) -> set[str]:
+    """
+    Word unigrams and bigrams of lower-cased text.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        set[str]: Shingle set
+    """
+    words = _WORD_RE.findall(text.lower())
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def minhash(text: str) -> tuple[int, ...]:
+    """
+    Compute a MinHash signature of a text's shingles.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        tuple[int, ...]: NUM_PERMUTATIONS minimum hash values
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles(text)
+    ]
+    if not hashes:
+        return (0,) * NUM_PERMUTATIONS
+
+    return tuple(min(value ^ mask for value in hashes) for mask in _MASKS)
+
+
+def estimated_similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERMUTATIONS
+
+
+class NearDuplicateIndex:
+    """
+    Finds a previously added signature above a similarity threshold.
+    Signatures are split into LSH_BANDS bands; only entries that agree exactly
+    on at least one band are compared, so lookups stay cheap as the index grows.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        """
+        Args:
+            threshold: Lowest estimated Jaccard similarity treated as a duplicate
+        """
+        self.threshold = threshold
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[tuple[tuple[int, ...], Hashable]]] = {}
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (band, signature[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND])
+            for band in range(LSH_BANDS)
+        ]
+
+    def find(self, signature: tuple[int, ...]) -> Optional[Hashable]:
+        """
+        Look up a near-duplicate.
+
+        Args:
+            signature: MinHash signature
+
+        Returns:
+            Key of the first stored signature at or above the threshold, or None
+        """
+        for band in self._bands(signature):
+            for candidate, key in self._buckets.get(band, []):
+                if estimated_similarity(candidate, signature) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, signature: tuple[int, ...], key: Hashable) -> None:
+        """
+        Store a signature.
+
+        Args:
+            signature: MinHash signature
+            key: Value returned by find() for near-duplicates of it
+        """
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append((signature, key))
@@ -0,0 +1,123 @@
+"""
+Async token-bucket rate limiter with priority queueing.
+Used to keep upstream API calls within a per-minute quota.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Optional
+
+
+# Lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+
+class AsyncTokenBucket:
+    """Token bucket that hands out tokens to waiters in priority order"""
+
+    def __init__(self, rate_per_minute: float, capacity: int):
+        """
+        Args:
+            rate_per_minute: Sustained number of calls allowed per minute
+            capacity: Maximum burst size (bucket size)
+
+        Raises:
+            ValueError: If the rate isn't positive or the capacity is below 1
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def remaining(self) -> float:
+        """Tokens currently available"""
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a token"""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        Wait for a token. Higher-priority (lower value) callers go first,
+        callers of equal priority are served in arrival order.
+
+        Args:
+            priority: Queue priority (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, ...)
+        """
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+        await future
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while (e.g. after an upstream 429).
+
+        Args:
+            seconds: How long to pause from now
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill"""
+        now = time.monotonic()
+        if now >= self._paused_until:
+            elapsed = now - max(self._updated, self._paused_until)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _dispatch(self) -> None:
+        """Grant tokens to queued waiters and schedule the next wake-up"""
+        self._refill()
+
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # Caller was cancelled while waiting
+            self._tokens -= 1
+            future.set_result(None)
+
+        # Drop cancelled waiters at the head of the queue
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+        if self._waiters and self._timer is None:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, 0.0) + (1 - self._tokens) / self.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def stats(self) -> dict[str, float]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            dict: Remaining tokens, capacity, queued callers and pause time left
+        """
+        return {
+            "remaining": round(self.remaining, 2),
+            "capacity": self.capacity,
+            "rate_per_minute": self.rate * 60,
+            "waiting": self.waiting,
+            "paused_seconds": round(max(self._paused_until - time.monotonic(), 0.0), 2)
+        }
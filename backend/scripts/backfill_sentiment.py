@@ -0,0 +1,458 @@
+"""
+Offline sentiment backfill for large text corpora.
+Streams a JSONL or CSV file of texts through SentimentService in a pool of
+worker processes and writes results incrementally to JSONL or Parquet,
+checkpointing progress so an interrupted run resumes where it stopped.
+
+Usage (from the backend/ directory):
+    python -m scripts.backfill_sentiment archive.jsonl scores.jsonl --workers 8
+    python -m scripts.backfill_sentiment archive.csv scores.parquet --text-field headline
+
+Parquet output is a directory of part files and needs pyarrow installed.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Iterator, Optional
+from app.core.logger import logger
+from app.core.config import get_settings
+
+
+# One input record: (position in the input, client id, text)
+Record = tuple[int, Optional[str], str]
+
+# A record with the input byte offset just past it (where a resume would seek to)
+PositionedRecord = tuple[Record, int]
+
+# Per-process service, created by _init_worker
+_service = None
+_batch_size: Optional[int] = None
+
+
+def _init_worker(env: dict[str, str], batch_size: int) -> None:
+    """
+    Configure a worker process and load its own copy of the model.
+    Environment overrides are applied before app settings are first read.
+    """
+    global _service, _batch_size
+    os.environ.update(env)
+
+    from app.services.sentiment_service import SentimentService
+
+    _service = SentimentService()
+    _service.load_model()
+    _batch_size = batch_size
+
+
+def _score_chunk(records: list[Record]) -> list[dict[str, Any]]:
+    """
+    Score one chunk of records in a worker process.
+
+    Raises:
+        RuntimeError: If inference failed for any record (analyze_batch returned
+            fallback placeholders), so the run stops before the checkpoint moves past it
+    """
+    results = _service.analyze_batch([text for _, _, text in records], _batch_size)
+    failed = [index for (index, _, _), result in zip(records, results) if result.fallback]
+    if failed:
+        raise RuntimeError(
+            f"Inference failed for {len(failed)} records starting at record {failed[0]}"
+        )
+    return [
+        {
+            "index": index,
+            "id": record_id,
+            "sentiment": result.sentiment,
+            "confidence": result.confidence,
+            "model_version": _service.model_version
+        }
+        for (index, record_id, _), result in zip(records, results)
+    ]
+
+
+class InputReader:
+    """
+    Streams records from a JSONL or CSV file, skipping rows without text.
+    Tracks the byte offset after each record so a resume can seek past
+    everything already processed instead of re-parsing it.
+    """
+
+    def __init__(self, path: str, input_format: str, text_field: str, id_field: str):
+        self.path = path
+        self.input_format = input_format
+        self.text_field = text_field
+        self.id_field = id_field
+        self.skipped = 0
+        self._position = 0
+
+    def _lines(self, handle) -> Iterator[str]:
+        """Decoded lines of a binary handle, counting the bytes consumed"""
+        for line in handle:
+            self._position += len(line)
+            yield line.decode("utf-8")
+
+    def _json_rows(self, lines: Iterator[str]) -> Iterator[Optional[dict[str, Any]]]:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = None
+            yield row if isinstance(row, dict) else None
+
+    def records(self, start: int = 0, offset: int = 0) -> Iterator[PositionedRecord]:
+        """
+        Iterate records in input order.
+
+        Args:
+            start: Index of the first record to read (records already processed)
+            offset: Byte offset of that record in the file (from a checkpoint)
+
+        Yields:
+            PositionedRecord: ((index, id, text), end offset) for every row with a non-empty text
+        """
+        with open(self.path, "rb") as handle:
+            lines = self._lines(handle)
+
+            if self.input_format == "csv":
+                # The header is always read from the top, then the reader jumps ahead
+                reader = csv.reader(lines)
+                header = next(reader, [])
+                if offset > self._position:
+                    handle.seek(offset)
+                    self._position = offset
+                rows = (dict(zip(header, row)) for row in reader)
+            else:
+                handle.seek(offset)
+                self._position = offset
+                rows = self._json_rows(lines)
+
+            for index, row in enumerate(rows, start):
+                text = row.get(self.text_field) if row else None
+                if not isinstance(text, str) or not text.strip():
+                    self.skipped += 1
+                    if self.skipped <= 10:
+                        logger.warning(f"Skipping record {index}: missing or empty '{self.text_field}'")
+                    continue
+
+                record_id = row.get(self.id_field)
+                record = (index, str(record_id) if record_id is not None else None, text)
+                yield record, self._position
+
+
+class JsonlWriter:
+    """Appends result rows to a JSONL file; every write is durable"""
+
+    def __init__(self, path: str, state: Optional[dict[str, Any]]):
+        # Drop anything written after the last checkpoint
+        offset = state["offset"] if state else 0
+        mode = "r+b" if os.path.exists(path) else "wb"
+        with open(path, mode) as handle:
+            handle.truncate(offset)
+        self.offset = offset
+        self._handle = open(path, "ab")
+
+    def write(self, rows: list[dict[str, Any]]) -> bool:
+        """
+        Write rows and sync them to disk.
+
+        Returns:
+            bool: True (rows are always persisted before returning)
+        """
+        data = "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+        self._handle.write(data)
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self.offset += len(data)
+        return True
+
+    def state(self) -> dict[str, Any]:
+        return {"offset": self.offset}
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class ParquetWriter:
+    """Buffers result rows and writes them as numbered Parquet part files"""
+
+    def __init__(self, path: str, state: Optional[dict[str, Any]], rows_per_file: int):
+        # Optional dependency, only needed for Parquet output
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.schema = pa.schema([
+            ("index", pa.int64()),
+            ("id", pa.string()),
+            ("sentiment", pa.string()),
+            ("confidence", pa.float64()),
+            ("model_version", pa.string())
+        ])
+        self.path = path
+        self.rows_per_file = rows_per_file
+        self.parts = state["parts"] if state else 0
+        self._buffer: list[dict[str, Any]] = []
+
+        # Remove parts and temp files written after the last checkpoint
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            stale = name.endswith(".tmp") or (
+                name.startswith("part-") and name.endswith(".parquet")
+                and int(name[5:10]) >= self.parts
+            )
+            if stale:
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows: list[dict[str, Any]]) -> bool:
+        """
+        Buffer rows, writing a part file once enough have accumulated.
+
+        Returns:
+            bool: True if every row written so far is persisted
+        """
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.rows_per_file:
+            self._flush()
+        return not self._buffer
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        final = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+        table = self._pa.Table.from_pylist(self._buffer, schema=self.schema)
+        self._pq.write_table(table, final + ".tmp")
+        os.replace(final + ".tmp", final)
+
+        self.parts += 1
+        self._buffer = []
+
+    def state(self) -> dict[str, Any]:
+        return {"parts": self.parts}
+
+    def close(self) -> None:
+        self._flush()
+
+
+class Checkpoint:
+    """Progress file recording how many input records are safely in the output"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Write atomically so a crash never leaves a torn checkpoint"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump({**state, "updated_at": time.time()}, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, self.path)
+
+
+def _chunks(records: Iterator[PositionedRecord], size: int) -> Iterator[list[PositionedRecord]]:
+    chunk: list[PositionedRecord] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _detect_format(path: str, choices: tuple[str, ...]) -> str:
+    extension = os.path.splitext(path.rstrip("/"))[1].lower().lstrip(".")
+    extension = {"ndjson": "jsonl"}.get(extension, extension)
+    if extension not in choices:
+        raise ValueError(f"Cannot infer format of '{path}'; pass one of {list(choices)} explicitly")
+    return extension
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Run the backfill.
+
+    Returns:
+        int: Process exit code
+    """
+    input_format = args.input_format or _detect_format(args.input, ("jsonl", "csv"))
+    output_format = args.output_format or _detect_format(args.output, ("jsonl", "parquet"))
+    checkpoint = Checkpoint(args.checkpoint or f"{args.output.rstrip('/')}.checkpoint.json")
+
+    previous = None if args.restart else checkpoint.load()
+    if previous and previous["input"] != os.path.abspath(args.input):
+        logger.error(
+            f"Checkpoint {checkpoint.path} belongs to {previous['input']}; "
+            f"use --restart or a different --checkpoint"
+        )
+        return 1
+    if previous and previous.get("complete"):
+        logger.info(f"Backfill already complete ({previous['records']} records), nothing to do")
+        return 0
+
+    done = previous["records"] if previous else 0
+    input_offset = previous["input_offset"] if previous else 0
+    writer_state = previous["writer"] if previous else None
+    if output_format == "parquet":
+        writer = ParquetWriter(args.output, writer_state, args.parquet_rows)
+    else:
+        writer = JsonlWriter(args.output, writer_state)
+
+    workers = args.workers
+    threads = args.threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+    env = {
+        "SENTIMENT_NUM_THREADS": str(threads),
+        "OMP_NUM_THREADS": str(threads),
+        "MKL_NUM_THREADS": str(threads),
+        "TOKENIZERS_PARALLELISM": "false",
+        # Keep the in-memory cache for repeated headlines, but not the shared disk tier
+        "SENTIMENT_CACHE_DB_PATH": ""
+    }
+    if args.model:
+        env["SENTIMENT_MODEL_NAME"] = args.model
+    if args.backend:
+        env["SENTIMENT_BACKEND"] = args.backend
+
+    reader = InputReader(args.input, input_format, args.text_field, args.id_field)
+    logger.info(
+        f"Backfilling {args.input} -> {args.output} ({output_format}) with {workers} workers "
+        f"x {threads} threads, resuming at record {done}"
+    )
+
+    def save(records: int, offset: int, complete: bool = False) -> None:
+        checkpoint.save({
+            "input": os.path.abspath(args.input),
+            "output": os.path.abspath(args.output),
+            "records": records,
+            "input_offset": offset,
+            "writer": writer.state(),
+            "complete": complete
+        })
+
+    started = time.perf_counter()
+    scored = 0
+    last_report = started
+    position = done
+    offset = input_offset
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            # spawn: each worker builds its own model instead of inheriting torch state
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(env, args.batch_size)
+        ) as pool:
+            # Futures are drained in submission order, so output keeps input order
+            in_flight: deque = deque()
+
+            def drain_one() -> None:
+                nonlocal scored, position, offset, last_report
+                end, end_offset, future = in_flight.popleft()
+                rows = future.result()
+                scored += len(rows)
+                position, offset = end, end_offset
+                if writer.write(rows):
+                    save(position, offset)
+
+                now = time.perf_counter()
+                if now - last_report >= args.report_seconds:
+                    last_report = now
+                    logger.info(
+                        f"Backfill at record {position}: {scored} scored, "
+                        f"{scored / (now - started):.1f} texts/s"
+                    )
+
+            for chunk in _chunks(reader.records(done, input_offset), args.chunk_size):
+                (last_index, _, _), end_offset = chunk[-1]
+                records = [record for record, _ in chunk]
+                in_flight.append((last_index + 1, end_offset, pool.submit(_score_chunk, records)))
+                if len(in_flight) >= workers * 2:
+                    drain_one()
+
+            while in_flight:
+                drain_one()
+
+        writer.close()
+        save(position, offset, complete=True)
+
+    except KeyboardInterrupt:
+        logger.warning("Backfill interrupted; rerun the same command to resume")
+        return 130
+    except Exception as e:
+        logger.error(
+            f"Backfill failed after record {position}: {str(e)}; "
+            f"rerun the same command to resume from the checkpoint"
+        )
+        return 1
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Backfill complete: {scored} texts scored in {elapsed:.1f}s "
+        f"({scored / max(elapsed, 1e-9):.1f} texts/s), {reader.skipped} records skipped"
+    )
+    return 0
+
+
+def main() -> int:
+    """
+    Parse arguments and run the backfill.
+
+    Returns:
+        int: Process exit code (0 on success)
+    """
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="JSONL or CSV file of texts")
+    parser.add_argument("output", help="JSONL file or Parquet directory for results")
+    parser.add_argument("--input-format", choices=["jsonl", "csv"], help="Default: from the file extension")
+    parser.add_argument("--output-format", choices=["jsonl", "parquet"], help="Default: from the file extension")
+    parser.add_argument("--text-field", default="text", help="Field holding the text to score")
+    parser.add_argument("--id-field", default="id", help="Field copied to the output as id")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument(
+        "--threads-per-worker", type=int,
+        help="Inference threads per worker (default: cores / workers)"
+    )
+    parser.add_argument("--model", help="Model name or path (default: SENTIMENT_MODEL_NAME)")
+    parser.add_argument(
+        "--backend", choices=["pytorch", "quantized", "onnx"],
+        help="Inference backend (default: SENTIMENT_BACKEND)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.SENTIMENT_BATCH_SIZE,
+        help="Texts per forward pass"
+    )
+    parser.add_argument("--chunk-size", type=int, default=512, help="Texts sent to a worker at a time")
+    parser.add_argument("--parquet-rows", type=int, default=100_000, help="Rows per Parquet part file")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore any checkpoint and start over")
+    parser.add_argument("--report-seconds", type=float, default=30.0, help="Progress log interval")
+    args = parser.parse_args()
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be positive")
+
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Cold-start import benchmark for the API.
+Imports the application in a fresh interpreter with `-X importtime`, reports
+cumulative import time per app module, and fails when the budget is exceeded
+or when heavy ML libraries get imported at startup.
+
+Usage (from the backend/ directory):
+    python -m scripts.benchmark_startup --budget 1.5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+# Libraries that must only be imported on first sentiment use
+HEAVY_MODULES = ("torch", "transformers")
+
+
+def measure_imports(target: str) -> dict[str, float]:
+    """
+    Import a module in a fresh interpreter and collect import times.
+
+    Args:
+        target: Module to import (e.g. "app.main")
+
+    Returns:
+        dict[str, float]: Cumulative import time in seconds per module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "PYTHONWARNINGS": "ignore"}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented module>"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = int(cumulative) / 1_000_000
+
+    return timings
+
+
+def main() -> int:
+    """
+    Run the benchmark and check it against the budget.
+
+    Returns:
+        int: Process exit code (0 when within budget)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="app.main", help="Module to import")
+    parser.add_argument(
+        "--budget", type=float, default=2.0,
+        help="Maximum cumulative import time of the target in seconds"
+    )
+    args = parser.parse_args()
+
+    timings = measure_imports(args.target)
+
+    print(f"{'module':<45} {'cumulative':>10}")
+    for module, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        if module.startswith("app.") or module.split(".")[0] in HEAVY_MODULES:
+            print(f"{module:<45} {seconds * 1000:>8.1f}ms")
+
+    failures = []
+    total = timings.get(args.target, 0.0)
+    if total > args.budget:
+        failures.append(f"{args.target} took {total:.2f}s (budget {args.budget:.2f}s)")
+
+    for heavy in HEAVY_MODULES:
+        if heavy in timings:
+            failures.append(f"{heavy} is imported at startup")
+
+    print(f"\nTotal: {total:.2f}s (budget {args.budget:.2f}s)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Check that all sentiment inference backends agree on a fixed fixture set.
+Loads the configured model through each backend and compares predicted labels.
+
+Usage (from the backend/ directory):
+    python -m scripts.check_backend_agreement
+"""
+
+import sys
+import time
+from app.core.logger import logger
+from app.core.config import get_settings
+from app.services.sentiment_service import SentimentService
+from app.services.inference_backends import BACKENDS
+
+
+# Fixed fixture set covering clearly positive, negative and neutral headlines
+FIXTURE_TEXTS = [
+    "Apple's quarterly earnings exceeded expectations with strong iPhone sales.",
+    "Tesla shares plunged after the company missed delivery estimates.",
+    "Microsoft will report fiscal second-quarter results on Tuesday.",
+    "Amazon raised its full-year revenue guidance on robust cloud demand.",
+    "The bank warned of rising loan losses and cut its dividend.",
+    "The company announced the appointment of a new board member.",
+    "Nvidia stock hit a record high as data center revenue doubled.",
+    "Regulators opened an investigation into the firm's accounting practices.",
+    "Shares were little changed in early trading.",
+    "Operating margin contracted sharply due to higher input costs.",
+]
+
+
+def run_backend(backend_name: str) -> list[str]:
+    """
+    Score the fixtures with one backend, bypassing the result cache.
+
+    Args:
+        backend_name: Backend to load
+
+    Returns:
+        list[str]: Predicted labels in fixture order
+    """
+    service = SentimentService()
+    service.backend_name = backend_name
+    service.load_model()
+
+    started = time.perf_counter()
+    results = service._predict(FIXTURE_TEXTS)
+    elapsed = time.perf_counter() - started
+    logger.info(f"[{backend_name}] scored {len(FIXTURE_TEXTS)} fixtures in {elapsed * 1000:.1f}ms")
+
+    return [result.sentiment for result in results]
+
+
+def main() -> int:
+    """
+    Compare every backend against the eager PyTorch reference.
+
+    Returns:
+        int: Process exit code (0 when all labels agree)
+    """
+    settings = get_settings()
+    logger.info(f"Checking backend agreement for {settings.SENTIMENT_MODEL_NAME}")
+
+    labels = {name: run_backend(name) for name in BACKENDS}
+    reference = labels["pytorch"]
+    mismatches = 0
+
+    for name, predicted in labels.items():
+        for text, expected, actual in zip(FIXTURE_TEXTS, reference, predicted):
+            if expected != actual:
+                mismatches += 1
+                logger.error(f"[{name}] '{text[:50]}...': expected {expected}, got {actual}")
+
+    if mismatches:
+        logger.error(f"Backend agreement check failed with {mismatches} mismatches")
+        return 1
+
+    logger.info(f"All backends agree on {len(FIXTURE_TEXTS)} fixtures")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
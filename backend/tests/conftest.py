@@ -0,0 +1,85 @@
+"""
+Shared test setup.
+Settings are read (and SQLite stores opened) when app modules are imported,
+so the environment points them at a scratch directory before any import.
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+
+import httpx
+import pytest
+
+_scratch = tempfile.mkdtemp(prefix="stockwise-tests-")
+os.environ["NEWS_STORE_DB_PATH"] = os.path.join(_scratch, "news_articles.sqlite3")
+os.environ["ROBINHOOD_INSTRUMENT_DB_PATH"] = os.path.join(_scratch, "robinhood_instruments.sqlite3")
+os.environ["SENTIMENT_PRELOAD"] = "false"
+os.environ["SUMMARY_PRECOMPUTE_ENABLED"] = "false"
+
+
+class FakeFinnhub:
+    """In-process Finnhub: records requests and serves canned company news by date"""
+
+    def __init__(self):
+        self.stories: dict[str, list[dict]] = {}
+        self.requests: list[httpx.Request] = []
+        self.failing: set[str] = set()
+        self.delays: dict[str, float] = {}
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        symbol = request.url.params.get("symbol")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(symbol, 0))
+        finally:
+            self.active -= 1
+
+        if symbol in self.failing:
+            return httpx.Response(500, json={"error": "upstream"})
+
+        from_day = request.url.params.get("from", "0000-00-00")
+        return httpx.Response(200, json=[
+            item for item in self.stories.get(symbol, [])
+            if datetime.fromtimestamp(item["datetime"]).strftime("%Y-%m-%d") >= from_day
+        ])
+
+    def add(self, symbol: str, headline: str, published: datetime, url: str = "") -> None:
+        """Publish a story for a symbol"""
+        self.stories.setdefault(symbol, []).append({
+            "headline": headline,
+            "summary": f"{headline} ({symbol})",
+            "source": "Wire",
+            "url": url or f"https://news.example/{symbol}/{headline.replace(' ', '-')}",
+            "datetime": int(published.timestamp())
+        })
+
+    def symbols_requested(self) -> list[str]:
+        return [request.url.params.get("symbol") for request in self.requests]
+
+
+@pytest.fixture
+def finnhub() -> FakeFinnhub:
+    return FakeFinnhub()
+
+
+@pytest.fixture
+def news_service(finnhub):
+    """NewsService wired to the fake Finnhub, a fresh in-memory store and an unthrottled limiter"""
+    from app.services.article_store import ArticleStore
+    from app.services.news_service import NewsService
+    from app.utils.rate_limiter import AsyncTokenBucket
+
+    service = NewsService()
+    service.store = ArticleStore()
+    service.limiter = AsyncTokenBucket(rate_per_minute=60000, capacity=1000)
+    service._client = httpx.AsyncClient(
+        base_url=service.base_url,
+        transport=httpx.MockTransport(finnhub.handle)
+    )
+    return service
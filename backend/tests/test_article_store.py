@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.models.schemas import NewsArticle, SentimentResult
+from app.services.article_store import ArticleStore
+from app.services.sentiment_service import fallback_result
+
+NOW = datetime.now().replace(microsecond=0)
+TODAY = NOW.strftime("%Y-%m-%d")
+
+
+def day(offset: int) -> str:
+    return (NOW + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def article(symbol: str, title: str, published: datetime, url: str = "") -> NewsArticle:
+    return NewsArticle(
+        symbol=symbol,
+        title=title,
+        summary=f"{title} summary",
+        source="Wire",
+        url=url or f"https://news.example/{symbol}/{title.replace(' ', '-')}",
+        published_at=published
+    )
+
+
+def test_fetch_window_asks_for_the_full_range_first():
+    store = ArticleStore()
+
+    assert store.fetch_window("AAA", day(-30), TODAY) == day(-30)
+
+
+def test_fetch_window_starts_at_the_high_water_day_once_covered():
+    store = ArticleStore()
+    store.merge("AAA", day(-30), [article("AAA", "old", NOW - timedelta(days=3))])
+
+    assert store.fetch_window("AAA", day(-30), TODAY) == day(-3)
+    # Asking further back than what was covered needs the full range again
+    assert store.fetch_window("AAA", day(-60), TODAY) == day(-60)
+    # Nothing newer than the high-water mark can be in an older range
+    assert store.fetch_window("AAA", day(-30), day(-5)) is None
+
+
+def test_merge_returns_only_new_articles_and_advances_the_high_water_mark():
+    store = ArticleStore()
+    first = article("AAA", "first", NOW - timedelta(hours=5))
+    second = article("AAA", "second", NOW - timedelta(hours=1))
+
+    assert store.merge("AAA", day(-30), [first]) == [first]
+    assert store.merge("AAA", day(-1), [first, second]) == [second]
+    assert store.high_water_mark("AAA") == second.published_at.timestamp()
+
+
+def test_delta_fetch_requests_from_the_high_water_day_and_skips_older_items(news_service, finnhub):
+    finnhub.add("AAA", "old story", NOW - timedelta(days=3))
+    asyncio.run(news_service.get_company_news(["AAA"]))
+    news_service.company_cache.invalidate()
+    finnhub.add("AAA", "new story", NOW - timedelta(hours=1))
+
+    response = asyncio.run(news_service.get_company_news(["AAA"]))
+
+    assert [r.url.params["from"] for r in finnhub.requests] == [day(-30), day(-3)]
+    assert [a.title for a in response.articles] == ["new story", "old story"]
+    assert news_service.store.stats()["articles"] == 2
+
+
+def test_query_pages_newest_first_with_filters_and_total(tmp_path):
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    articles = [article("AAA", f"story {n}", NOW - timedelta(hours=n)) for n in range(5)]
+    store.merge("AAA", day(-30), articles)
+    store.merge("BBB", day(-30), [article("BBB", "other", NOW)])
+    store.set_sentiments(
+        articles[:3],
+        [SentimentResult(sentiment=label, confidence=0.9) for label in ("positive", "negative", "positive")],
+        "model-v1"
+    )
+
+    page, total = store.query(["AAA"], limit=2, offset=1)
+    positive, positive_total = store.query(["AAA"], sentiment="positive")
+    scored, scored_total = store.query(["AAA", "BBB"], scored_only=True)
+    recent, _ = store.query(["AAA"], from_ts=(NOW - timedelta(hours=1, minutes=30)).timestamp())
+
+    assert ([a.title for a in page], total) == (["story 1", "story 2"], 5)
+    assert ([a.title for a in positive], positive_total) == (["story 0", "story 2"], 2)
+    assert scored_total == 3 and scored[0].model_version == "model-v1"
+    assert [a.title for a in recent] == ["story 0", "story 1"]
+
+
+def test_sentiment_is_reused_only_for_the_same_model_version_and_survives_restarts(tmp_path):
+    path = str(tmp_path / "articles.sqlite3")
+    store = ArticleStore(path)
+    stored = [article("AAA", "a", NOW), article("AAA", "b", NOW - timedelta(hours=1))]
+    store.merge("AAA", day(-30), stored)
+    store.set_sentiments(stored[:1], [SentimentResult(sentiment="positive", confidence=0.8)], "model-v1")
+
+    reopened = ArticleStore(path)
+
+    assert reopened.get_sentiments(stored, "model-v1") == [SentimentResult(sentiment="positive", confidence=0.8), None]
+    assert reopened.get_sentiments(stored, "model-v2") == [None, None]
+    assert reopened.fetch_window("AAA", day(-30), TODAY) == TODAY
+
+
+def test_fallback_placeholders_are_not_stored():
+    store = ArticleStore()
+    stored = [article("AAA", "a", NOW)]
+    store.merge("AAA", day(-30), stored)
+    store.set_sentiments(stored, [fallback_result()], "model-v1")
+
+    assert store.get_sentiments(stored, "model-v1") == [None]
+    assert store.stats()["scored"] == 0
+
+
+def test_history_endpoint_pages_stored_news_and_rejects_bad_dates(news_service):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.services.news_service import get_news_service
+
+    news_service.store.merge("AAA", day(-30), [article("AAA", f"story {n}", NOW - timedelta(hours=n)) for n in range(3)])
+    app.dependency_overrides[get_news_service] = lambda: news_service
+    try:
+        client = TestClient(app)
+        page = client.get("/api/news/history?symbols=aaa&limit=2").json()
+        bad_date = client.get("/api/news/history?symbols=AAA&from_date=2025-13-01")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert (page["count"], page["total"]) == (2, 3)
+    assert page["articles"][0]["title"] == "story 0"
+    assert bad_date.status_code == 400
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.models.schemas import PortfolioResponse
+from app.services.async_robinhood_service import AsyncRobinhoodService, RobinhoodBusyError
+from app.services.robinhood_service import PortfolioPositions, Position
+
+
+class FakeRobinhoodService:
+    """Blocking service double that counts calls"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.position_loads = 0
+        self.quote_loads = 0
+        self.threads: set[str] = set()
+
+    def load_positions(self):
+        self.threads.add(threading.current_thread().name)
+        self.position_loads += 1
+        time.sleep(self.delay)
+        return PortfolioPositions(
+            total_equity=100.0,
+            cash_balance=10.0,
+            positions=[Position(symbol="AAA", quantity=2, average_price=20.0)]
+        )
+
+    def get_latest_prices(self, symbols):
+        self.quote_loads += 1
+        time.sleep(self.delay)
+        return {symbol: 25.0 for symbol in symbols}
+
+    def build_portfolio(self, positions, prices):
+        return PortfolioResponse(total_equity=positions.total_equity, cash_balance=positions.cash_balance, holdings=[])
+
+
+def make_service(delay=0.0, workers=1, max_queue=8):
+    service = AsyncRobinhoodService(FakeRobinhoodService(delay))
+    service._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="robinhood")
+    service.max_queue = max_queue
+    return service
+
+
+def test_calls_run_in_the_robinhood_pool_and_keep_the_loop_free():
+    async def run():
+        service = make_service(delay=0.1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await service.get_positions()
+        task.cancel()
+        return service, ticks
+
+    service, ticks = asyncio.run(run())
+
+    assert all(name.startswith("robinhood") for name in service.service.threads)
+    assert ticks >= 5
+
+
+def test_slow_calls_time_out():
+    async def run():
+        service = make_service(delay=0.3)
+        await service._run("load_positions", service.service.load_positions, timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+
+
+def test_calls_beyond_the_queue_limit_are_rejected():
+    async def run():
+        service = make_service(delay=0.1, workers=1, max_queue=1)
+        calls = [
+            asyncio.create_task(service._run("sleep", time.sleep, 0.1))
+            for _ in range(4)
+        ]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert any(isinstance(result, RobinhoodBusyError) for result in results)
+
+
+def test_queue_depth_counts_waiting_and_dropped_calls():
+    async def run():
+        service = make_service(workers=1)
+        calls = [
+            asyncio.create_task(service._run("sleep", time.sleep, 0.2, timeout=0.05))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.02)
+        during = service.executor_stats()
+        await asyncio.gather(*calls, return_exceptions=True)
+        await asyncio.sleep(0.25)
+        return during, service.executor_stats()
+
+    during, after = asyncio.run(run())
+
+    assert (during["queued"], during["running"]) == (2, 1)
+    assert (after["queued"], after["running"]) == (0, 0)
+
+
+def test_concurrent_portfolio_calls_share_one_snapshot():
+    async def run():
+        service = make_service(delay=0.05, workers=4)
+        await asyncio.gather(*[service.get_portfolio() for _ in range(5)])
+        await service.get_portfolio()
+        return service.service
+
+    fake = asyncio.run(run())
+
+    assert (fake.position_loads, fake.quote_loads) == (1, 1)
+
+
+def test_invalidate_refetches_quotes_or_everything():
+    async def run():
+        service = make_service()
+        await service.get_portfolio()
+        service.invalidate(quotes_only=True)
+        await service.get_portfolio()
+        quotes_only = (service.service.position_loads, service.service.quote_loads)
+        service.invalidate()
+        await service.get_portfolio()
+        return quotes_only, (service.service.position_loads, service.service.quote_loads)
+
+    quotes_only, everything = asyncio.run(run())
+
+    assert quotes_only == (1, 2)
+    assert everything == (2, 3)
+
+
+def test_quotes_are_remembered_as_last_prices():
+    async def run():
+        service = make_service()
+        await service.get_latest_prices(["AAA", "BBB"])
+        return service.last_prices
+
+    assert asyncio.run(run()) == {"AAA": 25.0, "BBB": 25.0}
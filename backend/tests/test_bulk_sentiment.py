@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.routers.sentiment as sentiment_router
+from app.main import app
+from app.models.schemas import SentimentResult
+from app.services.sentiment_batcher import get_sentiment_batcher
+
+
+class FakeBatcher:
+    """Labels texts by keyword and records the size of each model call"""
+
+    def __init__(self, max_batch: int = 2):
+        self.max_batch = max_batch
+        self.calls: list[int] = []
+
+    async def analyze_many(self, texts: list[str]) -> list[SentimentResult]:
+        self.calls.append(len(texts))
+        return [
+            SentimentResult(sentiment="positive" if "up" in text else "negative", confidence=0.9)
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def batcher():
+    return FakeBatcher()
+
+
+@pytest.fixture
+def client(batcher):
+    app.dependency_overrides[get_sentiment_batcher] = lambda: batcher
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def ndjson(*items) -> str:
+    return "".join((item if isinstance(item, str) else json.dumps(item)) + "\n" for item in items)
+
+
+def test_bulk_results_come_back_in_input_order(client):
+    items = [{"id": "a", "text": "shares up"}, {"text": "shares down"}, {"id": "c", "text": "up again"}]
+
+    response = client.post("/api/sentiment/analyze/bulk", json={"items": items})
+
+    body = response.json()
+    assert body["count"] == 3
+    assert [(r["index"], r["id"], r["sentiment"]) for r in body["results"]] == [
+        (0, "a", "positive"), (1, None, "negative"), (2, "c", "positive")
+    ]
+
+
+@pytest.mark.parametrize("count", [0, 1001])
+def test_bulk_rejects_empty_and_oversized_requests(client, batcher, count):
+    items = [{"text": "shares up"}] * count
+
+    response = client.post("/api/sentiment/analyze/bulk", json={"items": items})
+
+    assert response.status_code == 422
+    assert batcher.calls == []
+
+
+def test_stream_scores_in_model_batches_and_reports_bad_lines_in_place(client, batcher):
+    body = ndjson({"id": "a", "text": "up"}, {"text": "down"}, {"text": "up"}, "not json", "", {"text": "down"})
+
+    response = client.post("/api/sentiment/analyze/bulk/stream", content=body)
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["index"] for record in records] == [0, 1, 2, 3, 4]
+    assert [record.get("sentiment") for record in records] == ["positive", "negative", "positive", None, "negative"]
+    assert records[0]["id"] == "a"
+    assert records[3]["error"].startswith("Invalid item")
+    assert batcher.calls == [2, 1, 1]
+
+
+def test_stream_rejects_bodies_over_the_limit(client, batcher, monkeypatch):
+    settings = sentiment_router.settings.model_copy(update={"SENTIMENT_BULK_STREAM_MAX_BYTES": 32})
+    monkeypatch.setattr(sentiment_router, "settings", settings)
+    body = ndjson(*[{"text": "shares up"}] * 5)
+
+    declared = client.post("/api/sentiment/analyze/bulk/stream", content=body)
+    chunked = client.post("/api/sentiment/analyze/bulk/stream", content=iter([body.encode()]))
+
+    assert declared.status_code == 413
+    assert chunked.status_code == 413
+    assert batcher.calls == []
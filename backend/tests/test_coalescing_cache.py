@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from app.utils.cache import CoalescingCache
+
+
+class Upstream:
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.calls = 0
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+def test_concurrent_misses_share_one_fetch():
+    async def run():
+        cache = CoalescingCache(max_entries=4, ttl_seconds=60)
+        upstream = Upstream()
+        values = await asyncio.gather(*[cache.get_or_fetch("k", upstream.fetch) for _ in range(5)])
+        return upstream, values
+
+    upstream, values = asyncio.run(run())
+
+    assert upstream.calls == 1
+    assert values == [1] * 5
+
+
+def test_fresh_entries_are_served_from_cache():
+    async def run():
+        cache = CoalescingCache(max_entries=4, ttl_seconds=60)
+        upstream = Upstream()
+        await cache.get_or_fetch("k", upstream.fetch)
+        return upstream, await cache.get_or_fetch("k", upstream.fetch)
+
+    upstream, value = asyncio.run(run())
+
+    assert (upstream.calls, value) == (1, 1)
+
+
+def test_stale_entry_is_served_while_it_revalidates():
+    async def run():
+        cache = CoalescingCache(max_entries=4, ttl_seconds=0.02, stale_seconds=10)
+        upstream = Upstream()
+        await cache.get_or_fetch("k", upstream.fetch)
+        await asyncio.sleep(0.03)
+        stale = await cache.get_or_fetch("k", upstream.fetch)
+        await asyncio.sleep(0.05)
+        refreshed = await cache.get_or_fetch("k", upstream.fetch)
+        return stale, refreshed
+
+    assert asyncio.run(run()) == (1, 2)
+
+
+def test_entry_past_the_stale_window_is_fetched_again():
+    async def run():
+        cache = CoalescingCache(max_entries=4, ttl_seconds=0.01, stale_seconds=0.01)
+        upstream = Upstream(delay=0)
+        await cache.get_or_fetch("k", upstream.fetch)
+        await asyncio.sleep(0.05)
+        return await cache.get_or_fetch("k", upstream.fetch)
+
+    assert asyncio.run(run()) == 2
+
+
+def test_failed_fetch_is_not_cached():
+    async def run():
+        cache = CoalescingCache(max_entries=4, ttl_seconds=60)
+
+        async def failing():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("k", failing)
+        return await cache.get_or_fetch("k", Upstream(delay=0).fetch)
+
+    assert asyncio.run(run()) == 1
+
+
+def test_concurrent_company_news_requests_hit_finnhub_once(news_service, finnhub):
+    finnhub.delays = {"AAA": 0.02}
+
+    async def run():
+        return await asyncio.gather(*[news_service.get_company_news(["AAA"]) for _ in range(3)])
+
+    asyncio.run(run())
+
+    assert finnhub.symbols_requested() == ["AAA"]
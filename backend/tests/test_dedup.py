@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime
+
+from app.models.schemas import NewsArticle, SentimentResult
+from app.services.summary_service import ArticleScorer
+from app.utils.dedup import NearDuplicateIndex, estimated_similarity, minhash
+
+STORY = (
+    "Apple shares rise after quarterly earnings beat expectations as iPhone sales "
+    "climb in China and services revenue hits a record high"
+)
+REWRITE = STORY.replace("a record high", "a record")
+OTHER = "Tesla recalls vehicles over a steering issue, regulators said in a filing on Monday"
+
+
+class CountingBatcher:
+    def __init__(self):
+        self.texts: list[str] = []
+
+    async def analyze(self, text):
+        self.texts.append(text)
+        await asyncio.sleep(0.01)
+        return SentimentResult(sentiment="positive", confidence=0.9)
+
+
+def article(symbol: str, title: str, url: str) -> NewsArticle:
+    return NewsArticle(
+        symbol=symbol, title=title, summary="", source="Wire",
+        url=url, published_at=datetime(2025, 1, 1)
+    )
+
+
+def test_signatures_are_deterministic_and_track_similarity():
+    assert minhash(STORY) == minhash(STORY.upper())
+    assert estimated_similarity(minhash(STORY), minhash(REWRITE)) >= 0.8
+    assert estimated_similarity(minhash(STORY), minhash(OTHER)) < 0.3
+
+
+def test_index_finds_near_duplicates_only():
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add(minhash(STORY), "story")
+
+    assert index.find(minhash(REWRITE)) == "story"
+    assert index.find(minhash(OTHER)) is None
+
+
+def score_all(scorer, articles):
+    async def run():
+        return await asyncio.gather(*await scorer.score_many(articles))
+    return asyncio.run(run())
+
+
+def test_scorer_runs_the_model_once_per_story():
+    batcher = CountingBatcher()
+    scorer = ArticleScorer(batcher)
+
+    results = score_all(scorer, [
+        article("AAPL", STORY, "https://a.example/1"),
+        article("MSFT", STORY, "https://a.example/1"),
+        article("AAPL", REWRITE, "https://b.example/2"),
+        article("TSLA", OTHER, "https://c.example/3"),
+    ])
+
+    assert len(results) == 4
+    assert len(batcher.texts) == 2
+
+
+def test_scorer_can_fold_identical_urls_only():
+    batcher = CountingBatcher()
+    scorer = ArticleScorer(batcher, near_duplicates=False)
+
+    score_all(scorer, [
+        article("AAPL", STORY, "https://a.example/1"),
+        article("MSFT", STORY, "https://a.example/1"),
+        article("AAPL", REWRITE, "https://b.example/2"),
+    ])
+
+    assert len(batcher.texts) == 2
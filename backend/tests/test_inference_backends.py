@@ -0,0 +1,82 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from app.services.inference_backends import (
+    InferenceBackend,
+    OnnxBackend,
+    PyTorchBackend,
+    QuantizedBackend,
+    create_backend
+)
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory):
+    """A small random 3-label BERT classifier saved like a Hub checkpoint"""
+    config = transformers.BertConfig(
+        vocab_size=100, hidden_size=32, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=64, num_labels=3
+    )
+    torch.manual_seed(0)
+    path = tmp_path_factory.mktemp("tiny-bert")
+    transformers.BertForSequenceClassification(config).save_pretrained(path)
+    return str(path)
+
+
+def make_inputs():
+    input_ids = torch.randint(1, 100, (2, 6))
+    return {
+        "input_ids": input_ids,
+        "attention_mask": torch.ones_like(input_ids),
+        "token_type_ids": torch.zeros_like(input_ids)
+    }
+
+
+def test_create_backend_by_name():
+    assert isinstance(create_backend("pytorch"), PyTorchBackend)
+    assert isinstance(create_backend("quantized"), QuantizedBackend)
+    onnx = create_backend("onnx", onnx_path="model.onnx", num_threads=2)
+    assert isinstance(onnx, OnnxBackend)
+    assert (onnx.onnx_path, onnx.num_threads) == ("model.onnx", 2)
+
+
+def test_create_backend_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown sentiment backend"):
+        create_backend("tensorrt")
+
+
+def test_backends_must_implement_load_and_logits():
+    class Incomplete(InferenceBackend):
+        def load(self, model_name, revision):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_quantized_backend_runs_on_cpu():
+    assert QuantizedBackend(device="cuda").device == "cpu"
+
+
+@pytest.mark.parametrize("name", ["pytorch", "quantized"])
+def test_backend_logits_have_one_row_per_input(name, tiny_model):
+    backend = create_backend(name)
+    backend.load(tiny_model, "main")
+
+    logits = backend.logits(make_inputs())
+
+    assert tuple(logits.shape) == (2, 3)
+
+
+def test_onnx_backend_matches_pytorch(tiny_model, tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+    reference = create_backend("pytorch")
+    reference.load(tiny_model, "main")
+    onnx = create_backend("onnx", onnx_path=str(tmp_path / "tiny.onnx"))
+    onnx.load(tiny_model, "main")
+    inputs = make_inputs()
+
+    assert torch.allclose(onnx.logits(inputs), reference.logits(inputs), atol=1e-4)
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime, timedelta
+
+NOW = datetime.now().replace(microsecond=0)
+
+
+def test_company_news_keeps_symbol_order_when_fetches_finish_out_of_order(news_service, finnhub):
+    for symbol in ("AAA", "BBB", "CCC"):
+        finnhub.add(symbol, f"{symbol} news", NOW - timedelta(hours=1))
+    finnhub.delays = {"AAA": 0.05, "BBB": 0.0, "CCC": 0.02}
+
+    response = asyncio.run(news_service.get_company_news(["AAA", "BBB", "CCC"]))
+
+    assert [article.symbol for article in response.articles] == ["AAA", "BBB", "CCC"]
+
+
+def test_company_news_fetches_are_bounded_by_the_concurrency_setting(news_service, finnhub):
+    news_service.settings = news_service.settings.model_copy(update={"NEWS_FETCH_CONCURRENCY": 2})
+    symbols = [f"S{n}" for n in range(6)]
+    finnhub.delays = {symbol: 0.02 for symbol in symbols}
+
+    asyncio.run(news_service.get_company_news(symbols))
+
+    assert finnhub.max_active == 2
+    assert sorted(finnhub.symbols_requested()) == symbols
+
+
+def test_one_failing_symbol_does_not_fail_the_others(news_service, finnhub):
+    finnhub.add("AAA", "AAA news", NOW - timedelta(hours=1))
+    finnhub.add("BBB", "BBB news", NOW - timedelta(hours=1))
+    finnhub.failing = {"AAA"}
+
+    response = asyncio.run(news_service.get_company_news(["AAA", "BBB"]))
+
+    assert [article.symbol for article in response.articles] == ["BBB"]
+
+
+def test_client_is_shared_and_recreated_after_close():
+    from app.services.news_service import NewsService
+
+    async def run():
+        service = NewsService()
+        first = service.client
+        same = service.client
+        await service.close()
+        return first, same, service.client
+
+    first, same, reopened = asyncio.run(run())
+
+    assert first is same
+    assert reopened is not first and not reopened.is_closed
+
+
+def test_pool_stats_count_requests_and_reused_connections():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from app.services.news_service import NewsService
+    from app.utils.rate_limiter import AsyncTokenBucket
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    async def run():
+        service = NewsService()
+        service.base_url = f"http://127.0.0.1:{server.server_port}"
+        service.limiter = AsyncTokenBucket(rate_per_minute=60000, capacity=1000)
+        for _ in range(3):
+            await service._get("/company-news", {})
+        stats = service.pool_stats()
+        await service.close()
+        return stats
+
+    try:
+        stats = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert stats == {"active": 0, "connections_opened": 1}
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.utils.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, AsyncTokenBucket
+
+
+def test_burst_is_served_immediately_then_throttled_to_the_rate():
+    async def run():
+        bucket = AsyncTokenBucket(rate_per_minute=600, capacity=2)
+        started = time.monotonic()
+        times = []
+        for _ in range(3):
+            await bucket.acquire()
+            times.append(time.monotonic() - started)
+        return times
+
+    times = asyncio.run(run())
+
+    assert times[1] < 0.05
+    assert 0.08 <= times[2] < 0.5
+
+
+def test_interactive_waiters_are_served_before_background_ones():
+    async def run():
+        bucket = AsyncTokenBucket(rate_per_minute=1200, capacity=1)
+        await bucket.acquire()
+        order = []
+
+        async def take(name, priority):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        background = [asyncio.create_task(take(f"bg{n}", PRIORITY_BACKGROUND)) for n in range(2)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(take("user", PRIORITY_INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+        return order
+
+    assert asyncio.run(run()) == ["user", "bg0", "bg1"]
+
+
+def test_pause_holds_every_waiter_until_it_ends():
+    async def run():
+        bucket = AsyncTokenBucket(rate_per_minute=60000, capacity=5)
+        bucket.pause(0.2)
+        started = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.19
+
+
+def test_429_pauses_the_shared_limiter_for_retry_after(news_service):
+    calls = []
+
+    def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json=[])
+    news_service._client = httpx.AsyncClient(base_url=news_service.base_url, transport=httpx.MockTransport(handler))
+
+    response = asyncio.run(news_service._get("/company-news", {"symbol": "AAA"}))
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.19
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate_per_minute=0, capacity=10)
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate_per_minute=60, capacity=0)
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.models.schemas import SentimentResult
+from app.services.sentiment_batcher import sentiment_batcher
+from app.services.sentiment_service import SentimentService, sentiment_service
+
+
+@pytest.fixture
+def preload(monkeypatch):
+    settings = main.settings.model_copy(update={
+        "SENTIMENT_PRELOAD": True,
+        "SENTIMENT_WARMUP_RETRY_SECONDS": 0.01
+    })
+    monkeypatch.setattr(main, "settings", settings)
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    monkeypatch.setattr(sentiment_service, "ready", False)
+    monkeypatch.setattr(sentiment_service, "warmup_error", None)
+
+
+def test_ready_is_503_while_warming_up(preload):
+    response = TestClient(main.app).get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "sentiment model warming up"
+
+
+def test_ready_reports_the_warm_up_error(preload):
+    sentiment_service.warmup_error = "Failed to load sentiment model: offline"
+
+    response = TestClient(main.app).get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["error"] == "Failed to load sentiment model: offline"
+
+
+def test_ready_once_the_model_is_warm(preload):
+    sentiment_service.ready = True
+
+    assert TestClient(main.app).get("/ready").status_code == 200
+
+
+def test_failed_warm_up_is_recorded():
+    service = SentimentService()
+
+    def load_model():
+        raise Exception("Failed to load sentiment model: offline")
+    service.load_model = load_model
+
+    with pytest.raises(Exception):
+        service.warm_up(1)
+    assert service.warmup_error == "Failed to load sentiment model: offline"
+    assert not service.ready
+
+
+def test_warm_up_is_retried_until_it_succeeds(preload, monkeypatch):
+    attempts = []
+
+    async def warm_up(iterations):
+        attempts.append(iterations)
+        if len(attempts) < 3:
+            raise Exception("offline")
+        sentiment_service.ready = True
+    monkeypatch.setattr(sentiment_batcher, "warm_up", warm_up)
+
+    asyncio.run(asyncio.wait_for(main._warm_up_sentiment_model(2), 5))
+
+    assert attempts == [2, 2, 2]
+
+
+def test_lazy_load_on_first_request_sets_ready():
+    service = SentimentService()
+    service._model_loaded = True
+    service._predict = lambda texts: [SentimentResult(sentiment="neutral", confidence=0.7) for _ in texts]
+
+    service.analyze_batch(["first request"])
+
+    assert service.ready
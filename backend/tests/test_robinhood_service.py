@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+
+from app.services import robinhood_service as module
+from app.services.instrument_cache import InstrumentSymbolCache
+from app.services.robinhood_service import RobinhoodService
+
+INSTRUMENTS = {f"id{n}": f"SYM{n}" for n in range(4)}
+
+
+def instrument_url(instrument_id: str) -> str:
+    return f"https://api.robinhood.com/instruments/{instrument_id}/"
+
+
+class FakeRobinhood:
+    """Stands in for the robin_stocks calls RobinhoodService makes"""
+
+    def __init__(self):
+        self.calls: list[tuple[str, object]] = []
+        self.quotes = {f"SYM{n}": 10.0 + n for n in range(4)}
+        self.quote_batch_fails = False
+        self.stage_delay = 0.0
+        self.stage_threads: set[str] = set()
+        self.lock = threading.Lock()
+
+    def record(self, name, arg=None):
+        with self.lock:
+            self.calls.append((name, arg))
+
+    def calls_to(self, name):
+        return [arg for call, arg in self.calls if call == name]
+
+    def request_get(self, url, data_type, payload):
+        ids = payload["ids"].split(",")
+        self.record("instruments", ids)
+        return [{"id": i, "symbol": INSTRUMENTS[i]} for i in ids if i in INSTRUMENTS and i != "id3"]
+
+    def get_symbol_by_url(self, url):
+        self.record("symbol_by_url", url)
+        return INSTRUMENTS[url.rstrip("/").rsplit("/", 1)[-1]]
+
+    def get_quotes(self, symbols):
+        self.record("get_quotes", list(symbols))
+        if self.quote_batch_fails:
+            return [None]
+        return [
+            {"symbol": s, "last_trade_price": str(self.quotes[s]), "last_extended_hours_trade_price": None}
+            for s in symbols if s in self.quotes and s != "SYM2"
+        ]
+
+    def get_latest_price(self, symbol):
+        self.record("get_latest_price", symbol)
+        return [str(self.quotes[symbol])]
+
+    def stage(self, name, value):
+        def load():
+            self.stage_threads.add(threading.current_thread().name)
+            time.sleep(self.stage_delay)
+            self.record(name)
+            return value
+        return load
+
+
+@pytest.fixture
+def fake_rh(monkeypatch):
+    fake = FakeRobinhood()
+    monkeypatch.setattr(module.rh.helper, "request_get", fake.request_get)
+    monkeypatch.setattr(module.rh, "get_symbol_by_url", fake.get_symbol_by_url)
+    monkeypatch.setattr(module.rh, "get_quotes", fake.get_quotes)
+    monkeypatch.setattr(module.rh, "get_latest_price", fake.get_latest_price)
+    monkeypatch.setattr(module.rh, "load_portfolio_profile", fake.stage("profile", {"equity": "1000"}))
+    monkeypatch.setattr(module.rh, "load_account_profile", fake.stage("account", {"cash": "50"}))
+    monkeypatch.setattr(module.rh, "get_open_stock_positions", fake.stage("positions", [
+        {"instrument": instrument_url(i), "quantity": "2", "average_buy_price": "10"}
+        for i in INSTRUMENTS
+    ]))
+    return fake
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = RobinhoodService()
+    service.instrument_symbols = InstrumentSymbolCache(str(tmp_path / "instruments.sqlite3"))
+    service._logged_in = True
+    return service
+
+
+def test_unknown_instruments_are_resolved_in_one_bulk_call(fake_rh, service):
+    urls = [instrument_url(i) for i in INSTRUMENTS]
+
+    symbols = service._resolve_symbols(urls + urls[:1])
+
+    assert symbols == {instrument_url(i): s for i, s in INSTRUMENTS.items()}
+    assert fake_rh.calls_to("instruments") == [list(INSTRUMENTS)]
+    # Only the instrument the bulk call missed is looked up on its own
+    assert fake_rh.calls_to("symbol_by_url") == [instrument_url("id3")]
+
+
+def test_resolved_instruments_persist_across_restarts(fake_rh, service, tmp_path):
+    urls = [instrument_url(i) for i in INSTRUMENTS]
+    service._resolve_symbols(urls)
+    fake_rh.calls.clear()
+
+    restarted = RobinhoodService()
+    restarted.instrument_symbols = InstrumentSymbolCache(str(tmp_path / "instruments.sqlite3"))
+
+    assert restarted._resolve_symbols(urls)[urls[0]] == "SYM0"
+    assert fake_rh.calls == []
+
+
+def test_prices_come_from_one_batched_quote_call(fake_rh, service):
+    prices = service._get_latest_prices(["SYM0", "SYM1", "SYM3", "SYM0"])
+
+    assert prices == {"SYM0": 10.0, "SYM1": 11.0, "SYM3": 13.0}
+    assert fake_rh.calls_to("get_quotes") == [["SYM0", "SYM1", "SYM3"]]
+    assert fake_rh.calls_to("get_latest_price") == []
+
+
+def test_symbols_missing_from_the_batch_are_retried_one_by_one(fake_rh, service):
+    prices = service._get_latest_prices(["SYM1", "SYM2"])
+
+    assert prices == {"SYM1": 11.0, "SYM2": 12.0}
+    assert fake_rh.calls_to("get_latest_price") == ["SYM2"]
+
+
+def test_failed_batch_falls_back_to_per_symbol_quotes(fake_rh, service):
+    fake_rh.quote_batch_fails = True
+
+    prices = service._get_latest_prices(["SYM0", "SYM1"])
+
+    assert prices == {"SYM0": 10.0, "SYM1": 11.0}
+    assert fake_rh.calls_to("get_latest_price") == ["SYM0", "SYM1"]
+
+
+def test_quotes_are_chunked(fake_rh, service, monkeypatch):
+    monkeypatch.setattr(module, "QUOTE_BATCH_SIZE", 2)
+
+    service._get_latest_prices(["SYM0", "SYM1", "SYM3"])
+
+    assert fake_rh.calls_to("get_quotes") == [["SYM0", "SYM1"], ["SYM3"]]
+
+
+def test_profile_account_and_positions_load_in_parallel(fake_rh, service):
+    fake_rh.stage_delay = 0.1
+
+    started = time.perf_counter()
+    positions = service.load_positions()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.25
+    assert len(fake_rh.stage_threads) == 3
+    assert (positions.total_equity, positions.cash_balance) == (1000.0, 50.0)
+    assert positions.symbols == ["SYM0", "SYM1", "SYM2", "SYM3"]
+
+
+def test_portfolio_prices_every_holding(fake_rh, service):
+    portfolio = service.get_portfolio()
+
+    assert [(h.symbol, h.current_price, h.equity) for h in portfolio.holdings] == [
+        ("SYM0", 10.0, 20.0), ("SYM1", 11.0, 22.0), ("SYM2", 12.0, 24.0), ("SYM3", 13.0, 26.0)
+    ]
+    assert portfolio.holdings[1].percent_change == 10.0
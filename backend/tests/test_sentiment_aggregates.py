@@ -0,0 +1,110 @@
+import time
+import types
+from datetime import datetime
+
+import pytest
+
+from app.models.schemas import NewsArticle, SentimentResult
+from app.services import sentiment_aggregates as module
+from app.services.article_store import ArticleStore
+from app.services.sentiment_aggregates import SentimentAggregator
+from app.services.sentiment_service import fallback_result
+
+HOUR = 3600
+START = 1_700_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=START)
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def article(symbol: str, title: str, published: float) -> NewsArticle:
+    return NewsArticle(
+        symbol=symbol, title=title, summary="", source="Wire",
+        url=f"https://news.example/{symbol}/{title}", published_at=datetime.fromtimestamp(published)
+    )
+
+
+def result(label: str, confidence: float = 1.0) -> SentimentResult:
+    return SentimentResult(sentiment=label, confidence=confidence)
+
+
+def windows(aggregator, symbol="AAA"):
+    return aggregator.snapshot([symbol])[0].windows
+
+
+def test_counts_and_score_per_window(clock):
+    aggregator = SentimentAggregator()
+    aggregator.add_many(
+        [article("AAA", "a", START - HOUR), article("AAA", "b", START - 3 * 24 * HOUR)],
+        [result("positive", 0.9), result("negative", 0.3)]
+    )
+
+    day, week = windows(aggregator)["1d"], windows(aggregator)["7d"]
+
+    assert (day.count, day.positive, day.score) == (1, 1, 1.0)
+    assert (week.count, week.negative) == (2, 1)
+    assert week.score == pytest.approx((0.9 - 0.3) / 1.2, abs=1e-4)
+
+
+def test_articles_age_out_of_each_window(clock):
+    aggregator = SentimentAggregator()
+    aggregator.add_many([article("AAA", "a", START - HOUR)], [result("positive")])
+
+    clock.now = START + 2 * 24 * HOUR
+    expired_day = windows(aggregator)
+    clock.now = START + 31 * 24 * HOUR
+    expired_all = windows(aggregator)
+
+    assert (expired_day["1d"].count, expired_day["7d"].count) == (0, 1)
+    assert expired_day["1d"].score is None
+    assert [expired_all[w].count for w in ("1d", "7d", "30d")] == [0, 0, 0]
+
+
+def test_rescoring_an_article_replaces_its_contribution(clock):
+    aggregator = SentimentAggregator()
+    story = article("AAA", "a", START - HOUR)
+    aggregator.add_many([story], [result("positive")])
+    aggregator.add_many([story], [result("negative")])
+
+    day = windows(aggregator)["1d"]
+
+    assert (day.count, day.positive, day.negative) == (1, 0, 1)
+
+
+def test_fallback_placeholders_are_ignored(clock):
+    aggregator = SentimentAggregator()
+    aggregator.add_many([article("AAA", "a", START - HOUR)], [fallback_result()])
+
+    assert windows(aggregator)["30d"].count == 0
+
+
+def test_decayed_score_favours_recent_articles(clock):
+    aggregator = SentimentAggregator(half_life_hours=1)
+    aggregator.add_many(
+        [article("AAA", "old", START - 10 * HOUR), article("AAA", "new", START)],
+        [result("negative"), result("positive")]
+    )
+
+    assert aggregator.snapshot(["AAA"])[0].decayed_score > 0.9
+
+
+def test_load_seeds_from_scored_articles_in_store(clock):
+    clock.now = time.time()
+    store = ArticleStore()
+    stories = [article("AAA", "a", clock.now - HOUR), article("AAA", "b", clock.now - 2 * HOUR)]
+    store.merge("AAA", "2026-01-01", stories)
+    store.set_sentiments(stories[:1], [result("positive")], "v1")
+    aggregator = SentimentAggregator()
+
+    aggregator.load(store)
+
+    day = windows(aggregator)["1d"]
+    assert (day.count, day.positive) == (1, 1)
+
+
+def test_unknown_symbols_get_empty_windows(clock):
+    assert windows(SentimentAggregator(), "ZZZ")["7d"].count == 0
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.models.schemas import SentimentResult
+from app.services.sentiment_batcher import QueueFullError, SentimentBatcher
+
+
+class FakeService:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def analyze_batch(self, texts, batch_size=None):
+        self.threads.add(threading.current_thread().name)
+        self.batches.append(list(texts))
+        time.sleep(self.delay)
+        return [SentimentResult(sentiment="positive", confidence=len(text) / 100) for text in texts]
+
+    def warm_up(self, iterations):
+        self.threads.add(threading.current_thread().name)
+
+
+def make_batcher(service, max_batch=4, max_wait=0.05):
+    batcher = SentimentBatcher(service)
+    batcher.max_batch = max_batch
+    batcher.max_wait = max_wait
+    return batcher
+
+
+def test_full_batch_flushes_without_waiting_for_the_timeout():
+    async def run():
+        service = FakeService()
+        batcher = make_batcher(service, max_batch=3, max_wait=10)
+        started = time.monotonic()
+        results = await asyncio.gather(*[batcher.analyze("x" * n) for n in (1, 2, 3)])
+        elapsed = time.monotonic() - started
+        await batcher.stop()
+        return service, results, elapsed
+
+    service, results, elapsed = asyncio.run(run())
+
+    assert service.batches == [["x", "xx", "xxx"]]
+    assert [r.confidence for r in results] == [0.01, 0.02, 0.03]
+    assert elapsed < 1
+
+
+def test_partial_batch_flushes_after_max_wait():
+    async def run():
+        service = FakeService()
+        batcher = make_batcher(service, max_batch=8, max_wait=0.05)
+        first = asyncio.create_task(batcher.analyze("a"))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(batcher.analyze("b"))
+        await asyncio.gather(first, second)
+        # Arrives after the first batch was flushed
+        await batcher.analyze("c")
+        await batcher.stop()
+        return service
+
+    service = asyncio.run(run())
+
+    assert service.batches == [["a", "b"], ["c"]]
+
+
+def test_full_queue_rejects_requests():
+    async def run():
+        batcher = make_batcher(FakeService(delay=0.2), max_batch=1, max_wait=0)
+        batcher.settings = batcher.settings.model_copy(update={"SENTIMENT_QUEUE_MAX_DEPTH": 1})
+        tasks = [asyncio.create_task(batcher.analyze(str(n))) for n in range(4)]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+
+    assert any(isinstance(r, QueueFullError) for r in results)
+
+
+def test_stop_fails_queued_and_in_flight_requests():
+    async def run():
+        batcher = make_batcher(FakeService(delay=0.3), max_batch=2, max_wait=0)
+        tasks = [asyncio.create_task(batcher.analyze(str(n))) for n in range(4)]
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, Exception) and "stopped" in str(r) for r in results)
+
+
+def test_warm_up_and_batches_share_the_model_thread():
+    async def run():
+        service = FakeService()
+        batcher = make_batcher(service)
+        await batcher.warm_up(1)
+        await batcher.analyze("a")
+        await batcher.analyze_many(["b", "c"])
+        await batcher.stop()
+        return service
+
+    service = asyncio.run(run())
+
+    assert len(service.threads) == 1
+
+
+def test_analyze_many_chunks_by_max_batch_in_order():
+    async def run():
+        service = FakeService()
+        batcher = make_batcher(service, max_batch=2)
+        results = await batcher.analyze_many(["a", "bb", "ccc", "dddd", "eeeee"])
+        return service, results
+
+    service, results = asyncio.run(run())
+
+    assert service.batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert [r.confidence for r in results] == pytest.approx([0.01, 0.02, 0.03, 0.04, 0.05])
@@ -0,0 +1,51 @@
+import time
+
+from app.models.schemas import SentimentResult
+from app.services.sentiment_cache import SentimentCache
+from app.utils.cache import TTLCache
+
+POSITIVE = SentimentResult(sentiment="positive", confidence=0.9)
+NEGATIVE = SentimentResult(sentiment="negative", confidence=0.8)
+
+
+def make_cache(**kwargs):
+    return SentimentCache(model_name="finbert", model_revision="main", backend="pytorch", max_entries=10, **kwargs)
+
+
+def test_keys_ignore_whitespace_but_depend_on_the_model():
+    cache = make_cache()
+    other_backend = SentimentCache(model_name="finbert", model_revision="main", backend="onnx", max_entries=10)
+
+    assert cache.make_key("Shares  rise\n") == cache.make_key(" Shares rise")
+    assert cache.make_key("Shares rise") != other_backend.make_key("Shares rise")
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    cache = TTLCache(max_entries=2, ttl_seconds=0.05)
+    cache.set("a", 1)
+    time.sleep(0.06)
+
+    assert cache.get("a") is None
+
+
+def test_set_many_persists_to_the_disk_tier(tmp_path):
+    db_path = str(tmp_path / "sentiment.sqlite3")
+    make_cache(db_path=db_path).set_many(["up", "down"], [POSITIVE, NEGATIVE])
+
+    reopened = make_cache(db_path=db_path)
+
+    assert reopened.get("up") == POSITIVE
+    assert reopened.get(" down ") == NEGATIVE
+    assert reopened.get("sideways") is None
@@ -0,0 +1,54 @@
+from app.models.schemas import SentimentResult
+from app.services.sentiment_service import SentimentService
+
+
+def make_service(predict):
+    service = SentimentService()
+    service._model_loaded = True
+    service._predict = predict
+    return service
+
+
+def label_by_length(batches):
+    def predict(texts):
+        batches.append(list(texts))
+        return [
+            SentimentResult(sentiment="positive" if len(text) % 2 else "negative", confidence=0.9)
+            for text in texts
+        ]
+    return predict
+
+
+def test_analyze_batch_keeps_input_order_and_scores_duplicates_once():
+    batches = []
+    service = make_service(label_by_length(batches))
+    texts = ["bb", "a", "ccc", "a", "  bb "]
+
+    results = service.analyze_batch(texts, batch_size=2)
+
+    assert [r.sentiment for r in results] == ["negative", "positive", "positive", "positive", "negative"]
+    # Unique texts only, shortest first, in chunks of batch_size
+    assert batches == [["a", "bb"], ["ccc"]]
+
+
+def test_analyze_batch_serves_cached_texts_without_the_model():
+    batches = []
+    service = make_service(label_by_length(batches))
+    service.analyze_batch(["a", "bb"])
+    batches.clear()
+
+    results = service.analyze_batch(["bb", "a", "ccc"])
+
+    assert [r.sentiment for r in results] == ["negative", "positive", "positive"]
+    assert batches == [["ccc"]]
+
+
+def test_failed_chunk_returns_fallbacks_that_are_not_cached():
+    def predict(texts):
+        raise RuntimeError("boom")
+    service = make_service(predict)
+
+    results = service.analyze_batch(["a", "b"])
+
+    assert all(r.fallback and r.sentiment == "neutral" for r in results)
+    assert service.cache.get("a") is None
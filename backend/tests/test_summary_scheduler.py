@@ -0,0 +1,114 @@
+import asyncio
+
+from app.models.schemas import PortfolioResponse, SummaryResponse
+from app.services.summary_scheduler import SummaryScheduler
+from app.utils.rate_limiter import PRIORITY_BACKGROUND
+
+
+class FakeSummaryService:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.builds = 0
+        self.priorities: list[int] = []
+        self.fail = False
+
+    async def build_summary(self, timer, deadline=None, priority=None):
+        self.builds += 1
+        self.priorities.append(priority)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Robinhood unavailable")
+        return SummaryResponse(
+            portfolio=PortfolioResponse(total_equity=float(self.builds), cash_balance=0.0, holdings=[]),
+            news=[]
+        )
+
+
+def make_scheduler(service, interval=60.0):
+    scheduler = SummaryScheduler(service)
+    scheduler.interval = interval
+    scheduler.jitter = 0.0
+    return scheduler
+
+
+def test_refresh_publishes_a_versioned_snapshot_built_at_background_priority():
+    service = FakeSummaryService()
+    scheduler = make_scheduler(service)
+
+    asyncio.run(scheduler.refresh())
+    asyncio.run(scheduler.refresh())
+    latest = scheduler.latest()
+
+    assert latest.snapshot_version == 2
+    assert latest.portfolio.total_equity == 2.0
+    assert latest.age_seconds >= 0
+    assert service.priorities == [PRIORITY_BACKGROUND] * 2
+
+
+def test_snapshots_older_than_max_age_are_not_served():
+    scheduler = make_scheduler(FakeSummaryService())
+    asyncio.run(scheduler.refresh())
+
+    assert scheduler.latest(max_age=60) is not None
+    assert scheduler.latest(max_age=-1) is None
+
+
+def test_invalidate_while_building_discards_the_result():
+    async def run():
+        scheduler = make_scheduler(FakeSummaryService(delay=0.05))
+        building = asyncio.create_task(scheduler.refresh())
+        await asyncio.sleep(0.01)
+        scheduler.invalidate()
+        await building
+        return scheduler
+
+    scheduler = asyncio.run(run())
+
+    assert scheduler.snapshot is None
+    assert scheduler.latest() is None
+
+
+def test_invalidate_wakes_the_loop_to_rebuild_now():
+    async def run():
+        service = FakeSummaryService()
+        scheduler = make_scheduler(service, interval=60)
+        scheduler.start()
+        await asyncio.sleep(0.02)
+        first = scheduler.snapshot.version
+        scheduler.invalidate()
+        await asyncio.sleep(0.02)
+        rebuilt = scheduler.snapshot.version
+        await scheduler.stop()
+        return first, rebuilt, service.builds
+
+    assert asyncio.run(run()) == (1, 2, 2)
+
+
+def test_consecutive_failures_back_off_up_to_the_maximum():
+    scheduler = make_scheduler(FakeSummaryService(), interval=10)
+    scheduler.max_backoff = 50
+
+    delays = []
+    for failures in range(4):
+        scheduler.failures = failures
+        delays.append(scheduler._next_delay())
+
+    assert delays == [10, 20, 40, 50]
+
+
+def test_loop_keeps_the_last_snapshot_when_a_refresh_fails():
+    async def run():
+        service = FakeSummaryService()
+        scheduler = make_scheduler(service, interval=0.01)
+        scheduler.max_backoff = 0.01
+        await scheduler.refresh()
+        service.fail = True
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(run())
+
+    assert scheduler.failures >= 1
+    assert scheduler.snapshot.version == 1
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.metrics import StageTimer
+from app.models.schemas import SentimentResult
+from app.services.robinhood_service import PortfolioPositions, Position, robinhood_service
+from app.services.sentiment_aggregates import SentimentAggregator
+from app.services.summary_service import EVENT_NEWS, EVENT_PORTFOLIO, SummaryService, get_summary_service
+
+NOW = datetime.now().replace(microsecond=0)
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+class FakeRobinhood:
+    """AsyncRobinhoodService double with configurable latency"""
+
+    def __init__(self):
+        self.service = robinhood_service  # Only build_portfolio is used
+        self.positions_delay = 0.0
+        self.quotes_delay = 0.0
+        self.quotes_fail = False
+        self.last_prices: dict[str, float] = {}
+
+    async def get_positions(self):
+        await asyncio.sleep(self.positions_delay)
+        return PortfolioPositions(
+            total_equity=1000.0,
+            cash_balance=100.0,
+            positions=[Position(symbol=s, quantity=1, average_price=10.0) for s in SYMBOLS]
+        )
+
+    async def get_latest_prices(self, symbols):
+        await asyncio.sleep(self.quotes_delay)
+        if self.quotes_fail:
+            raise RuntimeError("quotes unavailable")
+        prices = {symbol: 20.0 for symbol in symbols}
+        self.last_prices.update(prices)
+        return prices
+
+
+class FakeBatcher:
+    """SentimentBatcher double: 'up' in the text is positive, anything else negative"""
+
+    def __init__(self):
+        self.service = type("Service", (), {"model_version": "test-model"})()
+        self.delay = 0.0
+        self.texts: list[str] = []
+        self.failing: set[str] = set()
+
+    async def analyze(self, text):
+        self.texts.append(text)
+        await asyncio.sleep(self.delay)
+        if any(word in text for word in self.failing):
+            raise RuntimeError("inference failed")
+        return SentimentResult(sentiment="positive" if " up" in text else "negative", confidence=0.9)
+
+
+@pytest.fixture
+def robinhood():
+    return FakeRobinhood()
+
+
+@pytest.fixture
+def batcher():
+    return FakeBatcher()
+
+
+@pytest.fixture
+def summary(robinhood, news_service, batcher, finnhub):
+    for symbol in SYMBOLS:
+        finnhub.add(symbol, f"{symbol} shares up", NOW - timedelta(hours=2))
+        finnhub.add(symbol, f"{symbol} shares down", NOW - timedelta(hours=1))
+    return SummaryService(robinhood, news_service, batcher, SentimentAggregator())
+
+
+def build(summary, deadline=None):
+    return asyncio.run(summary.build_summary(StageTimer("test"), deadline))
+
+
+async def collect(summary, deadline=None):
+    return [event async for event in summary.stream(StageTimer("test"), deadline)]
+
+
+def stream_records(summary, stream_format="ndjson"):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    app.dependency_overrides[get_summary_service] = lambda: summary
+    try:
+        response = TestClient(app).get(f"/api/summary/stream?format={stream_format}")
+    finally:
+        app.dependency_overrides.clear()
+    return response
+
+
+def test_summary_combines_portfolio_and_scored_news_in_holdings_order(summary, finnhub):
+    finnhub.delays = {"AAA": 0.05}
+
+    result = build(summary)
+
+    assert [h.symbol for h in result.portfolio.holdings] == SYMBOLS
+    assert [(n.symbol, n.sentiment) for n in result.news] == [
+        (symbol, sentiment) for symbol in SYMBOLS for sentiment in ("negative", "positive")
+    ]
+    assert not result.partial
+
+
+def test_scoring_overlaps_quotes_and_slow_news_fetches(summary, robinhood, batcher, finnhub):
+    robinhood.quotes_delay = 0.2
+    finnhub.delays = {"CCC": 0.2}
+    batcher.delay = 0.15
+
+    started = time.perf_counter()
+    build(summary)
+    elapsed = time.perf_counter() - started
+
+    # Run one after the other these stages take at least 0.55s
+    assert elapsed < 0.45
+
+
+def test_stored_sentiment_is_reused_on_the_next_run(summary, batcher):
+    build(summary)
+    scored = len(batcher.texts)
+
+    build(summary)
+
+    assert scored == 6
+    assert len(batcher.texts) == scored
+
+
+def test_stream_yields_each_symbol_as_soon_as_it_is_scored(summary, finnhub):
+    finnhub.delays = {"AAA": 0.1, "BBB": 0.05}
+
+    events = asyncio.run(collect(summary))
+
+    assert [kind for kind, _ in events].count(EVENT_PORTFOLIO) == 1
+    assert [payload[0] for kind, payload in events if kind == EVENT_NEWS] == ["CCC", "BBB", "AAA"]
+
+
+def test_ndjson_stream_sends_portfolio_first_then_news_then_completion(summary, robinhood):
+    # News is scored before quotes arrive and must be held back until the portfolio
+    robinhood.quotes_delay = 0.1
+
+    response = stream_records(summary)
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [r["type"] for r in records] == ["portfolio"] + ["news"] * 6 + ["complete"]
+    assert records[-1]["data"]["count"] == 6
+    assert not records[-1]["data"]["partial"]
+
+
+def test_sse_stream_uses_named_events(summary):
+    response = stream_records(summary, "sse")
+    events = [block for block in response.text.split("\n\n") if block]
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[0].startswith("event: portfolio\ndata: ")
+    assert events[-1].startswith("event: complete\ndata: ")
+
+
+def test_deadline_returns_what_is_ready_and_lists_skipped_symbols(summary, finnhub):
+    finnhub.delays = {"BBB": 1.0}
+
+    started = time.perf_counter()
+    result = build(summary, deadline=0.2)
+
+    assert time.perf_counter() - started < 0.5
+    assert result.partial
+    assert result.skipped_symbols == ["BBB"]
+    assert {n.symbol for n in result.news} == {"AAA", "CCC"}
+
+
+def test_quotes_past_the_deadline_fall_back_to_last_known_prices(summary, robinhood):
+    robinhood.last_prices = {"AAA": 15.0}
+    robinhood.quotes_delay = 1.0
+
+    result = build(summary, deadline=0.2)
+
+    assert [h.current_price for h in result.portfolio.holdings] == [15.0, 0.0, 0.0]
+    assert result.partial and result.skipped_symbols == []
+
+
+def test_failed_quotes_fall_back_to_last_known_prices(summary, robinhood):
+    robinhood.last_prices = {"BBB": 12.0}
+    robinhood.quotes_fail = True
+
+    result = build(summary)
+
+    assert [h.current_price for h in result.portfolio.holdings] == [0.0, 12.0, 0.0]
+
+
+def test_symbol_that_fails_to_score_is_skipped(summary, batcher):
+    batcher.failing = {"BBB"}
+
+    result = build(summary)
+
+    assert result.partial
+    assert result.skipped_symbols == ["BBB"]
+    assert {n.symbol for n in result.news} == {"AAA", "CCC"}
+
+
+def test_positions_past_the_deadline_raise_timeout(summary, robinhood):
+    robinhood.positions_delay = 1.0
+
+    with pytest.raises(asyncio.TimeoutError):
+        build(summary, deadline=0.1)